@@ -0,0 +1,32 @@
+"""
+Rebuild monthly rollups from the transactions ledger
+
+Usage:
+    python -m app.commands.rebuild_rollups [--user USER_ID]
+"""
+import argparse
+
+from bson import ObjectId
+
+from app.infra import database
+from app.infra.logging import get_logger
+from app.infra.rollup.rollup_repository import RollupRepository
+
+logger = get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild monthly rollups from transactions")
+    parser.add_argument("--user", help="only rebuild rollups of this user id")
+    args = parser.parse_args()
+
+    database.connect()
+    try:
+        written = RollupRepository().rebuild(user=ObjectId(args.user) if args.user else None)
+        logger.info("Rebuilt {count} monthly rollups", count=written)
+    finally:
+        database.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,14 +17,65 @@ class Settings(BaseSettings):
     MONGODB_USERNAME: str
     MONGODB_PASSWORD: str
     MONGODB_EXPOSE_PORT: int
+    # build missing indexes in the background and report unused / mismatched ones on startup,
+    # unique indexes are always built in the foreground at connect
+    MONGODB_RECONCILE_INDEXES: bool = True
+    # serve the read endpoints (get / list of transactions, categories, users) from async repositories on motor
+    MONGODB_ASYNC: bool = False
+    # connection pool, see pymongo MongoClient options of the same name
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    # comma separated wire compressors in order of preference, e.g. "zstd,snappy,zlib"
+    MONGODB_COMPRESSORS: str = ""
+    MONGODB_READ_PREFERENCE: str = "primary"
+    # open minPoolSize connections and ping before startup completes
+    MONGODB_WARM_UP: bool = True
+    # commands slower than this are explained and stored (0 disables), once per query shape every interval
+    SLOW_QUERY_THRESHOLD_MS: int = 100
+    SLOW_QUERY_SAMPLE_INTERVAL_SECONDS: int = 60
+    # "collection" (capped slow_queries collection) or "log"
+    SLOW_QUERY_SINK: str = "collection"
+    # Server-Timing header (auth, db, serialize, total) and per route timing logs every interval
+    REQUEST_TIMING_ENABLED: bool = True
+    REQUEST_TIMING_LOG_INTERVAL_SECONDS: int = 60
+    # text or json (one object per line), written through a bounded queue, extra messages are dropped
+    LOG_FORMAT: str = "text"
+    LOG_QUEUE_SIZE: int = 10000
+    # above ACCESS_LOG_SAMPLE_ABOVE_RPS access logs per second only this fraction is kept, errors always are
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_SAMPLE_ABOVE_RPS: int = 100
+    # Prometheus metrics on /metrics
+    METRICS_ENABLED: bool = True
+    # sampling profiler for admin requests sending X-Profile: 1 and a random fraction of all requests,
+    # off in production unless enabled explicitly
+    PROFILING_ENABLED: Optional[bool] = None
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_MS: int = 5
+    PROFILING_MAX_PROFILES: int = 100
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     JWT_TOKEN_PREFIX: str
+    # per worker cache of authenticated users, keyed by user id
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    # verified tokens kept until their exp, keyed by sha256 of the token
+    TOKEN_CACHE_SIZE: int = 10000
+    # bcrypt cost factor, stored hashes with another cost are rehashed on next login
+    BCRYPT_ROUNDS: int = 12
+    # password hashing pool, operations beyond workers + queue size wait up to the timeout then get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 5.0
 
     UPLOAD_DIR: str = "/uploads"
+    # list responses longer than this are streamed in chunks instead of built in one buffer
+    RESPONSE_STREAM_THRESHOLD: int = 1000
     # project config
     PROJECT_NAME: str = "SPENDING-WEBAPP"
     API_V1_STR: str = "/api/v1"
@@ -35,7 +86,11 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
-    GOOGLE_TOKEN_INFO: str
+    # unused since ID tokens are verified locally, still accepted so existing env files load
+    GOOGLE_TOKEN_INFO: Optional[str] = None
+    # ID tokens are verified locally with these keys, a local JWKS file replaces the url when set
+    GOOGLE_CERTS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_CERTS_FILE: Optional[str] = None
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
@@ -50,6 +105,14 @@ class Settings(BaseSettings):
 
     TRANSACTION_PREFIX: str
     TRANSACTION_PAD_ZEROS: int
+    # documents fetched per round trip when streaming exports
+    TRANSACTION_EXPORT_BATCH_SIZE: int = 1000
+    # documents per insert_many when importing statements
+    TRANSACTION_IMPORT_CHUNK_SIZE: int = 500
+
+    # per worker cache of closed month totals used by overview endpoints
+    OVERVIEW_CACHE_SIZE: int = 10000
+    OVERVIEW_CACHE_TTL_SECONDS: int = 3600
 
     ENVIRONMENT: str
     ROOT_DIR: ClassVar = Path(__file__).parent.parent.parent
@@ -0,0 +1,45 @@
+from datetime import date
+from typing import Optional
+from app.domain.shared.entity import BaseEntity
+from app.domain.shared.enum import Type
+from app.domain.transaction.entity import TransactionCategory
+
+
+class AmountByCategory(BaseEntity):
+    category: Optional[TransactionCategory] = None
+    amount: float = 0
+    count: int = 0
+
+
+class AmountByType(BaseEntity):
+    type: Type
+    amount: float = 0
+    count: int = 0
+
+
+class PeriodTotals(BaseEntity):
+    spend: float = 0
+    income: float = 0
+    save: float = 0
+
+
+class PeriodPercentage(BaseEntity):
+    """
+    Totals of a period compared with the previous one.
+    Ratios are percentages of income, changes are percentages of the previous period value.
+    """
+
+    date_from: date
+    date_to: date
+    current: PeriodTotals
+    previous: PeriodTotals
+    spend_ratio: Optional[float] = None
+    save_ratio: Optional[float] = None
+    spend_change: Optional[float] = None
+    income_change: Optional[float] = None
+    save_change: Optional[float] = None
+
+
+class SeriesPoint(BaseEntity):
+    date: date
+    amount: float = 0
@@ -56,6 +56,11 @@ class Pagination(BaseModel):
     total_pages: Optional[int] = None
 
 
+class CursorPagination(BaseModel):
+    limit: int
+    next_cursor: Optional[str] = None
+
+
 class SearchRequest(BaseModel):
     start_date: Optional[date] = Field(
         Query(
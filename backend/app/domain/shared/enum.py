@@ -30,6 +30,22 @@ class Period(str, ExtendedEnum):
     YEAR = "year"
 
 
+class ExportFormat(str, ExtendedEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class StatementFormat(str, ExtendedEnum):
+    CSV = "csv"
+    OFX = "ofx"
+
+
+class BatchOperation(str, ExtendedEnum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
 class AuthGrantType(str, ExtendedEnum):
     RESET_PASSWORD = "reset_password"
     ACCESS_TOKEN = "access_token"
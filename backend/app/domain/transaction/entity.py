@@ -1,10 +1,11 @@
 from datetime import datetime, date as Date
 from typing import Optional, List, Union
 from pydantic import ConfigDict
-from app.domain.shared.entity import BaseEntity, IDModelMixin, DateTimeModelMixin, Pagination
+from app.domain.shared.entity import BaseEntity, IDModelMixin, DateTimeModelMixin, Pagination, CursorPagination
+from app.domain.shared.field import PydanticObjectId
 from app.domain.user.field import PydanticUserType
 from app.domain.category.field import PydanticCategoryType
-from app.domain.shared.enum import Type
+from app.domain.shared.enum import Type, BatchOperation
 
 
 class TransactionBase(BaseEntity):
@@ -38,9 +39,58 @@ class TransactionInUpdate(BaseEntity):
     category_id: Optional[str] = None
 
 
+class TransactionCategory(BaseEntity):
+    """
+    Category embedded in transaction responses
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+    id: PydanticObjectId
+    name: Optional[str] = None
+    type: Optional[Type] = None
+
+
 class Transaction(TransactionBase):
     """
     Transaction domain entity
     """
 
     id: str
+    category: Optional[TransactionCategory] = None
+
+
+class TransactionImportError(BaseEntity):
+    row: int
+    message: str
+
+
+class TransactionImportResult(BaseEntity):
+    inserted: int = 0
+    errors: List[TransactionImportError] = []
+
+
+class TransactionInBatch(BaseEntity):
+    date: Optional[Union[datetime, Date]] = None
+    amount: Optional[float] = None
+    note: Optional[str] = None
+    type: Optional[Type] = None
+    category_id: Optional[str] = None
+
+
+class TransactionBatchOperation(BaseEntity):
+    op: BatchOperation
+    id: Optional[str] = None
+    data: Optional[TransactionInBatch] = None
+
+
+class TransactionBatchResult(BaseEntity):
+    index: int
+    op: BatchOperation
+    id: Optional[str] = None
+    success: bool
+    message: Optional[str] = None
+
+
+class ManyTransactionsInResponse(BaseEntity):
+    pagination: Optional[CursorPagination] = None
+    data: Optional[List[Transaction]] = None
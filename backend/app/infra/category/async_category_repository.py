@@ -0,0 +1,53 @@
+"""Async category repository module, read paths on the async mongo client"""
+from typing import Optional, Dict, Union, List
+from bson import ObjectId
+
+from app.infra.database.async_client import get_collection
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.rows import CategoryRow
+from app.infra.category.category_repository import list_pipeline
+from app.domain.shared.enum import Type
+
+
+class AsyncCategoryRepository:
+    def __init__(self):
+        pass
+
+    async def get_by_id(self, id: Union[str, ObjectId]) -> Optional[CategoryRow]:
+        """
+        Get category in db from id
+        :param id:
+        :return:
+        """
+        if not ObjectId.is_valid(id):
+            return None
+        doc = await get_collection(CategoryModel).find_one({"_id": ObjectId(id)})
+        return CategoryRow.from_mongo(doc) if doc else None
+
+    async def count(self, conditions: Dict[str, Union[str, bool, ObjectId]] = {}) -> int:
+        try:
+            return await get_collection(CategoryModel).count_documents(conditions)
+        except Exception:
+            return 0
+
+    async def list(
+        self,
+        user: ObjectId,
+        type: Optional[Type] = None,
+        name: Optional[str] = None,
+        note: Optional[str] = None,
+        sort: Optional[Dict[str, int]] = None,
+    ) -> List[CategoryRow]:
+        try:
+            pipeline = list_pipeline(user=user, type=type, name=name, note=note, sort=sort)
+            return [CategoryRow.from_mongo(doc) async for doc in get_collection(CategoryModel).aggregate(pipeline)]
+        except Exception:
+            return []
+
+
+async_category_repository = AsyncCategoryRepository()
+
+
+async def get_async_category_repository() -> AsyncCategoryRepository:
+    """Dependency provider, a coroutine so FastAPI resolves it on the event loop rather than in the threadpool"""
+    return async_category_repository
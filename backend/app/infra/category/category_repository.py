@@ -5,10 +5,50 @@ from bson import ObjectId
 
 from app.domain.user.entity import User
 from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.rows import CategoryRow
 from app.domain.category.entity import CategoryInDB, CategoryInCreate, CategoryInUpdate
 from app.domain.shared.enum import UserRole, Type
 
 
+def list_pipeline(
+    user: ObjectId,
+    type: Optional[Type] = None,
+    name: Optional[str] = None,
+    note: Optional[str] = None,
+    sort: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build the list aggregation, shared with the async repository
+    :return: pipeline
+    """
+    match_pipelines = {"user": user}
+
+    if type:
+        match_pipelines = {
+            **match_pipelines,
+            "type": type.value,
+        }
+
+    if note:
+        note = note.lower()
+        match_pipelines = {
+            **match_pipelines,
+            "note": {"$regex": ".*" + note + ".*"},
+        }
+
+    if name:
+        name = name.lower()
+        match_pipelines = {
+            **match_pipelines,
+            "name": {"$regex": ".*" + name + ".*"},
+        }
+
+    return [
+        {"$match": match_pipelines},
+        sort if sort else {"$sort": {"_id": -1}},
+    ]
+
+
 class CategoryRepository:
     def __init__(self):
         pass
@@ -78,35 +118,10 @@ class CategoryRepository:
         name: Optional[str] = None,
         note: Optional[str] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[CategoryModel]:
+    ) -> List[CategoryRow]:
         try:
-            match_pipelines = {"user": user}
-
-            if type:
-                match_pipelines = {
-                    **match_pipelines,
-                    "type": type.value,
-                }
-
-            if note:
-                note = note.lower()
-                match_pipelines = {
-                    **match_pipelines,
-                    "note": {"$regex": ".*" + note + ".*"},
-                }
-
-            if name:
-                name = name.lower()
-                match_pipelines = {
-                    **match_pipelines,
-                    "name": {"$regex": ".*" + name + ".*"},
-                }
-
-            pipeline = [
-                {"$match": match_pipelines},
-                sort if sort else {"$sort": {"_id": -1}},
-            ]
+            pipeline = list_pipeline(user=user, type=type, name=name, note=note, sort=sort)
             docs = CategoryModel.objects().aggregate(pipeline)
-            return [CategoryModel.from_mongo(doc) for doc in docs]
+            return [CategoryRow.from_mongo(doc) for doc in docs]
         except Exception:
             return []
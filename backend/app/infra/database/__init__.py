@@ -2,6 +2,24 @@
 
 from mongoengine import connect as mongo_engine_connect, disconnect_all
 from app.config import settings
+from app.infra.database import async_client
+from app.infra.database.indexes import ensure_unique_indexes, reconcile_indexes_in_background
+from app.infra.database.pool import pool_options, pool_stats, warm_up
+from app.infra.database.commands import command_timer
+from app.infra.database.slow_queries import SlowQueryRecorder
+
+slow_query_recorder = SlowQueryRecorder(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    sample_interval=settings.SLOW_QUERY_SAMPLE_INTERVAL_SECONDS,
+    sink=settings.SLOW_QUERY_SINK,
+)
+
+
+def event_listeners() -> list:
+    listeners = [pool_stats, command_timer]
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        listeners.append(slow_query_recorder)
+    return listeners
 
 
 def connect() -> None:
@@ -9,10 +27,20 @@ def connect() -> None:
     Start database connection
     :return: None
     """
+    if settings.MONGODB_ASYNC:
+        async_client.connect(event_listeners=event_listeners())
     if settings.ENVIRONMENT == "testing":
-        return mongo_engine_connect(settings.MONGODB_DATABASE, host=settings.MONGODB_HOST, port=settings.MONGODB_PORT)
+        client = mongo_engine_connect(
+            settings.MONGODB_DATABASE,
+            host=settings.MONGODB_HOST,
+            port=settings.MONGODB_PORT,
+            event_listeners=event_listeners(),
+            **pool_options(),
+        )
+        ensure_unique_indexes()
+        return client
     else:
-        return mongo_engine_connect(
+        client = mongo_engine_connect(
             settings.MONGODB_DATABASE,
             host=settings.MONGODB_HOST,
             port=settings.MONGODB_PORT,
@@ -20,7 +48,15 @@ def connect() -> None:
             password=settings.MONGODB_PASSWORD,
             authentication_source=settings.MONGODB_DATABASE,
             alias="default",
+            event_listeners=event_listeners(),
+            **pool_options(),
         )
+        if settings.MONGODB_WARM_UP:
+            warm_up(client, settings.MONGODB_MIN_POOL_SIZE)
+        ensure_unique_indexes()
+        if settings.MONGODB_RECONCILE_INDEXES:
+            reconcile_indexes_in_background()
+        return client
 
 
 def disconnect() -> None:
@@ -29,3 +65,4 @@ def disconnect() -> None:
     :return:
     """
     disconnect_all()
+    async_client.disconnect()
@@ -0,0 +1,64 @@
+"""Async mongo client (motor) used by the async repositories"""
+from typing import Optional, Type
+
+from mongoengine import Document
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from app.config import settings
+from app.infra.database.pool import pool_options
+
+_client: Optional[AsyncIOMotorClient] = None
+
+
+def connect(
+    client: Optional[AsyncIOMotorClient] = None, event_listeners: Optional[list] = None
+) -> AsyncIOMotorClient:
+    """
+    Create the async client, the event loop is bound lazily on first use
+    :param client: existing client to use instead, e.g. an in-memory one in tests
+    :param event_listeners: pymongo monitoring listeners, the same ones as the mongoengine client
+    :return: client
+    """
+    global _client
+    if client is not None:
+        _client = client
+    elif settings.ENVIRONMENT == "testing":
+        _client = AsyncIOMotorClient(
+            host=settings.MONGODB_HOST,
+            port=settings.MONGODB_PORT,
+            event_listeners=event_listeners or [],
+            **pool_options(),
+        )
+    else:
+        _client = AsyncIOMotorClient(
+            host=settings.MONGODB_HOST,
+            port=settings.MONGODB_PORT,
+            username=settings.MONGODB_USERNAME,
+            password=settings.MONGODB_PASSWORD,
+            authSource=settings.MONGODB_DATABASE,
+            event_listeners=event_listeners or [],
+            **pool_options(),
+        )
+    return _client
+
+
+def get_database() -> AsyncIOMotorDatabase:
+    if _client is None:
+        raise RuntimeError("Async mongo client is not connected")
+    return _client[settings.MONGODB_DATABASE]
+
+
+def get_collection(model: Type[Document]) -> AsyncIOMotorCollection:
+    """
+    Collection of a mongoengine model on the async client
+    :param model:
+    :return:
+    """
+    return get_database()[model._get_collection_name()]
+
+
+def disconnect() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
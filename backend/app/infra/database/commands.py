@@ -0,0 +1,29 @@
+"""Mongo command listener attributing command count and duration to the current request"""
+from pymongo import monitoring
+
+from app.shared.timing import request_timing
+
+
+class CommandTimer(monitoring.CommandListener):
+    """
+    Events fire in the thread running the command, which carries the request context:
+    sync endpoints run in the threadpool with a copy of it, and motor runs the commands
+    of the async client on its executor inside a copy of the caller's context.
+    """
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event)
+
+    def failed(self, event):
+        self._record(event)
+
+    def _record(self, event):
+        timing = request_timing.get()
+        if timing is not None:
+            timing.add_command(event.duration_micros / 1000)
+
+
+command_timer = CommandTimer()
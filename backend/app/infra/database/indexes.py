@@ -0,0 +1,153 @@
+"""Index reconciliation between declared model indexes and the database"""
+import threading
+from typing import Dict, List, Optional, Tuple, Type
+
+from mongoengine import Document
+
+from app.infra.database.models.user import User
+from app.infra.database.models.category import Category
+from app.infra.database.models.transaction import Transaction
+from app.infra.database.models.monthly_rollup import MonthlyRollup
+from app.infra.logging import get_logger
+
+logger = get_logger()
+
+MODELS: Tuple[Type[Document], ...] = (User, Category, Transaction, MonthlyRollup)
+
+IndexKey = Tuple[Tuple[str, int], ...]
+
+
+class IndexReport:
+    """
+    Result of an index reconciliation for one collection
+
+    Attributes:
+        collection (str): collection name
+        created (List[str]): indexes built because they were declared but missing
+        mismatched (List[str]): indexes on the declared keys whose unique / sparse / partial filter differ
+        undeclared (List[str]): indexes in the database that no model declares
+        unused (List[str]): indexes never used since the server started, not counting the ones just created
+    """
+
+    def __init__(self, collection: str):
+        self.collection = collection
+        self.created: List[str] = []
+        self.mismatched: List[str] = []
+        self.undeclared: List[str] = []
+        self.unused: List[str] = []
+
+    def __repr__(self):
+        return "IndexReport(collection={}, created={}, mismatched={}, undeclared={}, unused={})".format(
+            self.collection, self.created, self.mismatched, self.undeclared, self.unused
+        )
+
+
+def _declared_indexes(model: Type[Document]) -> Dict[IndexKey, dict]:
+    specs = {}
+    for spec in model._meta.get("index_specs", []):
+        opts = {k: v for k, v in spec.items() if k != "fields"}
+        specs[tuple((field, direction) for field, direction in spec["fields"])] = opts
+    return specs
+
+
+def _options(spec: dict) -> Tuple[bool, bool, Optional[dict]]:
+    """Options that change what an index enforces or covers, from a declared spec or index_information()"""
+    return bool(spec.get("unique")), bool(spec.get("sparse")), spec.get("partialFilterExpression")
+
+
+def _index_usage(collection) -> Dict[str, int]:
+    """Return number of operations per index name, empty if $indexStats is not supported"""
+    try:
+        return {stat["name"]: stat["accesses"]["ops"] for stat in collection.aggregate([{"$indexStats": {}}])}
+    except Exception:
+        return {}
+
+
+def reconcile_model(model: Type[Document]) -> IndexReport:
+    """
+    Build missing declared indexes of a model and report the others
+    :param model:
+    :return: IndexReport
+    """
+    # raw collection, _get_collection() would run mongoengine's foreground ensure_indexes
+    collection = model._get_db()[model._get_collection_name()]
+    report = IndexReport(collection.name)
+
+    existing: Dict[IndexKey, Tuple[str, dict]] = {
+        tuple((field, int(direction)) for field, direction in info["key"]): (name, info)
+        for name, info in collection.index_information().items()
+    }
+    declared = _declared_indexes(model)
+
+    for keys, opts in declared.items():
+        if keys not in existing:
+            report.created.append(collection.create_index(list(keys), background=True, **opts))
+            continue
+        name, info = existing[keys]
+        # not rebuilt here, changing e.g. a non-unique index to unique may fail on existing duplicates
+        if _options(opts) != _options(info):
+            report.mismatched.append(name)
+
+    for keys, (name, _) in existing.items():
+        if name != "_id_" and keys not in declared:
+            report.undeclared.append(name)
+
+    for name, ops in _index_usage(collection).items():
+        if name != "_id_" and ops == 0 and name not in report.created:
+            report.unused.append(name)
+
+    return report
+
+
+def reconcile_indexes(models: Tuple[Type[Document], ...] = MODELS) -> List[IndexReport]:
+    """
+    Reconcile indexes of all models and log what was found
+    :param models:
+    :return: list of IndexReport
+    """
+    reports = []
+    for model in models:
+        try:
+            report = reconcile_model(model)
+        except Exception as exc:
+            logger.exception("Index reconciliation failed for {model}: {error}", model=model.__name__, error=exc)
+            continue
+
+        if report.created:
+            logger.info("Created indexes on {collection}: {names}", collection=report.collection, names=report.created)
+        if report.mismatched:
+            logger.warning(
+                "Indexes on {collection} differ from their declaration (unique / sparse / partial filter), "
+                "rebuild them: {names}",
+                collection=report.collection,
+                names=report.mismatched,
+            )
+        if report.undeclared:
+            logger.warning(
+                "Undeclared indexes on {collection}: {names}", collection=report.collection, names=report.undeclared
+            )
+        if report.unused:
+            logger.warning("Unused indexes on {collection}: {names}", collection=report.collection, names=report.unused)
+        reports.append(report)
+    return reports
+
+
+def ensure_unique_indexes(models: Tuple[Type[Document], ...] = MODELS) -> None:
+    """
+    Build the declared unique indexes in the foreground, startup waits for them so uniqueness
+    is enforced before the first request
+    :param models:
+    :return:
+    """
+    for model in models:
+        model.ensure_indexes()
+
+
+def reconcile_indexes_in_background() -> threading.Thread:
+    """
+    Run reconcile_indexes in a daemon thread so startup does not wait for index builds
+    :return: the started thread
+    """
+    thread = threading.Thread(target=reconcile_indexes, name="index-reconciler", daemon=True)
+    thread.start()
+    return thread
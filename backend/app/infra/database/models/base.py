@@ -0,0 +1,17 @@
+"""Shared behaviour of the mongoengine models"""
+
+
+class UniqueIndexesFirst:
+    """
+    Build only the unique indexes when the collection is first accessed, in the foreground, so uniqueness
+    holds from the first write. The other declared indexes are built in the background by
+    app.infra.database.indexes.
+    """
+
+    @classmethod
+    def ensure_indexes(cls):
+        collection = cls._get_collection()
+        for spec in cls._meta["index_specs"]:
+            if spec.get("unique"):
+                spec = spec.copy()
+                collection.create_index(spec.pop("fields"), **spec)
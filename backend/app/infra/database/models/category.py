@@ -1,8 +1,9 @@
 import datetime
 from mongoengine import Document, StringField, DateTimeField, FloatField, ReferenceField, IntField
+from app.infra.database.models.base import UniqueIndexesFirst
 
 
-class Category(Document):
+class Category(UniqueIndexesFirst, Document):
     name = StringField(required=True, unique=True)
     type = StringField()
     note = StringField()
@@ -29,7 +30,10 @@ class Category(Document):
 
     meta = {
         "collection": "Categories",
-        "indexes": ["name"],
+        "indexes": [
+            "name",
+            {"fields": ["user", "type", "-id"]},
+        ],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -0,0 +1,26 @@
+from mongoengine import Document, StringField, FloatField, ReferenceField, IntField
+from app.infra.database.models.base import UniqueIndexesFirst
+
+
+class MonthlyRollup(UniqueIndexesFirst, Document):
+    """
+    Sum and count of transactions per user, month, category and type.
+    Maintained with $inc on every transaction write, rebuilt from the ledger by app.commands.rebuild_rollups.
+    """
+
+    user = ReferenceField("User", required=True)
+    year = IntField(required=True)
+    month = IntField(required=True)
+    category = ReferenceField("Category", required=True)
+    type = StringField(required=True)
+    amount = FloatField(default=0)
+    count = IntField(default=0)
+
+    meta = {
+        "collection": "MonthlyRollups",
+        "indexes": [
+            {"fields": ["user", "year", "month", "category", "type"], "unique": True},
+        ],
+        "allow_inheritance": True,
+        "index_cls": False,
+    }
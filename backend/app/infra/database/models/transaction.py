@@ -1,8 +1,9 @@
 import datetime
 from mongoengine import Document, StringField, DateTimeField, FloatField, ReferenceField, IntField
+from app.infra.database.models.base import UniqueIndexesFirst
 
 
-class Transaction(Document):
+class Transaction(UniqueIndexesFirst, Document):
     date = DateTimeField(required=True)
     amount = FloatField(required=True)
     note = StringField(required=False)
@@ -32,7 +33,13 @@ class Transaction(Document):
 
     meta = {
         "collection": "Transactions",
-        "indexes": ["date"],
+        "indexes": [
+            "date",
+            # per-user listing and keyset pagination ordered by (date, _id)
+            {"fields": ["user", "-date", "-id"]},
+            {"fields": ["user", "category", "-date"]},
+            {"fields": ["user", "type", "-date"]},
+        ],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -1,8 +1,9 @@
 import datetime
 from mongoengine import Document, StringField, EmailField, DateTimeField, BooleanField
+from app.infra.database.models.base import UniqueIndexesFirst
 
 
-class User(Document):
+class User(UniqueIndexesFirst, Document):
     email = EmailField(required=True, unique=True)
     role = StringField(required=True)
     first_name = StringField(required=False)
@@ -33,7 +34,10 @@ class User(Document):
 
     meta = {
         "collection": "Users",
-        "indexes": ["email", "role"],
+        "indexes": [
+            "email",
+            {"fields": ["role", "-id"]},
+        ],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -0,0 +1,119 @@
+"""Mongo connection pool options, warm-up and statistics"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from pymongo import MongoClient, monitoring
+
+from app.config import settings
+from app.infra.logging import get_logger
+
+logger = get_logger()
+
+
+def pool_options() -> Dict[str, Any]:
+    """
+    Client options from Settings, shared by the mongoengine and the async client
+    :return: keyword arguments for MongoClient / AsyncIOMotorClient
+    """
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": settings.MONGODB_READ_PREFERENCE,
+    }
+    if settings.MONGODB_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+    if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGODB_COMPRESSORS:
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    return options
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """
+    Connection pool counters, summed over all servers of the mongoengine client and,
+    with MONGODB_ASYNC, of the async client
+
+    Attributes:
+        open (int): connections currently open
+        checked_out (int): connections in use by an operation
+        waiting (int): operations waiting for a connection
+        checkout_failed (int): checkouts that failed (e.g. wait queue timeout) since start
+    """
+
+    def __init__(self):
+        self.open = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.checkout_failed = 0
+        self._lock = threading.Lock()
+
+    def _add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def connection_created(self, event):
+        self._add(open=1)
+
+    def connection_closed(self, event):
+        self._add(open=-1)
+
+    def connection_check_out_started(self, event):
+        self._add(waiting=1)
+
+    def connection_checked_out(self, event):
+        self._add(waiting=-1, checked_out=1)
+
+    def connection_check_out_failed(self, event):
+        self._add(waiting=-1, checkout_failed=1)
+
+    def connection_checked_in(self, event):
+        self._add(checked_out=-1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "open": self.open,
+                "checked_out": self.checked_out,
+                "idle": self.open - self.checked_out,
+                "waiting": self.waiting,
+                "checkout_failed": self.checkout_failed,
+                # per server, one pool per client
+                "max_pool_size": settings.MONGODB_MAX_POOL_SIZE * (2 if settings.MONGODB_ASYNC else 1),
+            }
+
+
+pool_stats = PoolStats()
+
+
+def warm_up(client: MongoClient, connections: int) -> None:
+    """
+    Ping the server, then open up to `connections` pool connections with concurrent pings
+    so the first requests after startup do not pay connection setup
+    :param client:
+    :param connections: usually minPoolSize
+    :return:
+    """
+    client.admin.command("ping")
+    if connections > 1:
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="mongo-warm-up") as executor:
+            list(executor.map(lambda _: client.admin.command("ping"), range(connections)))
+    logger.info("Mongo pool warmed up: {stats}", stats=pool_stats.snapshot())
@@ -0,0 +1,47 @@
+"""Read-only records for list queries, built straight from raw mongo documents"""
+from typing import Any, Dict
+
+
+class Row:
+    """
+    Base read-only record
+
+    Subclasses declare their fields in __slots__, "id" is filled from "_id".
+    References (user, category) are kept as raw ObjectId, nothing is dereferenced.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_mongo(cls, data: dict) -> "Row":
+        if not data:
+            return data
+        row = object.__new__(cls)
+        for field in cls.__slots__:
+            object.__setattr__(row, field, data.get("_id" if field == "id" else field))
+        return row
+
+    def __setattr__(self, key, value):
+        raise AttributeError("{} is read-only".format(self.__class__.__name__))
+
+    def to_dict(self, id_str: bool = True) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in self.__slots__}
+        if id_str:
+            data["id"] = str(data["id"])
+        return data
+
+    def __repr__(self):
+        return "{}(id={})".format(self.__class__.__name__, self.id)
+
+
+class TransactionRow(Row):
+    __slots__ = ("id", "date", "amount", "note", "type", "category", "user", "created_at", "updated_at")
+
+
+class CategoryRow(Row):
+    __slots__ = ("id", "name", "type", "note", "user", "created_at", "updated_at")
+
+
+class UserRow(Row):
+    # hashed_password is deliberately left out of read paths
+    __slots__ = ("id", "email", "role", "first_name", "last_name", "avatar", "phone", "status", "created_at", "updated_at")
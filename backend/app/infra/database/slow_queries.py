@@ -0,0 +1,254 @@
+"""Slow operation recorder: commands over a threshold are explained and stored, rate limited per query shape"""
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mongoengine.connection import get_connection
+from pymongo import monitoring
+
+from app.infra.logging import get_logger
+
+logger = get_logger()
+
+COLLECTION = "slow_queries"
+COLLECTION_SIZE = 16 * 1024 * 1024
+
+# command name: fields holding the query, used for the shape
+EXPLAINABLE = {
+    "find": ("filter", "sort", "projection"),
+    "aggregate": ("pipeline",),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+    "findAndModify": ("query", "sort"),
+    "update": ("updates",),
+    "delete": ("deletes",),
+}
+
+# session / cluster fields the explain command must not carry
+_DROPPED_FIELDS = {"lsid", "txnNumber", "$clusterTime", "$db", "$readPreference", "readConcern", "writeConcern"}
+
+# commands run by the recorder itself are not recorded
+_own = threading.local()
+
+
+# values of these keys are sort directions / projections, part of the shape
+_STRUCTURAL = {"sort", "projection", "$sort", "$project"}
+
+
+def normalize(value: Any, structural: bool = False) -> Any:
+    """
+    Query with literals replaced by "?", so queries differing only by values share a shape.
+    Operator lists ($in, $nin, $all) collapse to one element.
+    """
+    if isinstance(value, dict):
+        return {
+            key: ["?"]
+            if key in ("$in", "$nin", "$all") and isinstance(item, list)
+            else normalize(item, structural or key in _STRUCTURAL)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize(item, structural) for item in value]
+    # field paths ("$amount") stay, they are part of the shape
+    if structural or isinstance(value, str) and value.startswith("$"):
+        return value
+    return "?"
+
+
+def query_shape(command_name: str, command: Dict[str, Any]) -> str:
+    shape = {"op": command_name, "collection": command.get(command_name)}
+    for field in EXPLAINABLE[command_name]:
+        if field in command:
+            value = command[field]
+            if field in ("updates", "deletes"):
+                value = [item.get("q") for item in value]
+            shape[field] = normalize(value, field in _STRUCTURAL)
+    return json.dumps(shape, sort_keys=True, default=str)
+
+
+def _find_key(document: Any, key: str) -> Optional[Any]:
+    # explain output nests the plan differently per command and server version
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        values = document.values()
+    elif isinstance(document, list):
+        values = document
+    else:
+        return None
+    for value in values:
+        found = _find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
+
+def _stages(plan: Optional[Dict[str, Any]]) -> List[str]:
+    stages = []
+    while isinstance(plan, dict):
+        stages.append(str(plan.get("stage")) + (":" + plan["indexName"] if "indexName" in plan else ""))
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0]
+    return stages
+
+
+def summarize_explain(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Docs / keys examined versus returned and the winning plan stages of an executionStats explain"""
+    stats = _find_key(explain, "executionStats") or {}
+    return {
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "returned": stats.get("nReturned"),
+        "plan": _stages(_find_key(explain, "winningPlan")),
+    }
+
+
+class SlowQueryRecorder(monitoring.CommandListener):
+    """
+    Command listener keeping commands slower than threshold_ms.
+
+    The listener only copies the command and queues it, explain runs in a background thread
+    (it executes the query again, hence at most one capture per shape every sample_interval seconds).
+    Entries go to a capped collection, or to the log and an in-memory buffer.
+
+    In-flight commands are kept by reference (no copy) until their duration is known. Events lost to
+    a dropped connection never arrive, so at most max_in_flight are kept, the oldest evicted first.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        sample_interval: float = 60,
+        sink: str = "collection",
+        client: Callable[[], Any] = get_connection,
+        buffer_size: int = 200,
+        max_in_flight: int = 1000,
+    ):
+        self.threshold_ms = threshold_ms
+        self.sample_interval = sample_interval
+        self.sink = sink
+        self.client = client
+        self.recent: "deque[Dict[str, Any]]" = deque(maxlen=buffer_size)
+        self.max_in_flight = max_in_flight
+        self._started: "OrderedDict[Tuple[Any, int], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._last_capture: Dict[str, float] = {}
+        self._queue: "queue.Queue" = queue.Queue(maxsize=100)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def started(self, event):
+        if event.command_name not in EXPLAINABLE or getattr(_own, "active", False):
+            return
+        if event.command.get(event.command_name) == COLLECTION:
+            return
+        with self._lock:
+            self._started[(event.connection_id, event.request_id)] = (event.database_name, event.command)
+            while len(self._started) > self.max_in_flight:
+                self._started.popitem(last=False)
+
+    def succeeded(self, event):
+        self._finished(event)
+
+    def failed(self, event):
+        self._finished(event)
+
+    def _finished(self, event):
+        with self._lock:
+            started = self._started.pop((event.connection_id, event.request_id), None)
+        if started is None:
+            return
+        duration_ms = event.duration_micros / 1000
+        if duration_ms < self.threshold_ms:
+            return
+        database, command = started
+        shape = query_shape(event.command_name, command)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_capture.get(shape, -self.sample_interval) < self.sample_interval:
+                return
+            self._last_capture[shape] = now
+        try:
+            self._queue.put_nowait((database, event.command_name, command, shape, duration_ms))
+        except queue.Full:
+            return
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._work, name="slow-query-recorder", daemon=True)
+                    self._thread.start()
+
+    def _work(self) -> None:
+        _own.active = True
+        while True:
+            item = self._queue.get()
+            try:
+                self.record(*item)
+            except Exception as exc:
+                logger.warning("Slow query capture failed: {error}", error=exc)
+            finally:
+                self._queue.task_done()
+
+    def record(self, database: str, command_name: str, command: Dict[str, Any], shape: str, duration_ms: float):
+        """
+        Explain the command and store the entry
+        :return: entry
+        """
+        entry = {
+            "ts": datetime.now(timezone.utc),
+            "op": command_name,
+            "ns": "{}.{}".format(database, command.get(command_name)),
+            "shape": shape,
+            "duration_ms": round(duration_ms, 1),
+        }
+        explain_command = {key: value for key, value in command.items() if key not in _DROPPED_FIELDS}
+        try:
+            explain = self.client()[database].command({"explain": explain_command, "verbosity": "executionStats"})
+            entry.update(summarize_explain(explain))
+        except Exception as exc:
+            entry["explain_error"] = str(exc)
+
+        self.recent.append(entry)
+        if self.sink == "collection":
+            self._collection(database).insert_one(dict(entry))
+        else:
+            logger.warning("Slow query {ns} {duration_ms} ms {shape}", payload=entry, **entry)
+        return entry
+
+    def _collection(self, database: str):
+        db = self.client()[database]
+        if COLLECTION not in db.list_collection_names(filter={"name": COLLECTION}):
+            try:
+                db.create_collection(COLLECTION, capped=True, size=COLLECTION_SIZE)
+            except Exception:
+                # created meanwhile by another worker
+                pass
+        return db[COLLECTION]
+
+    def flush(self) -> None:
+        """Wait until queued captures are recorded"""
+        self._queue.join()
+
+    def list(self, database: str, limit: int = 50, collection: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Latest entries, newest first
+        :param database:
+        :param limit:
+        :param collection: only queries on this collection
+        :return:
+        """
+        if self.sink == "collection":
+            query = {"ns": "{}.{}".format(database, collection)} if collection else {}
+            cursor = self._collection(database).find(query, {"_id": 0}).sort("$natural", -1).limit(limit)
+            return list(cursor)
+        entries = [
+            entry
+            for entry in reversed(self.recent)
+            if not collection or entry["ns"] == "{}.{}".format(database, collection)
+        ]
+        return entries[:limit]
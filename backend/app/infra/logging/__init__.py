@@ -1,10 +1,28 @@
 import logging
 import sys
+import threading
 from pprint import pformat
 import json
+from typing import Optional
 from loguru import logger
 from loguru._defaults import LOGURU_FORMAT
 from app.config import settings
+from app.infra.logging.pipeline import AccessLogSampler, BoundedQueueSink, json_line, payload_text
+
+# stdlib record being forwarded by InterceptHandler, read by the patcher
+_forwarded = threading.local()
+
+
+def _from_stdlib(record: dict) -> None:
+    # report the stdlib caller instead of InterceptHandler.emit, without walking frames
+    source: logging.LogRecord = _forwarded.record
+    record["name"] = source.name
+    record["function"] = source.funcName
+    record["line"] = source.lineno
+    record["module"] = source.module
+
+
+_stdlib_logger = logger.patch(_from_stdlib)
 
 
 class InterceptHandler(logging.Handler):
@@ -18,40 +36,38 @@ class InterceptHandler(logging.Handler):
     }
 
     """
-    Default handler from examples in loguru documentaion.
+    Forward stdlib records to loguru.
     See https://loguru.readthedocs.io/en/stable/overview.html#entirely-compatible-with-standard-logging
     """
 
     def emit(self, record):
-        # Get corresponding Loguru level if it exists
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = self.loglevel_mapping[record.levelno]
-
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-
-        log = logger.bind(request_id="app")
-        log.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        level = self.loglevel_mapping.get(record.levelno, record.levelno)
+        _forwarded.record = record
+        log = _stdlib_logger.opt(exception=record.exc_info) if record.exc_info else _stdlib_logger
+        log.log(level, record.getMessage())
 
 
 class CustomizeLogger:
+    # set once sinks are configured, modules calling get_logger() at import share it
+    configured = None
+    queue_sink: Optional[BoundedQueueSink] = None
+    access_sampler: Optional[AccessLogSampler] = None
+
     @classmethod
     def make_logger(cls):
+        if cls.configured is not None:
+            return cls.configured
+
         config = cls.load_logging_config()
         logging_config = config.get("logger")
 
-        logger = cls.customize_logging(
+        cls.configured = cls.customize_logging(
             level=logging_config.get("level") if settings.ENVIRONMENT != "testing" else "debug",
             retention=logging_config.get("retention"),
             rotation=logging_config.get("rotation"),
             format=logging_config.get("format"),
         )
-        return logger
+        return cls.configured
 
     @classmethod
     def format_record(cls, record: dict) -> str:
@@ -59,6 +75,7 @@ class CustomizeLogger:
         Custom format for loguru loggers.
         Uses pformat for log any data like request/response body during debug.
         Works with logging if loguru handler it.
+        The payload may be a callable, it is only called for records that get written.
 
         Example:
         >>> payload = [{"users":[{"name": "Nick", "age": 87, "is_active": True},
@@ -70,43 +87,68 @@ class CustomizeLogger:
         """
         format_string = LOGURU_FORMAT
 
-        if record["extra"].get("payload") is not None:
-            record["extra"]["payload"] = pformat(record["extra"]["payload"], indent=4, compact=True, width=88)
-            format_string += "\n<level>{extra[payload]}</level>"
+        if payload_text(record, lambda value: pformat(value, indent=4, compact=True, width=88)) is not None:
+            format_string += "\n<level>{extra[_payload]}</level>"
 
         format_string += "{exception}\n"
         return format_string
 
+    @classmethod
+    def format_json(cls, record: dict) -> str:
+        """One json object per line, for log shippers"""
+        record["extra"]["_line"] = json_line(record)
+        return "{extra[_line]}\n"
+
     @classmethod
     def customize_logging(cls, level: str, rotation: str, retention: str, format: str):
         logger.remove()
+        logger.configure(extra={"request_id": None, "method": None})
+
+        # records are formatted by the caller then queued, the writer thread replays them
+        # raw into the real sinks below, which only accept replayed records
+        def replayed(record):
+            return "_replayed" in record["extra"]
+
+        writer = logger.bind(_replayed=True).opt(raw=True)
+        cls.queue_sink = BoundedQueueSink(
+            lambda message: writer.log(message.record["level"].name, message),
+            maxsize=settings.LOG_QUEUE_SIZE,
+        )
         logger.add(
-            sys.stdout,
-            enqueue=True,
+            cls.queue_sink,
             backtrace=True,
             level=level.upper(),
-            format=cls.format_record,
+            format=cls.format_json if settings.LOG_FORMAT == "json" else cls.format_record,
+            filter=lambda record: "_replayed" not in record["extra"],
+            # the same text goes to stdout and the file
+            colorize=False,
         )
 
+        logger.add(sys.stdout, level=level.upper(), filter=replayed)
+
         filename = f"api_{settings.ENVIRONMENT}.log"
 
         logger.add(
             "{dir}/logs/{filename}".format(dir=settings.ROOT_DIR, filename=filename),
             rotation=rotation,
             retention=retention,
-            enqueue=True,
-            backtrace=True,
             level=level.upper(),
-            format=cls.format_record,
+            filter=replayed,
         )
 
-        logging.basicConfig(handlers=[InterceptHandler()], level=0)
-        logging.getLogger("uvicorn.access").handlers = [InterceptHandler()]
+        # records below the level are dropped by the stdlib before reaching InterceptHandler
+        logging.basicConfig(handlers=[InterceptHandler()], level=level.upper(), force=True)
+        cls.access_sampler = AccessLogSampler(
+            rate=settings.ACCESS_LOG_SAMPLE_RATE, above_rps=settings.ACCESS_LOG_SAMPLE_ABOVE_RPS
+        )
+        access_logger = logging.getLogger("uvicorn.access")
+        access_logger.handlers = [InterceptHandler()]
+        access_logger.filters = [cls.access_sampler]
         for _log in ["uvicorn", "uvicorn.error", "fastapi"]:
             _logger = logging.getLogger(_log)
             _logger.handlers = [InterceptHandler()]
 
-        return logger.bind(request_id=None, method=None)
+        return logger
 
     @classmethod
     def load_logging_config(cls):
@@ -119,6 +161,4 @@ class CustomizeLogger:
 
 
 def get_logger():
-    logger = logging.getLogger(__name__)
-    logger = CustomizeLogger.make_logger()
-    return logger
+    return CustomizeLogger.make_logger()
@@ -0,0 +1,126 @@
+"""Log delivery: bounded queue in front of the sinks, json lines and access log sampling"""
+import atexit
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+
+class BoundedQueueSink:
+    """
+    Loguru sink handing formatted messages to a writer thread through a bounded queue.
+
+    Callers never block on the disk or stdout: when the queue is full the message is dropped
+    and counted. The writer passes each message to `target` (the real sinks). No `write`
+    attribute on purpose, loguru would use the object as a stream and bypass the queue.
+    """
+
+    def __init__(self, target: Callable[[Any], None], maxsize: int = 10000):
+        self.target = target
+        self.dropped = 0
+        self.written = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __call__(self, message) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                if message is None:
+                    return
+                self.target(message)
+                self.written += 1
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every queued message is written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, int]:
+        return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+
+def payload_text(record: dict, formatter: Callable[[Any], str]) -> Optional[str]:
+    """
+    Formatted payload of a record, computed once per record whatever the number of sinks.
+    A callable payload is only called here, i.e. when the record passed the level filter.
+    """
+    extra = record["extra"]
+    if "_payload" not in extra:
+        payload = extra.get("payload")
+        if callable(payload):
+            payload = payload()
+        extra["_payload"] = None if payload is None else formatter(payload)
+    return extra["_payload"]
+
+
+def json_line(record: dict) -> str:
+    """One json object per record, extra values included, private keys (_x) skipped"""
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+    }
+    for key, value in record["extra"].items():
+        if key != "payload" and not key.startswith("_") and value is not None:
+            entry[key] = value
+    payload = payload_text(record, lambda value: value)
+    if payload is not None:
+        entry["payload"] = payload
+    if record["exception"] is not None:
+        entry["exception"] = "".join(traceback.format_exception(*record["exception"])).rstrip()
+    return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class AccessLogSampler(logging.Filter):
+    """
+    Keep every uvicorn access record up to `above_rps` per second, then a `rate` fraction of them.
+    Error responses (status >= 400) are always kept.
+    """
+
+    def __init__(self, rate: float = 1.0, above_rps: int = 100):
+        super().__init__()
+        self.rate = rate
+        self.above_rps = above_rps
+        self.sampled_out = 0
+        self._second = 0
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1:
+            return True
+        # uvicorn access args: (client, method, path, http version, status)
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5 and isinstance(args[4], int) and args[4] >= 400:
+            return True
+        second = int(time.monotonic())
+        if second != self._second:
+            self._second, self._count = second, 0
+        self._count += 1
+        if self._count <= self.above_rps or random.random() < self.rate:
+            return True
+        self.sampled_out += 1
+        return False
@@ -0,0 +1,18 @@
+"""Process metrics exposed on /metrics"""
+from app.infra.metrics.registry import Counter, Gauge, Histogram, Registry
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by method, route and status", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ("method",)
+)
+use_case_duration = registry.histogram(
+    "use_case_duration_seconds", "Use case execution time by use case and outcome", ("use_case", "outcome")
+)
+
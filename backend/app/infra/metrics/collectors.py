@@ -0,0 +1,107 @@
+"""Scrape time collectors for state kept by other components"""
+from typing import Dict, List
+
+from anyio.to_thread import current_default_thread_limiter
+from sniffio import AsyncLibraryNotFoundError
+
+from app.infra.database.pool import pool_stats
+from app.infra.logging import CustomizeLogger
+from app.infra.metrics import registry
+from app.infra.metrics.registry import Family
+from app.infra.security.security_service import password_hasher, token_cache
+from app.infra.user.user_repository import user_cache
+
+
+def _family(name: str, type_: str, documentation: str, values: Dict[str, float], label: str) -> Family:
+    return name, type_, documentation, [({label: key}, value) for key, value in values.items()]
+
+
+def _single(name: str, type_: str, documentation: str, value: float) -> Family:
+    return name, type_, documentation, [({}, value)]
+
+
+def threadpool_metrics() -> List[Family]:
+    """
+    Threadpool running sync endpoints and dependencies. Only readable inside the event loop,
+    so /metrics is an async endpoint, a render outside of it gets no threadpool families.
+    """
+    try:
+        limiter = current_default_thread_limiter()
+    except AsyncLibraryNotFoundError:
+        return []
+    stats = limiter.statistics()
+    return [
+        _single("threadpool_threads_max", "gauge", "Threadpool capacity", limiter.total_tokens),
+        _single("threadpool_threads_busy", "gauge", "Threadpool threads running a call", stats.borrowed_tokens),
+        _single("threadpool_queue_depth", "gauge", "Calls waiting for a threadpool thread", stats.tasks_waiting),
+    ]
+
+
+def mongo_pool_metrics() -> List[Family]:
+    snapshot = pool_stats.snapshot()
+    return [
+        _family(
+            "mongo_pool_connections",
+            "gauge",
+            "Mongo pool connections by state",
+            {state: snapshot[state] for state in ("open", "checked_out", "idle", "waiting")},
+            "state",
+        ),
+        _single("mongo_pool_max_size", "gauge", "Mongo maxPoolSize", snapshot["max_pool_size"]),
+        _single(
+            "mongo_pool_checkout_failed_total", "counter", "Failed connection checkouts", snapshot["checkout_failed"]
+        ),
+    ]
+
+
+def cache_metrics() -> List[Family]:
+    stats = {"token": token_cache.stats(), "user": user_cache.stats()}
+    return [
+        _family("cache_entries", "gauge", "Entries per cache", {k: v["size"] for k, v in stats.items()}, "cache"),
+        _family("cache_hits_total", "counter", "Hits per cache", {k: v["hits"] for k, v in stats.items()}, "cache"),
+        _family(
+            "cache_misses_total", "counter", "Misses per cache", {k: v["misses"] for k, v in stats.items()}, "cache"
+        ),
+    ]
+
+
+def password_hasher_metrics() -> List[Family]:
+    stats = password_hasher.stats()
+    return [
+        _single("password_hash_workers", "gauge", "Password hashing threads", stats["workers"]),
+        _single("password_hash_pending", "gauge", "Password hashes running or queued", stats["pending"]),
+        _single("password_hash_queued", "gauge", "Password hashes waiting for a thread", stats["queued"]),
+        _single("password_hash_completed_total", "counter", "Password hashes completed", stats["completed"]),
+        _single("password_hash_rejected_total", "counter", "Password hashes rejected, queue full", stats["rejected"]),
+    ]
+
+
+def logging_metrics() -> List[Family]:
+    families = []
+    if CustomizeLogger.queue_sink is not None:
+        stats = CustomizeLogger.queue_sink.stats()
+        families += [
+            _single("log_queue_depth", "gauge", "Log messages waiting to be written", stats["queued"]),
+            _single("log_messages_dropped_total", "counter", "Log messages dropped, queue full", stats["dropped"]),
+        ]
+    if CustomizeLogger.access_sampler is not None:
+        families.append(
+            _single(
+                "access_log_sampled_out_total",
+                "counter",
+                "Access log records skipped by sampling",
+                CustomizeLogger.access_sampler.sampled_out,
+            )
+        )
+    return families
+
+
+def register_collectors() -> None:
+    for collector in (
+        threadpool_metrics,
+        mongo_pool_metrics,
+        cache_metrics,
+        password_hasher_metrics,
+        logging_metrics,
+    ):
+        registry.register_collector(collector)
@@ -0,0 +1,200 @@
+"""Minimal Prometheus style instruments rendered in the text exposition format"""
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.infra.logging import get_logger
+
+logger = get_logger()
+
+Labels = Tuple[str, ...]
+# (metric name, type, help, [(label pairs, value)])
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Labels = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Tuple[str, ...]) -> Labels:
+        if len(labels) != len(self.labelnames):
+            raise ValueError("{} expects labels {}".format(self.name, self.labelnames))
+        return labels
+
+    def _labels(self, key: Labels) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def collect(self) -> List[Family]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            samples = [(self._labels(key), value) for key, value in self._values.items()]
+        return [(self.name, self.type, self.documentation, samples)]
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            samples = [(self._labels(key), value) for key, value in self._values.items()]
+        return [(self.name, self.type, self.documentation, samples)]
+
+
+class Histogram(_Metric):
+    """
+    Cumulative histogram. observe() only bumps one bucket, buckets are accumulated when collected
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket..., count above last bucket, sum]
+        self._values: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            values = [(key, list(counts)) for key, counts in self._values.items()]
+        buckets, counts_, sums = [], [], []
+        for key, counts in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts[:-1]):
+                cumulative += count
+                buckets.append((dict(labels, le=_format_value(float(bound))), cumulative))
+            counts_.append((labels, cumulative))
+            sums.append((labels, counts[-1]))
+        return [
+            (self.name, self.type, self.documentation, []),
+            (self.name + "_bucket", "", "", buckets),
+            (self.name + "_sum", "", "", sums),
+            (self.name + "_count", "", "", counts_),
+        ]
+
+
+class Registry:
+    """
+    Instruments updated on the hot path, plus collectors called at scrape time for values
+    that already live elsewhere (pool counters, caches)
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Optional[Tuple[float, ...]] = None,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets or DEFAULT_BUCKETS))
+
+    def render(self) -> str:
+        """
+        All metrics in the Prometheus text exposition format
+        :return:
+        """
+        lines = []
+        families: List[Family] = []
+        for metric in self._metrics:
+            families.extend(metric.collect())
+        for collector in self._collectors:
+            # one broken collector must not take the whole scrape down
+            try:
+                families.extend(collector())
+            except Exception as exc:
+                logger.warning("Metrics collector {name} failed: {error}", name=collector.__name__, error=exc)
+        for name, type_, documentation, samples in families:
+            if type_:
+                lines.append("# HELP {} {}".format(name, documentation))
+                lines.append("# TYPE {} {}".format(name, type_))
+            for labels, value in samples:
+                lines.append("{}{} {}".format(name, _format_labels(labels), _format_value(value)))
+        return "\n".join(lines) + "\n"
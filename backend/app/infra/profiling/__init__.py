@@ -0,0 +1,5 @@
+"""On demand request profiling"""
+from app.config import settings
+from app.infra.profiling.sampler import ProfileStore, StackSampler
+
+profile_store = ProfileStore(maxsize=settings.PROFILING_MAX_PROFILES)
@@ -0,0 +1,115 @@
+"""Sampling profiler producing folded stacks, the input format of flamegraph.pl and speedscope"""
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# innermost frames of a thread waiting for work (event loop, threadpool, executors), such samples are skipped
+_IDLE_FRAMES = {"selectors:select", "threading:wait", "queue:get", "concurrent.futures.thread:_worker"}
+
+# our own background threads, never part of a request
+_BACKGROUND_THREADS = ("log-writer", "slow-query-recorder", "google-keys", "index-reconciler", "profiler")
+
+
+def _label(frame) -> str:
+    return "{}:{}".format(frame.f_globals.get("__name__", "?"), frame.f_code.co_name)
+
+
+def _fold(frame) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StackSampler:
+    """
+    Sample the stacks of all busy threads every `interval` seconds.
+
+    Threads are not tied to a request, concurrent requests running at the same time show up in the
+    profile as well. Meant for one request at a time: an admin request or a low sample rate.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: "Counter[str]" = Counter()
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "StackSampler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(exclude=own)
+
+    def sample(self, exclude: Optional[int] = None) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude or names.get(ident, "").startswith(_BACKGROUND_THREADS):
+                continue
+            if _label(frame) in _IDLE_FRAMES:
+                continue
+            self.samples[_fold(frame)] += 1
+
+    def folded(self) -> str:
+        """One `frame;frame;frame count` line per distinct stack"""
+        return "\n".join("{} {}".format(stack, count) for stack, count in self.samples.most_common()) + "\n"
+
+
+class ProfileStore:
+    """Latest profiles of the worker, oldest evicted first"""
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    def add(self, profile_id: str, route: str, sampler: StackSampler, status: int) -> None:
+        profile = {
+            "id": profile_id,
+            "route": route,
+            "status": status,
+            "created_at": datetime.now(timezone.utc),
+            "duration_ms": round(sampler.duration * 1000, 1),
+            "samples": sum(sampler.samples.values()),
+            "folded": sampler.folded(),
+        }
+        with self._lock:
+            self._profiles[profile_id] = profile
+            while len(self._profiles) > self.maxsize:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        return self._profiles.get(profile_id)
+
+    def list(self, route: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Profiles without their stacks, newest first"""
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [
+            {key: value for key, value in profile.items() if key != "folded"}
+            for profile in reversed(profiles)
+            if route is None or profile["route"] == route
+        ]
@@ -0,0 +1,167 @@
+"""Monthly rollup repository module"""
+from datetime import datetime
+from typing import Optional, Dict, List, Any, Iterable, Tuple, Mapping
+from pymongo import UpdateOne
+from bson import ObjectId
+
+from app.infra.database.models.monthly_rollup import MonthlyRollup as MonthlyRollupModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.logging import get_logger
+from app.shared.cache import LRUCache
+from app.config import settings
+
+logger = get_logger()
+
+# transaction fields (user, category, date, type, amount) and +1 when it is added / -1 when it is removed
+RollupChange = Tuple[Mapping[str, Any], int]
+
+RollupKey = Tuple[ObjectId, int, int, ObjectId, str]
+
+# totals by type of closed months, keyed by (user, year, month), dropped when a write touches the month
+closed_month_cache = LRUCache(maxsize=settings.OVERVIEW_CACHE_SIZE, ttl=settings.OVERVIEW_CACHE_TTL_SECONDS)
+
+
+class RollupRepository:
+    def __init__(self):
+        pass
+
+    def apply(self, changes: Iterable[RollupChange]) -> bool:
+        """
+        Apply transaction changes to rollups, changes on the same key are merged into a single $inc
+        :param changes:
+        :return:
+        """
+        deltas: Dict[RollupKey, List[float]] = {}
+        for transaction, sign in changes:
+            date = transaction["date"]
+            key = (transaction["user"], date.year, date.month, transaction["category"], str(transaction["type"]))
+            delta = deltas.setdefault(key, [0.0, 0])
+            delta[0] += sign * transaction["amount"]
+            delta[1] += sign
+
+        requests, guarded = [], []
+        for (user, year, month, category, type), (amount, count) in deltas.items():
+            if not (amount or count):
+                continue
+            key = {"user": user, "year": year, "month": month, "category": category, "type": type}
+            update = {"$inc": {"amount": amount, "count": count}}
+            if count > 0:
+                update["$setOnInsert"] = {"_cls": MonthlyRollupModel._class_name}
+                requests.append(UpdateOne(key, update, upsert=True))
+            else:
+                # removals only apply to a rollup holding enough transactions, never below a zero count
+                requests.append(UpdateOne({**key, "count": {"$gte": -count}}, update))
+                guarded.append(key)
+        if not requests:
+            return True
+        try:
+            result = MonthlyRollupModel._get_collection().bulk_write(requests, ordered=False)
+            upserted = len(result.upserted_ids)
+            skipped = len(requests) - result.matched_count - upserted
+            if skipped:
+                logger.warning(
+                    "Skipped {skipped} rollup changes leaving a negative count, rebuild rollups of {users}",
+                    skipped=skipped,
+                    users=sorted({str(key["user"]) for key in guarded}),
+                )
+            return not skipped
+        except Exception:
+            return False
+        finally:
+            # after the write, a reader running meanwhile would otherwise cache the old totals
+            for user, year, month, _, _ in deltas:
+                closed_month_cache.pop((user, year, month))
+
+    def list(
+        self,
+        user: ObjectId,
+        year_month_from: Optional[Tuple[int, int]] = None,
+        year_month_to: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List rollups of user between two (year, month), both included
+        :return: raw rollup documents
+        """
+        conditions: Dict[str, Any] = {"user": user}
+        bounds = []
+        if year_month_from:
+            year, month = year_month_from
+            bounds.append({"$or": [{"year": {"$gt": year}}, {"year": year, "month": {"$gte": month}}]})
+        if year_month_to:
+            year, month = year_month_to
+            bounds.append({"$or": [{"year": {"$lt": year}}, {"year": year, "month": {"$lte": month}}]})
+        if bounds:
+            conditions["$and"] = bounds
+        try:
+            return list(MonthlyRollupModel._get_collection().find(conditions))
+        except Exception:
+            return []
+
+    def totals_by_month(
+        self, user: ObjectId, months: List[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Dict[str, float]]:
+        """
+        Total amount by type of each (year, month). Months before the current one (UTC) are served from
+        closed_month_cache, the others are read from rollups in a single query.
+        :param user:
+        :param months: list of (year, month)
+        :return: {(year, month): {type: amount}}
+        """
+        now = datetime.utcnow()
+        current = (now.year, now.month)
+        totals, missing = {}, []
+        for year_month in months:
+            cached = closed_month_cache.get((user, *year_month)) if year_month < current else None
+            if cached is None:
+                missing.append(year_month)
+            else:
+                totals[year_month] = cached
+
+        if missing:
+            # a write invalidating a month while we read must not leave the old totals cached
+            version = closed_month_cache.version()
+            fetched: Dict[Tuple[int, int], Dict[str, float]] = {year_month: {} for year_month in missing}
+            conditions = {"user": user, "$or": [{"year": year, "month": month} for year, month in missing]}
+            projection = {"year": 1, "month": 1, "type": 1, "amount": 1}
+            for doc in MonthlyRollupModel._get_collection().find(conditions, projection):
+                by_type = fetched[(doc["year"], doc["month"])]
+                by_type[doc["type"]] = by_type.get(doc["type"], 0) + doc["amount"]
+            for year_month, by_type in fetched.items():
+                if year_month < current:
+                    closed_month_cache.set((user, *year_month), by_type, version=version)
+            totals.update(fetched)
+        return totals
+
+    def rebuild(self, user: Optional[ObjectId] = None) -> int:
+        """
+        Recompute rollups from the transactions ledger
+        :param user: only rebuild this user, all users when empty
+        :return: number of rollup documents written
+        """
+        conditions = {"user": user} if user else {}
+        pipeline = [
+            {"$match": conditions},
+            {
+                "$group": {
+                    "_id": {
+                        "user": "$user",
+                        "year": {"$year": "$date"},
+                        "month": {"$month": "$date"},
+                        "category": "$category",
+                        "type": "$type",
+                    },
+                    "amount": {"$sum": "$amount"},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+        docs = [
+            {**group["_id"], "amount": group["amount"], "count": group["count"], "_cls": MonthlyRollupModel._class_name}
+            for group in TransactionModel._get_collection().aggregate(pipeline, allowDiskUse=True)
+        ]
+        collection = MonthlyRollupModel._get_collection()
+        collection.delete_many(conditions)
+        if docs:
+            collection.insert_many(docs, ordered=False)
+        closed_month_cache.clear()
+        return len(docs)
@@ -0,0 +1,174 @@
+"""Google signing keys for local ID token verification"""
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from jose import jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JWTClaimsError, JWTError
+
+from app.config import settings
+from app.infra.logging import get_logger
+
+logger = get_logger()
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(headers: httpx.Headers) -> Optional[int]:
+    """Seconds the response may be cached for, from Cache-Control max-age minus Age"""
+    match = _MAX_AGE.search(headers.get("cache-control", ""))
+    if not match:
+        return None
+    return max(int(match.group(1)) - int(headers.get("age", 0) or 0), 0)
+
+
+class GoogleKeySet:
+    """
+    Cached JWKS used to verify Google ID tokens without calling tokeninfo.
+
+    Keys come from a file (cert_file, for offline use and tests) or from the certs url. Url keys are
+    fetched by a shared AsyncClient running on a background event loop, which refreshes them shortly
+    before the Cache-Control max-age of the last response runs out. A token signed with an unknown
+    kid triggers a refresh, at most once per min_refresh_interval. Concurrent refreshes share one fetch.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        cert_file: Optional[str] = None,
+        default_max_age: int = 3600,
+        refresh_margin: int = 300,
+        min_refresh_interval: int = 60,
+        timeout: float = 5.0,
+    ):
+        self.url = url
+        self.cert_file = cert_file
+        self.default_max_age = default_max_age
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self.expires_at = 0.0
+        self.refreshed_at = 0.0
+        self._attempted_at = 0.0
+        self._keys: Dict[str, Key] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def load(self, jwks: Dict[str, Any], max_age: Optional[int] = None) -> None:
+        """
+        Replace the cached keys with a JWKS document
+        :param jwks: {"keys": [...]}
+        :param max_age: seconds the keys stay valid, default_max_age if None
+        :return:
+        """
+        keys = {item["kid"]: jwk.construct(item, item.get("alg", "RS256")) for item in jwks.get("keys", [])}
+        now = time.time()
+        with self._lock:
+            self._keys = keys
+            self.refreshed_at = now
+            self.expires_at = now + (self.default_max_age if max_age is None else max_age)
+
+    async def _fetch(self) -> Tuple[Dict[str, Any], Optional[int]]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        resp = await self._client.get(self.url)
+        resp.raise_for_status()
+        return resp.json(), _max_age(resp.headers)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                self.load(*await self._fetch())
+            except Exception as exc:
+                logger.warning("Google keys refresh failed: {error}", error=exc)
+                await asyncio.sleep(self.min_refresh_interval)
+                continue
+            await asyncio.sleep(max(self.expires_at - time.time() - self.refresh_margin, self.min_refresh_interval))
+
+    def start(self) -> None:
+        """
+        Start the background refresh, keys are read once from cert_file if it is set
+        :return:
+        """
+        if self.cert_file:
+            self.refresh()
+            return
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="google-keys", daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._refresh_forever(), self._loop)
+
+    def refresh(self) -> None:
+        """
+        Reload keys now, from cert_file or through the background loop.
+        A caller arriving while another refresh runs waits for it instead of fetching again.
+        :return:
+        """
+        requested_at = time.monotonic()
+        with self._refresh_lock:
+            # a refresh ended while this caller waited, its result (or failure) is shared
+            if self._attempted_at > requested_at:
+                return
+            try:
+                if self.cert_file:
+                    with open(self.cert_file) as f:
+                        self.load(json.load(f))
+                    return
+                if self._loop is None:
+                    self.start()
+                self.load(*asyncio.run_coroutine_threadsafe(self._fetch(), self._loop).result(timeout=self.timeout))
+            finally:
+                self._attempted_at = time.monotonic()
+
+    def get(self, kid: str) -> Optional[Key]:
+        """
+        Get signing key by kid, refreshing when keys are expired or kid is unknown.
+        Expired keys are still used when the refresh fails.
+        :param kid:
+        :return: Key or None
+        """
+        key = self._keys.get(kid)
+        now = time.time()
+        if (key is None or now >= self.expires_at) and now - self.refreshed_at >= self.min_refresh_interval:
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.warning("Google keys refresh failed: {error}", error=exc)
+            key = self._keys.get(kid)
+        return key
+
+    def verify(self, id_token: str, audience: str) -> Dict[str, Any]:
+        """
+        Verify signature, audience, issuer and expiry of a Google ID token
+        :param id_token:
+        :param audience: our oauth client id
+        :return: token claims
+        """
+        header = jwt.get_unverified_header(id_token)
+        key = self.get(header.get("kid"))
+        if key is None:
+            raise JWTError("Unknown signing key")
+        claims = jwt.decode(
+            id_token,
+            key,
+            algorithms=["RS256"],
+            audience=audience,
+            issuer=GOOGLE_ISSUERS,
+            options={"verify_at_hash": False},
+        )
+        if claims.get("email_verified") in (False, "false"):
+            raise JWTClaimsError("Email not verified")
+        return claims
+
+
+google_key_set = GoogleKeySet(url=settings.GOOGLE_CERTS_URL, cert_file=settings.GOOGLE_CERTS_FILE)
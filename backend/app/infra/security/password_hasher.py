@@ -0,0 +1,149 @@
+"""Password hashing on a dedicated bounded pool, away from the request threadpool"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+
+class PasswordHasher:
+    """
+    Run bcrypt operations on their own worker threads (bcrypt releases the GIL while hashing).
+
+    At most workers + queue_size operations are admitted at once, sync and async callers share that
+    bound. Callers beyond it wait up to timeout seconds for a slot and then get a 503. Async callers
+    (the login endpoints) wait on the event loop and hold no request thread at all, sync callers block
+    their thread while waiting. A slot is released when the job finishes on the pool, not when its
+    caller stops waiting, so cancelled callers cannot push more jobs than the bound onto the pool.
+    """
+
+    def __init__(self, context: CryptContext, workers: int, queue_size: int, timeout: float):
+        self.context = context
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        # admitted operations, running or queued on the pool
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        # sync callers wait on the condition, async callers on a future of their event loop
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+
+    def _try_admit(self) -> bool:
+        # called with _lock held
+        if self.pending >= self.workers + self.queue_size:
+            return False
+        self.pending += 1
+        return True
+
+    def _wake_async_waiter(self) -> None:
+        # called with _lock held, the woken caller retries admission on its own loop
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(self._resolve, waiter)
+                return
+
+    def _resolve(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # its caller gave up in the meantime, the freed slot goes to the next one
+            with self._lock:
+                self._wake_async_waiter()
+        else:
+            waiter.set_result(None)
+
+    def _release(self, _future: Future = None) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            self._slot_freed.notify()
+            self._wake_async_waiter()
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        """Submit an admitted operation, its slot is released by the job's completion"""
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _run(self, fn: Callable, *args) -> Any:
+        deadline = time.monotonic() + self.timeout
+        with self._lock:
+            while not self._try_admit():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.rejected += 1
+                    raise self._full()
+                self._slot_freed.wait(remaining)
+        return self._submit(fn, *args).result()
+
+    async def _run_async(self, fn: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            with self._lock:
+                if self._try_admit():
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, max(deadline - loop.time(), 0))
+            except BaseException as exc:
+                with self._lock:
+                    if waiter.done() and not waiter.cancelled():
+                        # woken for a slot we no longer take, pass it on
+                        self._wake_async_waiter()
+                    if not isinstance(exc, asyncio.TimeoutError):
+                        raise
+                    self.rejected += 1
+                raise self._full()
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    @staticmethod
+    def _full() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent password operations, try again later",
+        )
+
+    def hash(self, password: str) -> str:
+        return self._run(self.context.hash, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(self.context.verify, password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(self.context.hash, password)
+
+    async def verify_and_update_async(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Same as verify_and_update, awaited on the event loop"""
+        return await self._run_async(self.context.verify_and_update, password, hashed_password)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify password, and rehash it when the stored hash uses outdated settings (e.g. bcrypt rounds)
+        :param password:
+        :param hashed_password:
+        :return: (valid, new hash or None)
+        """
+        return self._run(self.context.verify_and_update, password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": self.pending,
+                "queued": max(self.pending - self.workers, 0),
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
@@ -1,8 +1,11 @@
 """Security module"""
+import hashlib
+import time
 from typing import Optional, Union
 from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from random import sample
@@ -15,9 +18,20 @@ from app.domain.user.entity import UserInDB
 from app.infra.database.models.user import User as UserModel
 from app.domain.shared.enum import AuthGrantType
 from app.infra.user.user_repository import UserRepository
+from app.infra.user.async_user_repository import AsyncUserRepository, get_async_user_repository
+from app.infra.security.password_hasher import PasswordHasher
+from app.shared.cache import LRUCache
+from app.shared.timing import timed
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/token")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/token", auto_error=False)
@@ -28,29 +42,46 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+# TokenData of already verified tokens, an entry expires together with its token
+token_cache = LRUCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
-def verify_token(token: str, grant_type: Optional[AuthGrantType] = None) -> Optional[TokenData]:
+def _decode_token(token: str, cache_key: str) -> TokenData:
     try:
         # decode jwt token
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        # get email from decoded token
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email, id=payload.get("id"), grant_type=payload.get("grant_type"))
-        if grant_type and grant_type != token_data.grant_type:
-            raise credentials_exception
-        return token_data
     except JWTError:
         raise credentials_exception
+    # get email from decoded token
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+    token_data = TokenData(email=email, id=payload.get("id"), grant_type=payload.get("grant_type"))
+    # only tokens with an expiry are cached, so an entry never outlives its token
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(cache_key, token_data, ttl=exp - time.time())
+    return token_data
+
+
+def verify_token(token: str, grant_type: Optional[AuthGrantType] = None) -> Optional[TokenData]:
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    token_data: TokenData = token_cache.get(cache_key) or _decode_token(token, cache_key)
+    if grant_type and grant_type != token_data.grant_type:
+        raise credentials_exception
+    return token_data
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.hash_async(password)
 
 
 def generate_random_password(length: int = 20):
@@ -70,10 +101,29 @@ def _get_current_user(
     token: str = Depends(oauth2_scheme),
     user_repository: UserRepository = Depends(UserRepository),
 ) -> UserModel:
-    token_data = verify_token(token=token)
-    # get user from db by email
-    user: UserModel = user_repository.get_by_email(email=token_data.email)
-    if user is None:
+    with timed("auth"):
+        token_data = verify_token(token=token)
+        if token_data.id:
+            user: UserModel = user_repository.get_by_id_cached(user_id=token_data.id)
+        else:
+            # get user from db by email
+            user: UserModel = user_repository.get_by_email(email=token_data.email)
+    if user is None or user.email != token_data.email:
+        raise credentials_exception
+    return user
+
+
+async def _get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    user_repository: AsyncUserRepository = Depends(get_async_user_repository),
+) -> UserModel:
+    with timed("auth"):
+        token_data = verify_token(token=token)
+        if token_data.id:
+            user: UserModel = await user_repository.get_by_id_cached(user_id=token_data.id)
+        else:
+            user: UserModel = await user_repository.get_by_email(email=token_data.email)
+    if user is None or user.email != token_data.email:
         raise credentials_exception
     return user
 
@@ -102,6 +152,15 @@ def get_current_active_user(
     return user
 
 
+async def get_current_active_user_async(
+    user: UserModel = Depends(_get_current_user_async),
+) -> UserModel:
+    current_user = UserInDB.model_validate(user)
+    if current_user.disabled():
+        raise HTTPException(status_code=400, detail="Invalid user")
+    return user
+
+
 def get_current_superuser(
     current_user: UserModel = Depends(get_current_active_user),
 ) -> UserModel:
@@ -126,6 +185,27 @@ def get_current_administrator(
     return user
 
 
+async def get_current_administrator_async(
+    user: UserModel = Depends(get_current_active_user_async),
+) -> UserModel:
+    current_user = UserInDB.model_validate(user)
+    if not current_user.is_administrator():
+        raise HTTPException(status_code=400, detail="Invalid administrator")
+    return user
+
+
+def get_administrator_from_token(token: str) -> Optional[UserModel]:
+    """
+    Administrator owning an access token, for checks made outside of route dependencies
+    :param token:
+    :return: user, None if the token is invalid or the user is not an active administrator
+    """
+    try:
+        return get_current_administrator(get_current_active_user(_get_current_user(token, UserRepository())))
+    except HTTPException:
+        return None
+
+
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     # clone data
     to_encode = data.copy()
@@ -153,10 +233,19 @@ class SecurityService:
         user = self.user_repository.get_by_email(email=email)
         return user
 
-    def authenticate_user(self, email: str, password: str) -> Union[UserModel, bool]:
-        user = self.get_user(email)
+    async def authenticate_user(self, email: str, password: str) -> Union[UserModel, bool]:
+        """
+        Check email / password. Database calls go to the threadpool, bcrypt runs on password_hasher
+        without holding a request thread.
+        """
+        user = await run_in_threadpool(self.get_user, email)
         if not user:
             return False
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update_async(password, user.hashed_password)
+        if not valid:
             return False
+        if new_hash:
+            # lazy rehash after a BCRYPT_ROUNDS change
+            await run_in_threadpool(self.user_repository.update, id=user.id, data={"hashed_password": new_hash})
+            user.hashed_password = new_hash
         return user
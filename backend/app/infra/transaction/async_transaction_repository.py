@@ -0,0 +1,90 @@
+"""Async transaction repository module, read paths on the async mongo client"""
+from datetime import datetime
+from typing import Optional, Dict, Union, List, Any, Tuple, Set
+from bson import ObjectId
+
+from app.infra.database.async_client import get_collection
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.rows import TransactionRow
+from app.infra.transaction.transaction_repository import match_conditions, list_pipeline
+from app.domain.shared.enum import Type
+
+
+class AsyncTransactionRepository:
+    def __init__(self):
+        pass
+
+    async def get_by_id(self, id: Union[str, ObjectId]) -> Optional[TransactionRow]:
+        """
+        Get transaction in db from id, category is embedded as {id, name, type}
+        :param id:
+        :return:
+        """
+        if not ObjectId.is_valid(id):
+            return None
+        doc = await get_collection(TransactionModel).find_one({"_id": ObjectId(id)})
+        if doc is None:
+            return None
+        rows = await self._embed_categories([doc])
+        return rows[0]
+
+    async def count(self, conditions: Dict[str, Union[str, bool, ObjectId]] = {}) -> int:
+        try:
+            return await get_collection(TransactionModel).count_documents(conditions)
+        except Exception:
+            return 0
+
+    async def categories_by_id(self, ids: Set[ObjectId]) -> Dict[ObjectId, Dict[str, Any]]:
+        """
+        Resolve referenced categories with a single $in query
+        :param ids:
+        :return: map of category id to its id, name and type
+        """
+        if not ids:
+            return {}
+        cursor = get_collection(CategoryModel).find({"_id": {"$in": list(ids)}}, {"name": 1, "type": 1})
+        return {
+            doc["_id"]: {"id": doc["_id"], "name": doc.get("name"), "type": doc.get("type")} async for doc in cursor
+        }
+
+    async def _embed_categories(self, docs: List[Dict[str, Any]]) -> List[TransactionRow]:
+        categories = await self.categories_by_id({doc["category"] for doc in docs if doc.get("category")})
+        for doc in docs:
+            if doc.get("category"):
+                doc["category"] = categories.get(doc["category"], {"id": doc["category"]})
+        return [TransactionRow.from_mongo(doc) for doc in docs]
+
+    async def list(
+        self,
+        type: Type,
+        user: ObjectId,
+        category: ObjectId,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        note: Optional[str] = None,
+        sort: Optional[Dict[str, int]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, ObjectId]] = None,
+    ) -> List[TransactionRow]:
+        """
+        Same as TransactionRepository.list
+        :return:
+        """
+        try:
+            match_pipelines = match_conditions(
+                user=user, type=type, category=category, date_from=date_from, date_to=date_to, note=note
+            )
+            pipeline = list_pipeline(match_pipelines, sort=sort, limit=limit, after=after)
+            docs = [doc async for doc in get_collection(TransactionModel).aggregate(pipeline)]
+            return await self._embed_categories(docs)
+        except Exception:
+            return []
+
+
+async_transaction_repository = AsyncTransactionRepository()
+
+
+async def get_async_transaction_repository() -> AsyncTransactionRepository:
+    """Dependency provider, a coroutine so FastAPI resolves it on the event loop rather than in the threadpool"""
+    return async_transaction_repository
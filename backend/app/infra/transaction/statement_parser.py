@@ -0,0 +1,55 @@
+"""Bank statement parsers, both yield one raw record per transaction without loading the whole file"""
+import csv
+import re
+from typing import IO, Dict, Iterator, Tuple
+
+# (row number in the statement, raw record)
+StatementRecord = Tuple[int, Dict[str, str]]
+
+CSV_FIELDS = ("date", "amount", "type", "category", "note")
+
+_OFX_TAG = re.compile(r"<(/?)([A-Z0-9.]+)>([^<\r\n]*)")
+
+
+def parse_csv(stream: IO[str]) -> Iterator[StatementRecord]:
+    """
+    Parse a csv statement with a header row containing date, amount and optionally type, category, note
+    :param stream: text stream
+    :return: generator of (row number, record)
+    """
+    reader = csv.DictReader(stream)
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, {field: (row.get(field) or "").strip() for field in CSV_FIELDS}
+
+
+def _ofx_date(value: str) -> str:
+    # OFX dates look like 20230131 or 20230131120000[+7:ICT], keep the day part
+    value = value.strip()
+    return "{}-{}-{}".format(value[0:4], value[4:6], value[6:8]) if len(value) >= 8 else value
+
+
+def parse_ofx(stream: IO[str]) -> Iterator[StatementRecord]:
+    """
+    Parse STMTTRN blocks of an OFX statement, SGML (1.x) or XML (2.x)
+    :param stream: text stream
+    :return: generator of (row number, record)
+    """
+    row_number, current = 0, None
+    for line in stream:
+        for closing, tag, value in _OFX_TAG.findall(line):
+            if tag == "STMTTRN":
+                if not closing:
+                    current = {}
+                    continue
+                if current is not None:
+                    row_number += 1
+                    yield row_number, {
+                        "date": _ofx_date(current.get("DTPOSTED", "")),
+                        "amount": current.get("TRNAMT", ""),
+                        "type": "",
+                        "category": "",
+                        "note": current.get("MEMO") or current.get("NAME", ""),
+                    }
+                current = None
+            elif current is not None and not closing:
+                current[tag] = value.strip()
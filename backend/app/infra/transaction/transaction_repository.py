@@ -1,16 +1,100 @@
-"""Category repository module"""
-from typing import Optional, Dict, Union, List, Any
-from mongoengine import QuerySet, DoesNotExist
+"""Transaction repository module"""
+from datetime import datetime
+from typing import Optional, Dict, Union, List, Any, Tuple, Set, Iterator
+from mongoengine import QuerySet, DoesNotExist, ValidationError
+from pymongo import InsertOne, UpdateOne, DeleteOne
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 from app.infra.database.models.user import User as UserModel
 from app.infra.database.models.category import Category as CategoryModel
 from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.rows import TransactionRow
 from app.domain.transaction.entity import TransactionInDB, TransactionInCreate, TransactionInUpdate
-from app.domain.shared.enum import UserRole, Type
+from app.domain.shared.enum import UserRole, Type, Period
 from app.shared.utils.general import date2datetime
 
 
+def match_conditions(
+    user: ObjectId,
+    type: Optional[Type] = None,
+    category: Optional[ObjectId] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    note: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the filter shared by list, export and the async repository
+    :return: match conditions
+    """
+    match_pipelines = {"user": user}
+
+    if category:
+        match_pipelines = {
+            **match_pipelines,
+            "category": category
+        }
+
+    if type:
+        match_pipelines = {
+            **match_pipelines,
+            "type": type.value
+        }
+
+    if note:
+        note = note.lower()
+        match_pipelines = {
+            **match_pipelines,
+            "note": {"$regex": ".*" + note + ".*"},
+        }
+
+    if date_from and date_to:
+        match_pipelines = {
+            **match_pipelines,
+            "date": {
+                "$gte": date2datetime(date_from),
+                "$lte": date2datetime(date_to, min_time=False),
+            },
+        }
+    return match_pipelines
+
+
+def list_pipeline(
+    match_pipelines: Dict[str, Any],
+    sort: Optional[Dict[str, int]] = None,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[datetime, ObjectId]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build the list aggregation, keyset paginated on (date, _id) desc when limit is set
+    :param match_pipelines: match conditions
+    :param sort:
+    :param limit: max number of rows
+    :param after: (date, _id) of the last row of the previous page
+    :return: pipeline
+    """
+    if not limit:
+        return [
+            {"$match": match_pipelines},
+            sort if sort else {"$sort": {"_id": -1}},
+        ]
+    if after:
+        # range predicate on (date, _id) so every page is served from the index
+        last_date, last_id = after
+        match_pipelines = {
+            **match_pipelines,
+            "$or": [
+                {"date": {"$lt": last_date}},
+                {"date": last_date, "_id": {"$lt": last_id}},
+            ],
+        }
+    return [
+        {"$match": match_pipelines},
+        {"$sort": {"date": -1, "_id": -1}},
+        {"$limit": limit},
+    ]
+
+
 class TransactionRepository:
     def __init__(self):
         pass
@@ -42,6 +126,78 @@ class TransactionRepository:
         except DoesNotExist:
             return None
 
+    def to_document(self, item: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Build a validated raw document for bulk writes, raise ValidationError on invalid fields
+        :param item: transaction fields, category and user as ObjectId
+        :param now: creation time
+        :return: document with a pre-allocated _id
+        """
+        now = now or datetime.utcnow()
+        transaction = TransactionModel(**item, created_at=now, updated_at=now)
+        transaction.validate()
+        doc = transaction.to_mongo().to_dict()
+        doc["_id"] = ObjectId()
+        return doc
+
+    def insert_many(self, items: List[Dict[str, Any]]) -> Tuple[int, Dict[int, str]]:
+        """
+        Validate and insert transactions with a single unordered insert_many
+        :param items: transaction fields, category and user as ObjectId
+        :return: number of inserted documents and error message by index in items
+        """
+        now = datetime.utcnow()
+        docs, positions, errors = [], [], {}
+        for index, item in enumerate(items):
+            try:
+                docs.append(self.to_document(item, now))
+            except ValidationError as exc:
+                errors[index] = str(exc)
+                continue
+            positions.append(index)
+
+        if not docs:
+            return 0, errors
+        try:
+            result = TransactionModel._get_collection().insert_many(docs, ordered=False)
+            return len(result.inserted_ids), errors
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                errors[positions[error["index"]]] = error.get("errmsg", "Write error")
+            return exc.details.get("nInserted", 0), errors
+
+    def find_owned(self, user: ObjectId, ids: List[ObjectId]) -> Dict[ObjectId, Dict[str, Any]]:
+        """
+        Fetch the given transactions of user in one query, ids of other users are left out
+        :param user:
+        :param ids:
+        :return: raw documents by id
+        """
+        if not ids:
+            return {}
+        docs = TransactionModel._get_collection().find(
+            {"_id": {"$in": ids}, "user": user},
+            {"user": 1, "category": 1, "date": 1, "type": 1, "amount": 1},
+        )
+        return {doc["_id"]: doc for doc in docs}
+
+    def bulk_write(
+        self, requests: List[Union[InsertOne, UpdateOne, DeleteOne]]
+    ) -> Tuple[Dict[str, int], Dict[int, str]]:
+        """
+        Execute write operations in one unordered bulk_write
+        :param requests: pymongo write operations
+        :return: matched / deleted document counts and error message by index in requests
+        """
+        if not requests:
+            return {"matched": 0, "deleted": 0}, {}
+        try:
+            result = TransactionModel._get_collection().bulk_write(requests, ordered=False)
+            return {"matched": result.matched_count, "deleted": result.deleted_count}, {}
+        except BulkWriteError as exc:
+            counts = {"matched": exc.details.get("nMatched", 0), "deleted": exc.details.get("nRemoved", 0)}
+            return counts, {error["index"]: error.get("errmsg", "Write error") for error in exc.details.get("writeErrors", [])}
+
     def update(self, id: ObjectId, data: Union[TransactionInUpdate, Dict[str, Any]]) -> bool:
         try:
             data = data.model_dump(exclude_none=True) if isinstance(data, TransactionInUpdate) else data
@@ -70,6 +226,13 @@ class TransactionRepository:
         except Exception:
             return []
 
+    def _embed_categories(self, docs: List[Dict[str, Any]]) -> List[TransactionRow]:
+        categories = self.categories_by_id({doc["category"] for doc in docs if doc.get("category")})
+        for doc in docs:
+            if doc.get("category"):
+                doc["category"] = categories.get(doc["category"], {"id": doc["category"]})
+        return [TransactionRow.from_mongo(doc) for doc in docs]
+
     def list(
         self,
         type: Type,
@@ -79,51 +242,114 @@ class TransactionRepository:
         date_to: Optional[str] = None,
         note: Optional[str] = None,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[TransactionModel]:
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, ObjectId]] = None,
+    ) -> List[TransactionRow]:
+        """
+        List transactions of user as read-only rows, category is embedded as {id, name, type}
+        :param limit: max number of rows, switch to keyset pagination ordered by (date, _id) desc
+        :param after: (date, _id) of the last row of the previous page
+        :return:
+        """
         try:
-            match_pipelines = {"user": user}
-
-            if category:
-                match_pipelines = {
-                    **match_pipelines,
-                    "category": category
-                }
-
-            if type:
-                match_pipelines = {
-                    **match_pipelines,
-                    "type": type.value
-                }
-
-            if category:
-                match_pipelines = {
-                    **match_pipelines,
-                    "category": category
-                }
-
-            if note:
-                note = note.lower()
-                match_pipelines = {
-                    **match_pipelines,
-                    "note": {"$regex": ".*" + note + ".*"},
-                }
-
-            if date_from and date_to:
-                match_pipelines = {
-                    **match_pipelines,
-                    "timestamp": {
-                        "$gte": date2datetime(date_from),
-                        "$lte": date2datetime(date_to, min_time=False),
-                    },
-                }
-
-            pipeline = [
-                {"$match": match_pipelines},
-                sort if sort else {"$sort": {"_id": -1}},
-            ]
-
-            docs = TransactionModel.objects().aggregate(pipeline)
-            return [TransactionModel.from_mongo(doc) for doc in docs]
+            match_pipelines = match_conditions(
+                user=user, type=type, category=category, date_from=date_from, date_to=date_to, note=note
+            )
+            pipeline = list_pipeline(match_pipelines, sort=sort, limit=limit, after=after)
+            docs = list(TransactionModel.objects().aggregate(pipeline))
+            return self._embed_categories(docs)
 
         except Exception:
             return []
+
+    def sum_by(
+        self,
+        field: str,
+        user: ObjectId,
+        type: Optional[Type] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Total amount and count of transactions of user grouped by a field, the $match is served by the
+        (user, date) index and only one document per group leaves the server
+        :param field: "category" or "type"
+        :return: [{"_id": value, "amount": float, "count": int}], database errors are raised to the use case
+        """
+        pipeline = [
+            {"$match": match_conditions(user=user, type=type, date_from=date_from, date_to=date_to)},
+            {"$group": {"_id": "$" + field, "amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+            {"$sort": {"amount": -1}},
+        ]
+        return list(TransactionModel._get_collection().aggregate(pipeline))
+
+    def sum_by_bucket(
+        self,
+        period: Period,
+        user: ObjectId,
+        type: Optional[Type] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Total amount of transactions of user by day or by iso week, grouped on the server
+        :param period: Period.DAY or Period.WEEK
+        :return: [{"_id": {"year", "month", "day"} or {"year", "week"}, "amount": float}]
+        """
+        if period == Period.WEEK:
+            bucket = {"year": {"$isoWeekYear": "$date"}, "week": {"$isoWeek": "$date"}}
+        else:
+            bucket = {"year": {"$year": "$date"}, "month": {"$month": "$date"}, "day": {"$dayOfMonth": "$date"}}
+        pipeline = [
+            {"$match": match_conditions(user=user, type=type, date_from=date_from, date_to=date_to)},
+            {"$group": {"_id": bucket, "amount": {"$sum": "$amount"}}},
+        ]
+        return list(TransactionModel._get_collection().aggregate(pipeline))
+
+    def iter_batches(
+        self,
+        user: ObjectId,
+        type: Optional[Type] = None,
+        category: Optional[ObjectId] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        note: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[TransactionRow]]:
+        """
+        Iterate transactions of user in date order, one batch of rows at a time.
+        Only one batch is held in memory, categories are resolved per batch.
+        :param batch_size: number of documents fetched per round trip
+        :return: generator of row batches
+        """
+        match_pipelines = match_conditions(
+            user=user, type=type, category=category, date_from=date_from, date_to=date_to, note=note
+        )
+        cursor = (
+            TransactionModel._get_collection()
+            .find(match_pipelines)
+            .sort([("date", 1), ("_id", 1)])
+            .batch_size(batch_size)
+        )
+        try:
+            batch = []
+            for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield self._embed_categories(batch)
+                    batch = []
+            if batch:
+                yield self._embed_categories(batch)
+        finally:
+            cursor.close()
+
+    def categories_by_id(self, ids: Set[ObjectId]) -> Dict[ObjectId, Dict[str, Any]]:
+        """
+        Resolve referenced categories with a single $in query
+        :param ids:
+        :return: map of category id to its id, name and type
+        """
+        if not ids:
+            return {}
+        docs = CategoryModel._get_collection().find({"_id": {"$in": list(ids)}}, {"name": 1, "type": 1})
+        return {doc["_id"]: {"id": doc["_id"], "name": doc.get("name"), "type": doc.get("type")} for doc in docs}
@@ -0,0 +1,80 @@
+"""Async user repository module, read paths on the async mongo client"""
+from typing import Optional, Dict, Union, List
+from bson import ObjectId
+
+from app.infra.database.async_client import get_collection
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.rows import UserRow
+from app.infra.user.user_repository import list_pipeline, user_cache
+from app.domain.shared.enum import UserRole
+
+
+class AsyncUserRepository:
+    def __init__(self):
+        pass
+
+    async def get_by_id(self, user_id: Union[str, ObjectId]) -> Optional[UserRow]:
+        """
+        Get user in db from id, without hashed_password
+        :param user_id:
+        :return:
+        """
+        if not ObjectId.is_valid(user_id):
+            return None
+        doc = await get_collection(UserModel).find_one({"_id": ObjectId(user_id)}, {"hashed_password": 0})
+        return UserRow.from_mongo(doc) if doc else None
+
+    async def get_by_email(self, email: str) -> Optional[UserModel]:
+        """
+        Get user in db from email
+        :param email:
+        :return:
+        """
+        son = await get_collection(UserModel).find_one({"email": email})
+        return UserModel._from_son(son) if son else None
+
+    async def get_by_id_cached(self, user_id: str) -> Optional[UserModel]:
+        """
+        Same as UserRepository.get_by_id_cached, both share user_cache
+        :param user_id:
+        :return:
+        """
+        if not ObjectId.is_valid(user_id):
+            return None
+        son = user_cache.get(user_id)
+        if son is None:
+            # an update finishing while we read drops the (possibly stale) document instead of caching it
+            version = user_cache.version()
+            son = await get_collection(UserModel).find_one({"_id": ObjectId(user_id)})
+            if son is None:
+                return None
+            user_cache.set(user_id, son, version=version)
+        return UserModel._from_son(son)
+
+    async def count(self, conditions: Dict[str, Union[str, bool, ObjectId]] = {}) -> int:
+        try:
+            return await get_collection(UserModel).count_documents(conditions)
+        except Exception:
+            return 0
+
+    async def list(
+        self,
+        role: UserRole,
+        email: Optional[str] = None,
+        page_index: int = 1,
+        page_size: int = 100,
+        sort: Optional[Dict[str, int]] = None,
+    ) -> List[UserRow]:
+        try:
+            pipeline = list_pipeline(role=role, email=email, page_index=page_index, page_size=page_size, sort=sort)
+            return [UserRow.from_mongo(doc) async for doc in get_collection(UserModel).aggregate(pipeline)]
+        except Exception:
+            return []
+
+
+async_user_repository = AsyncUserRepository()
+
+
+async def get_async_user_repository() -> AsyncUserRepository:
+    """Dependency provider, a coroutine so FastAPI resolves it on the event loop rather than in the threadpool"""
+    return async_user_repository
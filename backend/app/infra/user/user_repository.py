@@ -4,8 +4,41 @@ from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
 from app.infra.database.models.user import User as UserModel
+from app.infra.database.rows import UserRow
 from app.domain.user.entity import UserInDB, UserInCreate, UserInUpdate
 from app.domain.shared.enum import UserRole
+from app.shared.cache import LRUCache
+from app.config import settings
+
+# raw user documents by id for request authentication, dropped on every write through this repository
+user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def list_pipeline(
+    role: UserRole,
+    email: Optional[str] = None,
+    page_index: int = 1,
+    page_size: int = 100,
+    sort: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build the list aggregation, shared with the async repository
+    :return: pipeline
+    """
+    match_pipelines = {"role": role.value}
+    if email:
+        email = email.lower()
+        match_pipelines = {
+            **match_pipelines,
+            "email": {"$regex": ".*" + email + ".*"},
+        }
+    return [
+        {"$match": match_pipelines},
+        sort if sort else {"$sort": {"_id": -1}},
+        {"$skip": page_size * (page_index - 1)},
+        {"$limit": page_size},
+        {"$project": {"hashed_password": 0}},
+    ]
 
 
 class UserRepository:
@@ -55,6 +88,25 @@ class UserRepository:
             return None
         return user
 
+    def get_by_id_cached(self, user_id: str) -> Optional[UserModel]:
+        """
+        Get user from id, served from user_cache when possible.
+        Every call returns a new document so requests never share an instance.
+        :param user_id:
+        :return:
+        """
+        if not ObjectId.is_valid(user_id):
+            return None
+        son = user_cache.get(user_id)
+        if son is None:
+            # an update finishing while we read drops the (possibly stale) document instead of caching it
+            version = user_cache.version()
+            son = UserModel._get_collection().find_one({"_id": ObjectId(user_id)})
+            if son is None:
+                return None
+            user_cache.set(user_id, son, version=version)
+        return UserModel._from_son(son)
+
     def update(self, id: ObjectId, data: Union[UserInUpdate, Dict[str, Any]]) -> bool:
         try:
             data = data.model_dump(exclude_none=True) if isinstance(data, UserInUpdate) else data
@@ -62,6 +114,8 @@ class UserRepository:
             return True
         except Exception:
             return False
+        finally:
+            user_cache.pop(str(id))
 
     def count(self, conditions: Dict[str, Union[str, bool, ObjectId]] = {}) -> int:
         try:
@@ -76,22 +130,10 @@ class UserRepository:
         page_index: int = 1,
         page_size: int = 100,
         sort: Optional[Dict[str, int]] = None,
-    ) -> List[UserModel]:
+    ) -> List[UserRow]:
         try:
-            match_pipelines = {"role": role.value}
-            if email:
-                email = email.lower()
-                match_pipelines = {
-                    **match_pipelines,
-                    "email": {"$regex": ".*" + email + ".*"},
-                }
-            pipeline = [
-                {"$match": match_pipelines},
-                sort if sort else {"$sort": {"_id": -1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
+            pipeline = list_pipeline(role=role, email=email, page_index=page_index, page_size=page_size, sort=sort)
             docs = UserModel.objects().aggregate(pipeline)
-            return [UserModel.from_mongo(doc) for doc in docs]
+            return [UserRow.from_mongo(doc) for doc in docs]
         except Exception:
             return []
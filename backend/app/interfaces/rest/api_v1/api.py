@@ -1,8 +1,10 @@
 from fastapi import APIRouter
-from app.interfaces.rest.api_v1.endpoints import auth, user, category, transaction
+from app.interfaces.rest.api_v1.endpoints import auth, user, category, transaction, overview, system
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(user.router, prefix="/users", tags=["Users"])
 api_router.include_router(category.router, prefix="/categories", tags=["Categories"])
 api_router.include_router(transaction.router, prefix="/transactions", tags=["Transactions"])
+api_router.include_router(overview.router, prefix="/overview", tags=["Overview"])
+api_router.include_router(system.router, prefix="/system", tags=["System"])
@@ -25,7 +25,7 @@ oauth.register(
 
 @router.post("/login", response_model=AuthInfoInResponse)
 @response_decorator()
-def login_access_token(
+async def login_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     login_use_case: LoginUseCase = Depends(LoginUseCase),
 ):
@@ -39,7 +39,7 @@ def login_access_token(
     login_request_object = LoginRequestObject.builder(
         data=dict(email=form_data.username, password=form_data.password),
     )
-    response = login_use_case.execute(request_object=login_request_object)
+    response = await login_use_case.execute(request_object=login_request_object)
     return response
 
 
@@ -50,9 +50,9 @@ async def google_authorize(request: Request):
 
 @router.get("/google/token", response_model=AuthInfoInResponse)
 @response_decorator()
-def google_token(id_token: str, google_auth_use_case: GoogleAuthUseCase = Depends(GoogleAuthUseCase)):
+async def google_token(id_token: str, google_auth_use_case: GoogleAuthUseCase = Depends(GoogleAuthUseCase)):
     google_request_object = GoogleRequestObject.builder(id_token=id_token)
-    response = google_auth_use_case.process_request(google_request_object)
+    response = await google_auth_use_case.process_request(google_request_object)
     return response
 
 
@@ -1,14 +1,29 @@
 from fastapi import APIRouter, Body, Depends, Path, Query
 from typing import Annotated, Union, Dict
 from app.domain.category.entity import Category, CategoryInCreate, CategoryInDB, CategoryInUpdate
-from app.infra.security.security_service import get_current_active_user, get_current_administrator
+from app.infra.security.security_service import (
+    get_current_active_user,
+    get_current_active_user_async,
+    get_current_administrator,
+)
+from app.config import settings
 from app.shared.decorator import response_decorator
 from app.domain.shared.enum import UserRole, Type
 from app.infra.database.models.user import User as UserModel
 
-from app.use_cases.category.get import GetCategoryRequestObject, GetCategoryUseCase
+from app.use_cases.category.get import (
+    GetCategoryRequestObject,
+    GetCategoryUseCase,
+    AsyncGetCategoryUseCase,
+    get_async_get_category_use_case,
+)
 from app.use_cases.category.create import CreateCategoryUseCase, CreateCategoryRequestObject
-from app.use_cases.category.list import ListCategoriesUseCase, ListCategoriesRequestObject
+from app.use_cases.category.list import (
+    ListCategoriesUseCase,
+    ListCategoriesRequestObject,
+    AsyncListCategoriesUseCase,
+    get_async_list_categories_use_case,
+)
 from app.use_cases.category.update import UpdateCategoryUseCase, UpdateCategoryRequestObject
 from app.use_cases.category.delete import DeleteTransactionUseCase, DeleteCategoryRequestObject
 from app.infra.database.models.user import User
@@ -16,19 +31,37 @@ from app.infra.database.models.user import User
 router = APIRouter()
 
 
-@router.get(
-    "/{category_id}",
-    dependencies=[Depends(get_current_active_user)],  # auth route
-    response_model=Category,
-)
-@response_decorator()
-def get_category(
-    category_id: str = Path(..., title="Category id"),
-    get_category_use_case: GetCategoryUseCase = Depends(GetCategoryUseCase),
-):
-    req_object = GetCategoryRequestObject.builder(category_id=category_id)
-    response = get_category_use_case.execute(request_object=req_object)
-    return response
+if settings.MONGODB_ASYNC:
+
+    @router.get(
+        "/{category_id}",
+        dependencies=[Depends(get_current_active_user_async)],  # auth route
+        response_model=Category,
+    )
+    @response_decorator()
+    async def get_category(
+        category_id: str = Path(..., title="Category id"),
+        get_category_use_case: AsyncGetCategoryUseCase = Depends(get_async_get_category_use_case),
+    ):
+        req_object = GetCategoryRequestObject.builder(category_id=category_id)
+        response = await get_category_use_case.execute(request_object=req_object)
+        return response
+
+else:
+
+    @router.get(
+        "/{category_id}",
+        dependencies=[Depends(get_current_active_user)],  # auth route
+        response_model=Category,
+    )
+    @response_decorator()
+    def get_category(
+        category_id: str = Path(..., title="Category id"),
+        get_category_use_case: GetCategoryUseCase = Depends(GetCategoryUseCase),
+    ):
+        req_object = GetCategoryRequestObject.builder(category_id=category_id)
+        response = get_category_use_case.execute(request_object=req_object)
+        return response
 
 
 @router.post(
@@ -47,19 +80,37 @@ def create_category(
     return response
 
 
-@router.get("")
-@response_decorator()
-def get_list_categories(
-    current_user: UserModel = Depends(get_current_active_user),
-    list_categories_use_case: ListCategoriesUseCase = Depends(ListCategoriesUseCase),
-    type: Annotated[Union[Type, None], Query(title="Category Type")] = None,
-    name: Annotated[Union[str, None], Query(title="Category Name")] = None,
-    note: Annotated[Union[str, None], Query(title="Category Note")] = None,
-):
-    req_object = ListCategoriesRequestObject.builder(current_user=current_user, type=type,
-                                                     name=name, note=note)
-    response = list_categories_use_case.execute(request_object=req_object)
-    return response
+if settings.MONGODB_ASYNC:
+
+    @router.get("")
+    @response_decorator()
+    async def get_list_categories(
+        current_user: UserModel = Depends(get_current_active_user_async),
+        list_categories_use_case: AsyncListCategoriesUseCase = Depends(get_async_list_categories_use_case),
+        type: Annotated[Union[Type, None], Query(title="Category Type")] = None,
+        name: Annotated[Union[str, None], Query(title="Category Name")] = None,
+        note: Annotated[Union[str, None], Query(title="Category Note")] = None,
+    ):
+        req_object = ListCategoriesRequestObject.builder(current_user=current_user, type=type,
+                                                         name=name, note=note)
+        response = await list_categories_use_case.execute(request_object=req_object)
+        return response
+
+else:
+
+    @router.get("")
+    @response_decorator()
+    def get_list_categories(
+        current_user: UserModel = Depends(get_current_active_user),
+        list_categories_use_case: ListCategoriesUseCase = Depends(ListCategoriesUseCase),
+        type: Annotated[Union[Type, None], Query(title="Category Type")] = None,
+        name: Annotated[Union[str, None], Query(title="Category Name")] = None,
+        note: Annotated[Union[str, None], Query(title="Category Note")] = None,
+    ):
+        req_object = ListCategoriesRequestObject.builder(current_user=current_user, type=type,
+                                                         name=name, note=note)
+        response = list_categories_use_case.execute(request_object=req_object)
+        return response
 
 
 @router.put(
@@ -0,0 +1,94 @@
+from datetime import date
+from fastapi import APIRouter, Depends, Query
+from typing import Annotated, Union, List
+from app.domain.overview.entity import AmountByCategory, AmountByType, PeriodPercentage, SeriesPoint
+from app.infra.security.security_service import get_current_active_user
+from app.shared.decorator import response_decorator
+from app.domain.shared.enum import Type, Period
+from app.infra.database.models.user import User as UserModel
+
+from app.use_cases.overview.amount_by_category import AmountByCategoryRequestObject, AmountByCategoryUseCase
+from app.use_cases.overview.amount_by_type import AmountByTypeRequestObject, AmountByTypeUseCase
+from app.use_cases.overview.series import SeriesRequestObject, SeriesUseCase
+from app.use_cases.overview.percentage.this_month import ThisMonthPercentageRequestObject, ThisMonthPercentageUseCase
+from app.use_cases.overview.percentage.last_month import LastMonthPercentageRequestObject, LastMonthPercentageUseCase
+from app.use_cases.overview.percentage.this_year import ThisYearPercentageRequestObject, ThisYearPercentageUseCase
+
+router = APIRouter()
+
+
+@router.get("/amount-by-category", response_model=List[AmountByCategory])
+@response_decorator()
+def get_amount_by_category(
+    current_user: UserModel = Depends(get_current_active_user),
+    amount_by_category_use_case: AmountByCategoryUseCase = Depends(AmountByCategoryUseCase),
+    type: Annotated[Union[Type, None], Query(title="Transaction Type")] = None,
+    date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
+    date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
+):
+    req_object = AmountByCategoryRequestObject.builder(current_user=current_user, type=type,
+                                                       date_from=date_from, date_to=date_to)
+    response = amount_by_category_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/amount-by-type", response_model=List[AmountByType])
+@response_decorator()
+def get_amount_by_type(
+    current_user: UserModel = Depends(get_current_active_user),
+    amount_by_type_use_case: AmountByTypeUseCase = Depends(AmountByTypeUseCase),
+    date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
+    date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
+):
+    req_object = AmountByTypeRequestObject.builder(current_user=current_user, date_from=date_from, date_to=date_to)
+    response = amount_by_type_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/series", response_model=List[SeriesPoint])
+@response_decorator()
+def get_series(
+    current_user: UserModel = Depends(get_current_active_user),
+    series_use_case: SeriesUseCase = Depends(SeriesUseCase),
+    period: Annotated[Period, Query(title="Bucket size")] = Period.MONTH,
+    type: Annotated[Type, Query(title="Transaction Type")] = Type.SPEND,
+    date_from: Annotated[Union[date, None], Query(title="From date: YYYY-MM-DD")] = None,
+    date_to: Annotated[Union[date, None], Query(title="To date: YYYY-MM-DD")] = None,
+):
+    req_object = SeriesRequestObject.builder(current_user=current_user, period=period, type=type,
+                                             date_from=date_from, date_to=date_to)
+    response = series_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/percentage/this-month", response_model=PeriodPercentage)
+@response_decorator()
+def get_this_month_percentage(
+    current_user: UserModel = Depends(get_current_active_user),
+    this_month_use_case: ThisMonthPercentageUseCase = Depends(ThisMonthPercentageUseCase),
+):
+    req_object = ThisMonthPercentageRequestObject.builder(current_user=current_user)
+    response = this_month_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/percentage/last-month", response_model=PeriodPercentage)
+@response_decorator()
+def get_last_month_percentage(
+    current_user: UserModel = Depends(get_current_active_user),
+    last_month_use_case: LastMonthPercentageUseCase = Depends(LastMonthPercentageUseCase),
+):
+    req_object = LastMonthPercentageRequestObject.builder(current_user=current_user)
+    response = last_month_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/percentage/this-year", response_model=PeriodPercentage)
+@response_decorator()
+def get_this_year_percentage(
+    current_user: UserModel = Depends(get_current_active_user),
+    this_year_use_case: ThisYearPercentageUseCase = Depends(ThisYearPercentageUseCase),
+):
+    req_object = ThisYearPercentageRequestObject.builder(current_user=current_user)
+    response = this_year_use_case.execute(request_object=req_object)
+    return response
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.config import settings
+from app.infra.security.security_service import get_current_administrator
+from app.infra.database import slow_query_recorder
+from app.infra.database.pool import pool_stats
+from app.infra.profiling import profile_store
+
+router = APIRouter()
+
+
+@router.get("/db-pool", dependencies=[Depends(get_current_administrator)])
+def get_db_pool_stats():
+    """Connection pool counters of the mongo client: open, checked out, idle and waiting connections"""
+    return pool_stats.snapshot()
+
+
+@router.get("/slow-queries", dependencies=[Depends(get_current_administrator)])
+def get_slow_queries(limit: int = Query(50, ge=1, le=500), collection: Optional[str] = None):
+    """Latest commands over SLOW_QUERY_THRESHOLD_MS with their shape, duration, docs examined / returned and plan"""
+    return slow_query_recorder.list(settings.MONGODB_DATABASE, limit=limit, collection=collection)
+
+
+@router.get("/profiles", dependencies=[Depends(get_current_administrator)])
+def get_profiles(route: Optional[str] = None):
+    """Profiles recorded by this worker, newest first. route looks like "GET /transactions" """
+    return profile_store.list(route=route)
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(get_current_administrator)])
+def get_profile(profile_id: str):
+    """Folded stacks of a profile, render with flamegraph.pl or load in speedscope"""
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile["folded"])
@@ -1,33 +1,109 @@
-from fastapi import APIRouter, Body, Depends, Path, Query
-from typing import Annotated, Union, Dict
-from app.domain.transaction.entity import Transaction, TransactionInCreate, TransactionInDB, TransactionInUpdate
-from app.infra.security.security_service import get_current_active_user, get_current_administrator
+import io
+from fastapi import APIRouter, Body, Depends, File, HTTPException, Path, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Union, Dict, List
+from app.domain.transaction.entity import (
+    Transaction,
+    TransactionInCreate,
+    TransactionInDB,
+    TransactionInUpdate,
+    TransactionImportResult,
+    TransactionBatchOperation,
+    TransactionBatchResult,
+)
+from app.infra.security.security_service import (
+    get_current_active_user,
+    get_current_active_user_async,
+    get_current_administrator,
+)
+from app.config import settings
 from app.shared.decorator import response_decorator
-from app.domain.shared.enum import UserRole, Type
+from app.domain.shared.enum import UserRole, Type, ExportFormat, StatementFormat
 from app.infra.database.models.user import User as UserModel
 
-from app.use_cases.transaction.get import GetTransactionRequestObject, GetTransactionUseCase
+from app.use_cases.transaction.get import (
+    GetTransactionRequestObject,
+    GetTransactionUseCase,
+    AsyncGetTransactionUseCase,
+    get_async_get_transaction_use_case,
+)
 from app.use_cases.transaction.create import CreateTransactionRequestObject, CreateTransactionUseCase
-from app.use_cases.transaction.list import ListTransactionsRequestObject, ListTransactionsUseCase
+from app.use_cases.transaction.list import (
+    ListTransactionsRequestObject,
+    ListTransactionsUseCase,
+    AsyncListTransactionsUseCase,
+    get_async_list_transactions_use_case,
+)
 from app.use_cases.transaction.update import UpdateTransactionRequestObject, UpdateTransactionUseCase
 from app.use_cases.transaction.delete import DeleteTransactionRequestObject, DeleteTransactionUseCase
+from app.use_cases.transaction.export import ExportTransactionsRequestObject, ExportTransactionsUseCase
+from app.use_cases.transaction.bulk_import import ImportTransactionsRequestObject, ImportTransactionsUseCase
+from app.use_cases.transaction.batch import BatchTransactionsRequestObject, BatchTransactionsUseCase
 
 router = APIRouter()
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
 
-@router.get(
-    "/{transaction_id}",
-    dependencies=[Depends(get_current_active_user)],  # auth route
-    response_model=Transaction,
-)
-@response_decorator()
-def get_transaction(
-    transaction_id: str = Path(..., title="Transaction id"),
-    get_transaction_use_case: GetTransactionUseCase = Depends(GetTransactionUseCase),
+
+# declared before "/{transaction_id}" so "export" is not taken as an id
+@router.get("/export")
+def export_transactions(
+    current_user: UserModel = Depends(get_current_active_user),
+    export_transactions_use_case: ExportTransactionsUseCase = Depends(ExportTransactionsUseCase),
+    format: Annotated[ExportFormat, Query(title="Export format")] = ExportFormat.NDJSON,
+    type: Annotated[Union[Type, None], Query(title="Transaction Type")] = None,
+    category_id: Annotated[str, Query(title="Category Id")] = None,
+    date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
+    date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
 ):
-    req_object = GetTransactionRequestObject.builder(transaction_id=transaction_id)
-    response = get_transaction_use_case.execute(request_object=req_object)
-    return response
+    """Stream transactions of current user as ndjson or csv"""
+    req_object = ExportTransactionsRequestObject.builder(current_user=current_user, format=format, type=type,
+                                                         category_id=category_id, date_from=date_from,
+                                                         date_to=date_to)
+    response = export_transactions_use_case.execute(request_object=req_object)
+    if not response:
+        raise HTTPException(status_code=400, detail=response.message)
+    return StreamingResponse(
+        response.value,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=transactions.{format.value}"},
+    )
+
+
+if settings.MONGODB_ASYNC:
+
+    @router.get(
+        "/{transaction_id}",
+        dependencies=[Depends(get_current_active_user_async)],  # auth route
+        response_model=Transaction,
+    )
+    @response_decorator()
+    async def get_transaction(
+        transaction_id: str = Path(..., title="Transaction id"),
+        get_transaction_use_case: AsyncGetTransactionUseCase = Depends(get_async_get_transaction_use_case),
+    ):
+        req_object = GetTransactionRequestObject.builder(transaction_id=transaction_id)
+        response = await get_transaction_use_case.execute(request_object=req_object)
+        return response
+
+else:
+
+    @router.get(
+        "/{transaction_id}",
+        dependencies=[Depends(get_current_active_user)],  # auth route
+        response_model=Transaction,
+    )
+    @response_decorator()
+    def get_transaction(
+        transaction_id: str = Path(..., title="Transaction id"),
+        get_transaction_use_case: GetTransactionUseCase = Depends(GetTransactionUseCase),
+    ):
+        req_object = GetTransactionRequestObject.builder(transaction_id=transaction_id)
+        response = get_transaction_use_case.execute(request_object=req_object)
+        return response
 
 
 @router.post(
@@ -46,19 +122,73 @@ def create_transaction(
     return response
 
 
-@router.get("")
+if settings.MONGODB_ASYNC:
+
+    @router.get("")
+    @response_decorator()
+    async def get_list_transaction(
+        current_user: UserModel = Depends(get_current_active_user_async),
+        list_transactions_use_case: AsyncListTransactionsUseCase = Depends(get_async_list_transactions_use_case),
+        type: Annotated[Union[Type, None], Query(title="Transaction Type")] = None,
+        category_id: Annotated[str, Query(title="Category Id")] = None,
+        date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
+        date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
+        limit: Annotated[Union[int, None], Query(title="Page size, enable cursor pagination")] = None,
+        cursor: Annotated[Union[str, None], Query(title="Next cursor from previous page")] = None,
+    ):
+        req_object = ListTransactionsRequestObject.builder(current_user=current_user, type=type, category_id=category_id,
+                                                           date_from=date_from, date_to=date_to,
+                                                           limit=limit, cursor=cursor)
+        response = await list_transactions_use_case.execute(request_object=req_object)
+        return response
+
+else:
+
+    @router.get("")
+    @response_decorator()
+    def get_list_transaction(
+        current_user: UserModel = Depends(get_current_active_user),
+        list_transactions_use_case: ListTransactionsUseCase = Depends(ListTransactionsUseCase),
+        type: Annotated[Union[Type, None], Query(title="Transaction Type")] = None,
+        category_id: Annotated[str, Query(title="Category Id")] = None,
+        date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
+        date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
+        limit: Annotated[Union[int, None], Query(title="Page size, enable cursor pagination")] = None,
+        cursor: Annotated[Union[str, None], Query(title="Next cursor from previous page")] = None,
+    ):
+        req_object = ListTransactionsRequestObject.builder(current_user=current_user, type=type, category_id=category_id,
+                                                           date_from=date_from, date_to=date_to,
+                                                           limit=limit, cursor=cursor)
+        response = list_transactions_use_case.execute(request_object=req_object)
+        return response
+
+
+@router.post("/import", response_model=TransactionImportResult)
 @response_decorator()
-def get_list_transaction(
+def import_transactions(
+    file: UploadFile = File(..., title="Bank statement, csv or ofx"),
     current_user: UserModel = Depends(get_current_active_user),
-    list_transactions_use_case: ListTransactionsUseCase = Depends(ListTransactionsUseCase),
-    type: Annotated[Union[Type, None], Query(title="Transaction Type")] = None,
-    category_id: Annotated[str, Query(title="Category Id")] = None,
-    date_from: Annotated[Union[str, None], Query(title="From Date")] = None,
-    date_to: Annotated[Union[str, None], Query(title="To Date")] = None,
+    import_transactions_use_case: ImportTransactionsUseCase = Depends(ImportTransactionsUseCase),
+    format: Annotated[Union[StatementFormat, None], Query(title="Statement format, default from file name")] = None,
+    category_id: Annotated[Union[str, None], Query(title="Category of rows without one")] = None,
+):
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    req_object = ImportTransactionsRequestObject.builder(current_user=current_user, stream=stream,
+                                                         filename=file.filename, format=format,
+                                                         category_id=category_id)
+    response = import_transactions_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.post("/batch", response_model=List[TransactionBatchResult])
+@response_decorator()
+def batch_transactions(
+    payload: List[TransactionBatchOperation] = Body(..., title="Operations to apply"),
+    current_user: UserModel = Depends(get_current_active_user),
+    batch_transactions_use_case: BatchTransactionsUseCase = Depends(BatchTransactionsUseCase),
 ):
-    req_object = ListTransactionsRequestObject.builder(current_user=current_user, type=type, category_id=category_id,
-                                                       date_from=date_from, date_to=date_to)
-    response = list_transactions_use_case.execute(request_object=req_object)
+    req_object = BatchTransactionsRequestObject.builder(current_user=current_user, operations=payload)
+    response = batch_transactions_use_case.execute(request_object=req_object)
     return response
 
 
@@ -1,16 +1,29 @@
 from fastapi import APIRouter, Body, Depends, Path, Query
 from typing import Annotated, Union
 from app.domain.user.entity import User, UserInCreate, UserInDB, ManyUsersInResponse, UserInUpdate
-from app.infra.security.security_service import get_current_active_user, get_current_administrator
+from app.infra.security.security_service import (
+    get_current_active_user,
+    get_current_active_user_async,
+    get_current_administrator,
+    get_current_administrator_async,
+)
+from app.config import settings
 from app.shared.decorator import response_decorator
 from app.infra.database.models.user import User as UserModel
-from app.use_cases.user.list import ListUsersUseCase, ListUsersRequestObject
+from app.use_cases.user.list import (
+    ListUsersUseCase,
+    ListUsersRequestObject,
+    AsyncListUsersUseCase,
+    get_async_list_users_use_case,
+)
 from app.use_cases.user.update import UpdateUserUseCase, UpdateUserRequestObject
 from app.domain.shared.enum import UserRole
 
 from app.use_cases.user.get import (
     GetUserRequestObject,
     GetUserCase,
+    AsyncGetUserCase,
+    get_async_get_user_use_case,
 )
 from app.use_cases.user.create import (
     CreateUserRequestObject,
@@ -32,19 +45,37 @@ async def get_me(
     return User(**UserInDB.model_validate(current_user).model_dump())
 
 
-@router.get(
-    "/{user_id}",
-    dependencies=[Depends(get_current_active_user)],  # auth route
-    response_model=User,
-)
-@response_decorator()
-def get_user(
-    user_id: str = Path(..., title="User id"),
-    get_user_use_case: GetUserCase = Depends(GetUserCase),
-):
-    get_user_request_object = GetUserRequestObject.builder(user_id=user_id)
-    response = get_user_use_case.execute(request_object=get_user_request_object)
-    return response
+if settings.MONGODB_ASYNC:
+
+    @router.get(
+        "/{user_id}",
+        dependencies=[Depends(get_current_active_user_async)],  # auth route
+        response_model=User,
+    )
+    @response_decorator()
+    async def get_user(
+        user_id: str = Path(..., title="User id"),
+        get_user_use_case: AsyncGetUserCase = Depends(get_async_get_user_use_case),
+    ):
+        get_user_request_object = GetUserRequestObject.builder(user_id=user_id)
+        response = await get_user_use_case.execute(request_object=get_user_request_object)
+        return response
+
+else:
+
+    @router.get(
+        "/{user_id}",
+        dependencies=[Depends(get_current_active_user)],  # auth route
+        response_model=User,
+    )
+    @response_decorator()
+    def get_user(
+        user_id: str = Path(..., title="User id"),
+        get_user_use_case: GetUserCase = Depends(GetUserCase),
+    ):
+        get_user_request_object = GetUserRequestObject.builder(user_id=user_id)
+        response = get_user_use_case.execute(request_object=get_user_request_object)
+        return response
 
 
 @router.post(
@@ -62,32 +93,66 @@ def create_user(
     return response
 
 
-@router.get("", response_model=ManyUsersInResponse)
-@response_decorator()
-def get_list_users(
-    current_user: UserModel = Depends(get_current_administrator),
-    list_users_use_case: ListUsersUseCase = Depends(ListUsersUseCase),
-    role: Annotated[UserRole, Query(title="User role")] = UserRole.USER,
-    email: Annotated[Union[str, None], Query(title="Email")] = None,
-):
-    req_object = ListUsersRequestObject.builder(current_user=current_user, role=role, email=email)
-    response = list_users_use_case.execute(request_object=req_object)
-    return response
+if settings.MONGODB_ASYNC:
 
+    @router.get("", response_model=ManyUsersInResponse)
+    @response_decorator()
+    async def get_list_users(
+        current_user: UserModel = Depends(get_current_administrator_async),
+        list_users_use_case: AsyncListUsersUseCase = Depends(get_async_list_users_use_case),
+        role: Annotated[UserRole, Query(title="User role")] = UserRole.USER,
+        email: Annotated[Union[str, None], Query(title="Email")] = None,
+    ):
+        req_object = ListUsersRequestObject.builder(current_user=current_user, role=role, email=email)
+        response = await list_users_use_case.execute(request_object=req_object)
+        return response
 
-@router.get(
-    "/admin/{id}",
-    dependencies=[Depends(get_current_administrator)],  # auth route
-    response_model=User,
-)
-@response_decorator()
-def admin_get_user(
-    id: str = Path(..., title="User id"),
-    get_user_use_case: GetUserCase = Depends(GetUserCase),
-):
-    req_object = GetUserRequestObject.builder(user_id=id)
-    response = get_user_use_case.execute(request_object=req_object)
-    return response
+else:
+
+    @router.get("", response_model=ManyUsersInResponse)
+    @response_decorator()
+    def get_list_users(
+        current_user: UserModel = Depends(get_current_administrator),
+        list_users_use_case: ListUsersUseCase = Depends(ListUsersUseCase),
+        role: Annotated[UserRole, Query(title="User role")] = UserRole.USER,
+        email: Annotated[Union[str, None], Query(title="Email")] = None,
+    ):
+        req_object = ListUsersRequestObject.builder(current_user=current_user, role=role, email=email)
+        response = list_users_use_case.execute(request_object=req_object)
+        return response
+
+
+if settings.MONGODB_ASYNC:
+
+    @router.get(
+        "/admin/{id}",
+        dependencies=[Depends(get_current_administrator_async)],  # auth route
+        response_model=User,
+    )
+    @response_decorator()
+    async def admin_get_user(
+        id: str = Path(..., title="User id"),
+        get_user_use_case: AsyncGetUserCase = Depends(get_async_get_user_use_case),
+    ):
+        req_object = GetUserRequestObject.builder(user_id=id)
+        response = await get_user_use_case.execute(request_object=req_object)
+        return response
+
+else:
+
+    @router.get(
+        "/admin/{id}",
+        dependencies=[Depends(get_current_administrator)],  # auth route
+        response_model=User,
+    )
+    @response_decorator()
+    def admin_get_user(
+        id: str = Path(..., title="User id"),
+        get_user_use_case: GetUserCase = Depends(GetUserCase),
+    ):
+        req_object = GetUserRequestObject.builder(user_id=id)
+        response = get_user_use_case.execute(request_object=req_object)
+        return response
 
 
 @router.put(
@@ -0,0 +1,201 @@
+"""ASGI middlewares"""
+import random
+import threading
+import uuid
+from time import perf_counter, monotonic
+from typing import Dict, List
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from loguru import logger as _logger
+
+from app.infra.logging import get_logger
+from app.infra.metrics import http_request_duration, http_requests, http_requests_in_flight
+from app.infra.profiling import profile_store
+from app.infra.profiling.sampler import StackSampler
+from app.infra.security.security_service import get_administrator_from_token
+from app.shared.timing import RequestTiming, request_timing
+
+logger = get_logger()
+
+
+def route_name(scope: Scope) -> str:
+    """Route template matched by the router, raw paths would explode the number of keys"""
+    route = scope.get("route")
+    return route.path if route else "unmatched"
+
+
+class RouteTimings:
+    """Per route aggregates, logged and reset every log_interval seconds"""
+
+    def __init__(self, log_interval: float):
+        self.log_interval = log_interval
+        self._routes: Dict[str, List[float]] = {}
+        self._since = monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, route: str, total: float, timing: RequestTiming) -> None:
+        with self._lock:
+            stats = self._routes.setdefault(route, [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += total
+            stats[2] += timing.db
+            stats[3] += timing.db_commands
+            if monotonic() - self._since < self.log_interval:
+                return
+            routes, self._routes, self._since = self._routes, {}, monotonic()
+
+        for route, (count, total, db, commands) in sorted(routes.items(), key=lambda item: -item[1][1]):
+            logger.info(
+                "Route timing {route}: {count} requests, avg {avg:.1f} ms, db {db:.1f} ms, {commands:.1f} commands",
+                route=route,
+                count=count,
+                avg=total / count,
+                db=db / count,
+                commands=commands / count,
+            )
+
+
+class RequestContextMiddleware:
+    """
+    Bind the request id (X-Request-ID header, generated when missing) and method to every log
+    record written while serving the request, and return the id in the response
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        with _logger.contextualize(request_id=request_id, method=scope["method"]):
+            await self.app(scope, receive, send_with_id)
+
+
+class ServerTimingMiddleware:
+    """
+    Track auth, db and serialization time of each request and return them in a Server-Timing header
+    """
+
+    def __init__(self, app: ASGIApp, log_interval: float = 60):
+        self.app = app
+        self.routes = RouteTimings(log_interval)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = request_timing.set(timing)
+        start = perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.header((perf_counter() - start) * 1000))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_timing.reset(token)
+            name = "{} {}".format(scope["method"], route_name(scope))
+            self.routes.record(name, (perf_counter() - start) * 1000, timing)
+
+
+class MetricsMiddleware:
+    """
+    Request count by status, latency histogram and in flight gauge per route, exposed on /metrics
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec(method)
+            route = route_name(scope)
+            http_requests.inc(method, route, str(status))
+            http_request_duration.observe(perf_counter() - start, method, route)
+
+
+class ProfilerMiddleware:
+    """
+    Run a sampling profiler around admin requests sending `X-Profile: 1`, and around a `sample_rate`
+    fraction of all requests. Profiles are kept in profile_store keyed by route, the response carries
+    their id in X-Profile-Id.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0, interval: float = 0.005):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval
+
+    async def _requested(self, headers: Headers) -> bool:
+        if headers.get("x-profile") != "1":
+            return False
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        return await run_in_threadpool(get_administrator_from_token, token) is not None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not (sampled or await self._requested(Headers(scope=scope))):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profile_store.new_id()
+        status = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        sampler = StackSampler(self.interval).start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            sampler.stop()
+            profile_store.add(profile_id, "{} {}".format(scope["method"], route_name(scope)), sampler, status)
@@ -1,6 +1,6 @@
 # import logging
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from app.interfaces.rest.api_v1.api import api_router
@@ -9,6 +9,15 @@ from app.interfaces.rest.error_handler import (
     ApplicationLevelException,
 )
 from app.infra import database
+from app.infra.security.google_keys import google_key_set
+from app.interfaces.rest.middleware import (
+    MetricsMiddleware,
+    ProfilerMiddleware,
+    RequestContextMiddleware,
+    ServerTimingMiddleware,
+)
+from app.infra.metrics import registry
+from app.infra.metrics.collectors import register_collectors
 
 
 IS_PRODUCTION = settings.ENVIRONMENT == "production"
@@ -32,6 +41,8 @@ app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 @app.on_event("startup")
 def startup():
     database.connect()
+    if settings.ENVIRONMENT != "testing":
+        google_key_set.start()
 
 
 # app shutdown handler
@@ -63,5 +74,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.REQUEST_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware, log_interval=settings.REQUEST_TIMING_LOG_INTERVAL_SECONDS)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_collectors()
+
+    # async so the threadpool collector runs inside the event loop
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+if settings.PROFILING_ENABLED or (settings.PROFILING_ENABLED is None and not IS_PRODUCTION):
+    app.add_middleware(
+        ProfilerMiddleware,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        interval=settings.PROFILING_INTERVAL_MS / 1000,
+    )
+
+app.add_middleware(RequestContextMiddleware)
+
 # set app router
 app.include_router(api_router)
@@ -1,13 +1,43 @@
 import functools
+import inspect
 import time
 import random
 import logging
+from typing import Any, Iterator, List
 from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
-from starlette.responses import JSONResponse
+from pydantic_core import PydanticSerializationError, to_json
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from app.config import settings
 from app.shared.response_object import ResponseSuccess, ResponseFailure
+from app.shared.timing import timed
 from app.interfaces.rest.error_handler import ApplicationLevelException
 
+STREAM_CHUNK_SIZE = 500
+
+
+def _iter_json_list(items: List[Any], first_chunk: bytes) -> Iterator[bytes]:
+    # chunks are serialized as json arrays, the brackets are stripped and the pieces joined by commas
+    yield b"[" + first_chunk[1:-1]
+    for start in range(STREAM_CHUNK_SIZE, len(items), STREAM_CHUNK_SIZE):
+        yield b"," + to_json(items[start : start + STREAM_CHUNK_SIZE])[1:-1]
+    yield b"]"
+
+
+def json_response(content: Any) -> Response:
+    """Serialize content straight to json bytes with pydantic-core
+
+    Long lists are streamed in chunks of STREAM_CHUNK_SIZE items. Content pydantic-core
+    cannot serialize (e.g. raw ObjectId) goes through jsonable_encoder instead.
+    """
+    try:
+        if isinstance(content, list) and len(content) > settings.RESPONSE_STREAM_THRESHOLD:
+            first_chunk = to_json(content[:STREAM_CHUNK_SIZE])
+            return StreamingResponse(_iter_json_list(content, first_chunk), media_type="application/json")
+        return Response(content=to_json(content), media_type="application/json")
+    except PydanticSerializationError:
+        return JSONResponse(content=jsonable_encoder(content, by_alias=True))
+
 
 def response_decorator():
     """Handle data response for resource
@@ -18,44 +48,55 @@ def response_decorator():
         [type] -- [description]
     """
 
+    def handle(response):
+        if isinstance(response, ResponseSuccess):
+            # handle response success object
+            val = response.value
+            with timed("serialize"):
+                return json_response(val)
+            # return response.value
+        elif isinstance(response, ResponseFailure):
+            # handle response failure error
+            if response.type == ResponseFailure.RESOURCE_ERROR:
+                # Client / resource error
+                raise ApplicationLevelException(msg=response.message)
+            if response.type == ResponseFailure.PARAMETERS_ERROR:
+                raise HTTPException(
+                    status_code=400,
+                    detail=response.message,
+                )
+            elif response.type == ResponseFailure.RESOURCE_NOT_FOUND:
+                # Item not found
+                raise HTTPException(
+                    status_code=404,
+                    detail=response.message,
+                )
+            elif response.type == ResponseFailure.AUTH_ERROR:
+                # Authentication error status code
+                raise HTTPException(
+                    status_code=401,
+                    detail=response.message,
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            else:
+                # System error http status code
+                raise HTTPException(status_code=500, detail=response.message)
+        else:
+            with timed("serialize"):
+                return json_response(response)
+
     def decorator(f):
+        if inspect.iscoroutinefunction(f):
+
+            @functools.wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return handle(await f(*args, **kwargs))
+
+            return async_wrapper
+
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            response = f(*args, **kwargs)
-
-            if isinstance(response, ResponseSuccess):
-                # handle response success object
-                val = response.value
-                return JSONResponse(content=jsonable_encoder(val, by_alias=True))
-                # return response.value
-            elif isinstance(response, ResponseFailure):
-                # handle response failure error
-                if response.type == ResponseFailure.RESOURCE_ERROR:
-                    # Client / resource error
-                    raise ApplicationLevelException(msg=response.message)
-                if response.type == ResponseFailure.PARAMETERS_ERROR:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=response.message,
-                    )
-                elif response.type == ResponseFailure.RESOURCE_NOT_FOUND:
-                    # Item not found
-                    raise HTTPException(
-                        status_code=404,
-                        detail=response.message,
-                    )
-                elif response.type == ResponseFailure.AUTH_ERROR:
-                    # Authentication error status code
-                    raise HTTPException(
-                        status_code=401,
-                        detail=response.message,
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                else:
-                    # System error http status code
-                    raise HTTPException(status_code=500, detail=response.message)
-            else:
-                return JSONResponse(content=jsonable_encoder(response))
+            return handle(f(*args, **kwargs))
 
         return wrapper
 
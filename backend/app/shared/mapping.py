@@ -0,0 +1,131 @@
+"""Mapping of stored data (documents, rows, raw dicts) to outbound domain entities in a single pass"""
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple, Type, TypeVar, get_args
+
+from mongoengine import Document
+from pydantic import BaseModel
+
+from app.infra.database.rows import Row
+
+E = TypeVar("E", bound=BaseModel)
+
+_set = object.__setattr__
+
+
+class _Plan:
+    """Per entity class facts needed to map a source, computed once"""
+
+    __slots__ = ("fields", "plain", "nested", "enums", "required", "not_null", "defaults", "factories", "str_id")
+
+    def __init__(self, entity_cls: Type[BaseModel]):
+        self.fields: Tuple[str, ...] = tuple(entity_cls.model_fields)
+        self.nested: Dict[str, Type[BaseModel]] = {}
+        self.enums: Dict[str, Type[Enum]] = {}
+        self.defaults: Dict[str, Any] = {}
+        self.factories: Dict[str, Any] = {}
+        required, not_null = [], set()
+        for name, field in entity_cls.model_fields.items():
+            args = (field.annotation, *get_args(field.annotation))
+            # fields typed as another model or an enum, also inside Optional / Union
+            for arg in args:
+                if isinstance(arg, type) and issubclass(arg, BaseModel):
+                    self.nested[name] = arg
+                elif isinstance(arg, type) and issubclass(arg, Enum):
+                    self.enums[name] = arg
+            if type(None) not in args:
+                not_null.add(name)
+            if field.default_factory is not None:
+                self.factories[name] = field.default_factory
+            elif not field.is_required():
+                self.defaults[name] = field.default
+            elif name in not_null:
+                required.append(name)
+        # fields a trusted source must carry, otherwise it goes through validation
+        self.required: Tuple[str, ...] = tuple(required)
+        self.not_null = frozenset(not_null)
+        self.plain: Tuple[str, ...] = tuple(name for name in self.fields if name not in self.nested)
+        # PydanticObjectId ids keep their ObjectId, plain str ids are stringified
+        self.str_id = "id" in entity_cls.model_fields and entity_cls.model_fields["id"].annotation is str
+
+
+@lru_cache(maxsize=None)
+def _plan(entity_cls: Type[BaseModel]) -> _Plan:
+    return _Plan(entity_cls)
+
+
+@lru_cache(maxsize=None)
+def _row_reader(entity_cls: Type[BaseModel], row_cls: Type[Row]) -> Tuple[Tuple[str, ...], attrgetter]:
+    names = tuple(name for name in _plan(entity_cls).fields if name in row_cls.__slots__)
+    return names, attrgetter(*names)
+
+
+def _read(entity_cls: Type[BaseModel], plan: _Plan, source: Any) -> Dict[str, Any]:
+    if isinstance(source, Row):
+        names, getter = _row_reader(entity_cls, type(source))
+        values = getter(source)
+        data = dict(zip(names, values)) if len(names) > 1 else {names[0]: values}
+    elif isinstance(source, dict):
+        data = {name: source[name] for name in plan.fields if name in source}
+        if "_id" in source and "id" in plan.fields:
+            data["id"] = source["_id"]
+    elif isinstance(source, Document):
+        # plain values straight from the document data, attribute access only for nested
+        # entities so references the entity does not expose (e.g. transaction.user) are never dereferenced
+        raw = source._data
+        data = {name: raw[name] for name in plan.plain if name in raw}
+        for name in plan.nested:
+            data[name] = getattr(source, name, None)
+    else:
+        # any other object with attributes
+        data = {name: getattr(source, name) for name in plan.fields if hasattr(source, name)}
+    if plan.str_id and data.get("id") is not None:
+        data["id"] = str(data["id"])
+    return data
+
+
+def _construct(entity_cls: Type[E], plan: _Plan, data: Dict[str, Any]) -> E:
+    # same result as model_construct, without its per call bookkeeping
+    fields_set = set(data)
+    # rows carry None for fields absent from the document, the entity default applies then
+    for name, default in plan.defaults.items():
+        if data.get(name) is None and (name not in data or name in plan.not_null):
+            data[name] = default
+    for name, factory in plan.factories.items():
+        if data.get(name) is None and (name not in data or name in plan.not_null):
+            data[name] = factory()
+    for name, enum_cls in plan.enums.items():
+        value = data.get(name)
+        if value is not None and not isinstance(value, enum_cls):
+            data[name] = enum_cls(value)
+    entity = entity_cls.__new__(entity_cls)
+    _set(entity, "__dict__", data)
+    _set(entity, "__pydantic_fields_set__", fields_set)
+    _set(entity, "__pydantic_extra__", None)
+    _set(entity, "__pydantic_private__", None)
+    return entity
+
+
+def to_entity(entity_cls: Type[E], source: Any, trusted: bool = False) -> E:
+    """
+    Build an entity from a mongoengine document, a Row, a raw mongo dict or any object with attributes
+    :param entity_cls: outbound entity class, e.g. Transaction
+    :param source:
+    :param trusted: skip validation, for data read back from our own database. A source missing a required
+        field is still validated, so it fails the same way as untrusted data
+    :return: entity instance
+    """
+    plan = _plan(entity_cls)
+    data = _read(entity_cls, plan, source)
+    for name, nested_cls in plan.nested.items():
+        value = data.get(name)
+        if value is not None and not isinstance(value, nested_cls):
+            data[name] = to_entity(nested_cls, value, trusted=trusted)
+    if trusted and all(data.get(name) is not None for name in plan.required):
+        return _construct(entity_cls, plan, data)
+    return entity_cls.model_validate(data)
+
+
+def to_entities(entity_cls: Type[E], sources: Iterable[Any], trusted: bool = False) -> List[E]:
+    return [to_entity(entity_cls, source, trusted=trusted) for source in sources]
@@ -0,0 +1,58 @@
+"""Per-request timing breakdown, filled by the db command listener, auth and serialization"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, Optional
+
+
+class RequestTiming:
+    """
+    Milliseconds spent per phase of the current request, and the number of db commands.
+    Auth includes its own db lookups.
+    """
+
+    __slots__ = ("auth", "db", "serialize", "db_commands", "_lock")
+
+    def __init__(self):
+        self.auth = 0.0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.db_commands = 0
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, ms: float) -> None:
+        with self._lock:
+            setattr(self, phase, getattr(self, phase) + ms)
+
+    def add_command(self, ms: float) -> None:
+        with self._lock:
+            self.db += ms
+            self.db_commands += 1
+
+    def header(self, total: float) -> str:
+        """Server-Timing header value"""
+        return 'auth;dur={:.1f}, db;dur={:.1f};desc="{} commands", serialize;dur={:.1f}, total;dur={:.1f}'.format(
+            self.auth, self.db, self.db_commands, self.serialize, total
+        )
+
+
+# set by the timing middleware for the lifetime of each http request
+request_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Add the time spent in the block to a phase of the current request, no-op outside requests
+    :param phase: auth or serialize
+    """
+    timing = request_timing.get()
+    if timing is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, (perf_counter() - start) * 1000)
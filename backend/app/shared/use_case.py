@@ -1,9 +1,11 @@
 """base use case class module"""
 import traceback
+from time import perf_counter
 from fastapi import HTTPException
 from app.shared import response_object as res, request_object as req
 
 from app.infra.logging import get_logger
+from app.infra.metrics import use_case_duration
 from app.config import settings
 
 logger = get_logger()
@@ -11,6 +13,11 @@ logger = get_logger()
 IS_PRODUCTION = settings.ENVIRONMENT == "production"
 
 
+def _observe(use_case, start: float, result) -> None:
+    outcome = "failure" if isinstance(result, res.ResponseFailure) else "success"
+    use_case_duration.observe(perf_counter() - start, type(use_case).__name__, outcome)
+
+
 class UseCase:
     """
     Base use case class
@@ -26,8 +33,10 @@ class UseCase:
 
         if not request_object:
             return res.ResponseFailure.build_from_invalid_request_object(request_object)
+        start = perf_counter()
         try:
             result = self.process_request(request_object)
+            _observe(self, start, result)
             # # default return success True
             # if not result:
             #     result = dict(
@@ -39,6 +48,7 @@ class UseCase:
                 return result
             return res.ResponseSuccess(result)
         except Exception as exc:
+            use_case_duration.observe(perf_counter() - start, type(self).__name__, "error")
             print(traceback.format_exc())
             if IS_PRODUCTION:
                 logger.exception("Usecase error: {error}", error=exc, payload=exc)
@@ -52,3 +62,41 @@ class UseCase:
     def process_request(self, request_object):
         """abstract process_request method"""
         raise NotImplementedError("process_request() not implemented by UseCase class")
+
+
+class AsyncUseCase:
+    """
+    Base class of use cases running on the async repositories, same contract as UseCase
+    """
+
+    async def execute(self, request_object: req.RequestObject) -> res.ResponseObject:
+        """execute use case
+
+        return check request object valid and process request
+        :param request_object:
+        :return: Any
+        """
+
+        if not request_object:
+            return res.ResponseFailure.build_from_invalid_request_object(request_object)
+        start = perf_counter()
+        try:
+            result = await self.process_request(request_object)
+            _observe(self, start, result)
+
+            # ensure return response success / failure object
+            if not (result or isinstance(result, res.ResponseSuccess)):
+                return result
+            return res.ResponseSuccess(result)
+        except Exception as exc:
+            use_case_duration.observe(perf_counter() - start, type(self).__name__, "error")
+            if IS_PRODUCTION:
+                logger.exception("Usecase error: {error}", error=exc, payload=exc)
+            if isinstance(exc, HTTPException):
+                raise exc
+
+            return res.ResponseFailure.build_system_error("{}".format(exc))
+
+    async def process_request(self, request_object):
+        """abstract process_request method"""
+        raise NotImplementedError("process_request() not implemented by AsyncUseCase class")
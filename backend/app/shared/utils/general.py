@@ -1,7 +1,11 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import Optional, Union, Tuple
+import base64
 import calendar
+import json
+
+from bson import ObjectId
 
 
 class ExtendedEnum(Enum):
@@ -31,6 +35,11 @@ def last_day_of_month(year: int, month: int) -> int:
     return calendar.monthrange(year, month)[1]
 
 
+def add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    return year, month + 1
+
+
 def get_quarter(quarter: int, year: int) -> Tuple[date, date]:
     first_month_of_quarter = 3 * quarter - 2
     last_month_of_quarter = 3 * quarter
@@ -48,3 +57,28 @@ def get_month_list(dates):
         mlist.append(datetime(y, m + 1, start.day))
         # mlist.append(calendar.monthrange(y, m+1))
     return mlist
+
+
+def encode_cursor(value: datetime, id: Union[str, ObjectId]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor
+    :param value: date of the last row
+    :param id: id of the last row
+    :return: url safe string
+    """
+    raw = json.dumps({"d": value.isoformat(), "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, ObjectId]]:
+    """
+    Decode a cursor built by encode_cursor, return None if it is malformed
+    :param cursor:
+    :return: (date, id) of the last row of the previous page
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["d"]), ObjectId(data["i"])
+    except Exception:
+        return None
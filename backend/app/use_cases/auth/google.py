@@ -1,14 +1,16 @@
-import httpx
 from typing import Optional
 from fastapi import Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 from app.domain.user.entity import User, UserInDB, UserInCreate
 from app.domain.auth.entity import AuthInfo, AuthInfoInResponse, Token
 from app.shared import response_object, use_case, request_object
+from app.shared.mapping import to_entity
 from app.infra.user.user_repository import UserRepository
+from app.infra.security.google_keys import google_key_set
 from app.infra.security.security_service import (
     SecurityService,
     create_access_token,
-    get_password_hash,
+    get_password_hash_async,
     generate_random_password,
 )
 from app.domain.shared.enum import AuthGrantType, UserRole
@@ -30,7 +32,7 @@ class GoogleRequestObject(request_object.ValidRequestObject):
         return GoogleRequestObject(id_token=id_token)
 
 
-class GoogleAuthUseCase(use_case.UseCase):
+class GoogleAuthUseCase(use_case.AsyncUseCase):
     def __init__(
         self,
         user_repository: UserRepository = Depends(UserRepository),
@@ -41,18 +43,18 @@ class GoogleAuthUseCase(use_case.UseCase):
 
     def fetch_user_info(self, id_token: str) -> Optional[AuthInfo]:
         try:
-            resp = httpx.get(settings.GOOGLE_TOKEN_INFO, params={"id_token": id_token})
-            resp.raise_for_status()
-            return AuthInfo(**resp.json())
+            claims = google_key_set.verify(id_token, audience=settings.GOOGLE_CLIENT_ID)
+            return AuthInfo(**claims)
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    def process_request(self, req_object: GoogleRequestObject):
-        user_data: Optional[AuthInfo] = self.fetch_user_info(id_token=req_object.id_token)
+    async def process_request(self, req_object: GoogleRequestObject):
+        # blocking calls go to the threadpool, the password hash to the hasher pool
+        user_data: Optional[AuthInfo] = await run_in_threadpool(self.fetch_user_info, id_token=req_object.id_token)
         if user_data.email is None:
             return response_object.ResponseFailure.build_parameters_error(message="Email is empty")
 
-        user: UserInDB = self.security_service.get_user(email=user_data.email)
+        user: UserInDB = await run_in_threadpool(self.security_service.get_user, email=user_data.email)
         if not user:
             # Create new user with email
             user_in: UserInCreate = UserInCreate(
@@ -64,9 +66,9 @@ class GoogleAuthUseCase(use_case.UseCase):
             )
             obj_in: UserInDB = UserInDB(
                 **user_in.model_dump(),
-                hashed_password=get_password_hash(password=generate_random_password()),
+                hashed_password=await get_password_hash_async(password=generate_random_password()),
             )
-            user: UserInDB = self.user_repository.create(user=obj_in)
+            user: UserInDB = await run_in_threadpool(self.user_repository.create, user=obj_in)
 
         # create access token from user data
         access_token = create_access_token(
@@ -78,5 +80,5 @@ class GoogleAuthUseCase(use_case.UseCase):
         )
         return AuthInfoInResponse(
             token=Token(access_token=access_token, token_type="bearer"),
-            user=User(**UserInDB.model_validate(user).model_dump()),
+            user=to_entity(User, user, trusted=True),
         )
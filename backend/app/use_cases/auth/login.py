@@ -1,7 +1,8 @@
 from fastapi import Depends
 from pydantic import ValidationError
-from app.domain.user.entity import User, UserInDB
+from app.domain.user.entity import User
 from app.shared import request_object, response_object, use_case
+from app.shared.mapping import to_entity
 from app.domain.auth.entity import AuthInfoInResponse, Token, UserInLogin
 from app.infra.user.user_repository import UserRepository
 from app.infra.security.security_service import (
@@ -33,7 +34,7 @@ class LoginRequestObject(request_object.ValidRequestObject):
         return LoginRequestObject(login_info=login_info)
 
 
-class LoginUseCase(use_case.UseCase):
+class LoginUseCase(use_case.AsyncUseCase):
     def __init__(
         self,
         user_repository: UserRepository = Depends(UserRepository),
@@ -42,9 +43,9 @@ class LoginUseCase(use_case.UseCase):
         self.user_repository = user_repository
         self.security_service = security_service
 
-    def process_request(self, req_object: LoginRequestObject):
+    async def process_request(self, req_object: LoginRequestObject):
         # authenticate user with auth info
-        user: UserModel = self.security_service.authenticate_user(
+        user: UserModel = await self.security_service.authenticate_user(
             email=req_object.login_info.email,
             password=req_object.login_info.password,
         )
@@ -61,5 +62,5 @@ class LoginUseCase(use_case.UseCase):
         )
         return AuthInfoInResponse(
             token=Token(access_token=access_token, token_type="bearer"),
-            user=User(**UserInDB.model_validate(user).model_dump()),
+            user=to_entity(User, user, trusted=True),
         )
@@ -1,8 +1,11 @@
 from fastapi import Depends
 from typing import Optional
 from app.shared import request_object, response_object, use_case
-from app.domain.category.entity import Category, CategoryInDB
+from app.shared.mapping import to_entity
+from app.domain.category.entity import Category
 from app.infra.category.category_repository import CategoryRepository
+from app.infra.category.async_category_repository import AsyncCategoryRepository, get_async_category_repository
+from app.infra.database.rows import CategoryRow
 from app.infra.database.models.category import Category as CategoryModel
 
 
@@ -31,4 +34,22 @@ class GetCategoryUseCase(use_case.UseCase):
         if not category:
             return response_object.ResponseFailure.build_not_found_error(message="Category does not exist.")
 
-        return Category(**CategoryInDB.model_validate(category).model_dump())
+        return to_entity(Category, category, trusted=True)
+
+
+class AsyncGetCategoryUseCase(use_case.AsyncUseCase):
+    def __init__(self, category_repository: AsyncCategoryRepository = Depends(get_async_category_repository)):
+        self.category_repository = category_repository
+
+    async def process_request(self, req_object: GetCategoryRequestObject):
+        category: Optional[CategoryRow] = await self.category_repository.get_by_id(id=req_object.category_id)
+        if not category:
+            return response_object.ResponseFailure.build_not_found_error(message="Category does not exist.")
+
+        return to_entity(Category, category, trusted=True)
+
+
+async def get_async_get_category_use_case(
+    category_repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+) -> AsyncGetCategoryUseCase:
+    return AsyncGetCategoryUseCase(category_repository=category_repository)
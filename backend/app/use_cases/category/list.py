@@ -3,10 +3,12 @@ import math
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case
+from app.shared.mapping import to_entities
 from app.domain.user.entity import User
-from app.domain.category.entity import Category, CategoryInDB
-from app.infra.database.models.category import Category as CategoryModel
+from app.domain.category.entity import Category
+from app.infra.database.rows import CategoryRow
 from app.infra.category.category_repository import CategoryRepository
+from app.infra.category.async_category_repository import AsyncCategoryRepository, get_async_category_repository
 from app.domain.shared.enum import Type
 
 
@@ -40,12 +42,35 @@ class ListCategoriesUseCase(use_case.UseCase):
 
     def process_request(self, req_object: ListCategoriesRequestObject):
 
-        categories: List[CategoryModel] = self.category_repository.list(
+        categories: List[CategoryRow] = self.category_repository.list(
             user=req_object.current_user.id,
             type=req_object.type,
             name=req_object.name,
             note=req_object.note,
         )
 
-        data = [Category(**CategoryInDB.model_validate(model).model_dump()) for model in categories]
+        data = to_entities(Category, categories, trusted=True)
         return data
+
+
+class AsyncListCategoriesUseCase(use_case.AsyncUseCase):
+    def __init__(self, category_repository: AsyncCategoryRepository = Depends(get_async_category_repository)):
+        self.category_repository = category_repository
+
+    async def process_request(self, req_object: ListCategoriesRequestObject):
+
+        categories: List[CategoryRow] = await self.category_repository.list(
+            user=req_object.current_user.id,
+            type=req_object.type,
+            name=req_object.name,
+            note=req_object.note,
+        )
+
+        data = to_entities(Category, categories, trusted=True)
+        return data
+
+
+async def get_async_list_categories_use_case(
+    category_repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+) -> AsyncListCategoriesUseCase:
+    return AsyncListCategoriesUseCase(category_repository=category_repository)
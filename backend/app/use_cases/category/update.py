@@ -2,8 +2,9 @@ from typing import Optional
 from fastapi import Depends
 from app.infra.database.models.category import Category as CategoryModel
 from app.shared import request_object, use_case, response_object
+from app.shared.mapping import to_entity
 
-from app.domain.category.entity import CategoryInUpdate, CategoryInDB, Category
+from app.domain.category.entity import CategoryInUpdate, Category
 from app.infra.category.category_repository import CategoryRepository
 
 
@@ -38,4 +39,4 @@ class UpdateCategoryUseCase(use_case.UseCase):
 
         self.category_repository.update(id=category.id, data=req_object.obj_in)
         category.reload()
-        return Category(**CategoryInDB.model_validate(category).model_dump())
+        return to_entity(Category, category, trusted=True)
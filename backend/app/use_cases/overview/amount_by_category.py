@@ -0,0 +1,56 @@
+from typing import Optional
+from fastapi import Depends
+from app.shared import request_object, use_case
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type
+from app.domain.overview.entity import AmountByCategory
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.use_cases.overview.date_range import add_date_range_errors
+
+
+class AmountByCategoryRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_user: User, type: Type, date_from: str, date_to: str):
+        self.current_user = current_user
+        self.type = type
+        self.date_from = date_from
+        self.date_to = date_to
+
+    @classmethod
+    def builder(
+        cls,
+        current_user: User,
+        type: Optional[Type] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        add_date_range_errors(invalid_req, date_from, date_to)
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return AmountByCategoryRequestObject(current_user=current_user, type=type, date_from=date_from,
+                                             date_to=date_to)
+
+
+class AmountByCategoryUseCase(use_case.UseCase):
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository)):
+        self.transaction_repository = transaction_repository
+
+    def process_request(self, req_object: AmountByCategoryRequestObject):
+        groups = self.transaction_repository.sum_by(
+            field="category",
+            user=req_object.current_user.id,
+            type=req_object.type,
+            date_from=req_object.date_from,
+            date_to=req_object.date_to,
+        )
+        categories = self.transaction_repository.categories_by_id({group["_id"] for group in groups if group["_id"]})
+        return [
+            AmountByCategory(
+                category=categories.get(group["_id"], {"id": group["_id"]}) if group["_id"] else None,
+                amount=group["amount"],
+                count=group["count"],
+            )
+            for group in groups
+        ]
@@ -0,0 +1,53 @@
+from typing import Optional
+from fastapi import Depends
+from app.shared import request_object, use_case
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type
+from app.domain.overview.entity import AmountByType
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.use_cases.overview.date_range import add_date_range_errors
+
+
+class AmountByTypeRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_user: User, date_from: str, date_to: str):
+        self.current_user = current_user
+        self.date_from = date_from
+        self.date_to = date_to
+
+    @classmethod
+    def builder(
+        cls,
+        current_user: User,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        add_date_range_errors(invalid_req, date_from, date_to)
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return AmountByTypeRequestObject(current_user=current_user, date_from=date_from, date_to=date_to)
+
+
+class AmountByTypeUseCase(use_case.UseCase):
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository)):
+        self.transaction_repository = transaction_repository
+
+    def process_request(self, req_object: AmountByTypeRequestObject):
+        groups = self.transaction_repository.sum_by(
+            field="type",
+            user=req_object.current_user.id,
+            date_from=req_object.date_from,
+            date_to=req_object.date_to,
+        )
+        totals = {group["_id"]: group for group in groups}
+        # every type is returned, with zero when there is no transaction of that type
+        return [
+            AmountByType(
+                type=type,
+                amount=totals.get(type.value, {}).get("amount", 0),
+                count=totals.get(type.value, {}).get("count", 0),
+            )
+            for type in Type
+        ]
@@ -0,0 +1,28 @@
+"""Validation of the optional date_from / date_to pair of the overview requests"""
+from typing import Optional
+
+from app.shared import request_object
+from app.shared.utils.general import date2datetime
+
+
+def add_date_range_errors(
+    invalid_req: request_object.InvalidRequestObject, date_from: Optional[str], date_to: Optional[str]
+) -> None:
+    """
+    Both dates or none, as YYYY-MM-DD, date_from not after date_to
+    :param invalid_req: errors are added to it
+    :param date_from:
+    :param date_to:
+    :return: None
+    """
+    if bool(date_from) != bool(date_to):
+        invalid_req.add_error("date_from", "date_from and date_to must be given together")
+        return
+    parsed = {}
+    for name, value in (("date_from", date_from), ("date_to", date_to)):
+        try:
+            parsed[name] = date2datetime(value)
+        except (TypeError, ValueError):
+            invalid_req.add_error(name, "Invalid date, expected YYYY-MM-DD")
+    if parsed.get("date_from") and parsed.get("date_to") and parsed["date_from"] > parsed["date_to"]:
+        invalid_req.add_error("date_from", "date_from must not be after date_to")
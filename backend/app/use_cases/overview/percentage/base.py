@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from typing import Optional, List, Tuple, Dict
+from fastapi import Depends
+from app.shared import request_object, use_case
+from app.shared.utils.general import last_day_of_month
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type
+from app.domain.overview.entity import PeriodPercentage, PeriodTotals
+from app.infra.rollup.rollup_repository import RollupRepository
+
+YearMonth = Tuple[int, int]
+
+
+def _percent(value: float, base: float) -> Optional[float]:
+    return round(value * 100 / base, 2) if base else None
+
+
+class PercentageRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_user: User, today: date):
+        self.current_user = current_user
+        self.today = today
+
+    @classmethod
+    def builder(cls, current_user: User, today: Optional[date] = None) -> request_object.RequestObject:
+        # UTC like the closed months of RollupRepository.totals_by_month
+        return cls(current_user=current_user, today=today or datetime.utcnow().date())
+
+
+class PercentageUseCase(use_case.UseCase):
+    """
+    Compare totals of a period with the previous period, both read from monthly rollups.
+    Subclasses define the periods from the request date.
+    """
+
+    def __init__(self, rollup_repository: RollupRepository = Depends(RollupRepository)):
+        self.rollup_repository = rollup_repository
+
+    def periods(self, today: date) -> Tuple[List[YearMonth], List[YearMonth]]:
+        """return months of the current and of the previous period"""
+        raise NotImplementedError("periods() not implemented by PercentageUseCase class")
+
+    @staticmethod
+    def _sum(months: List[YearMonth], totals: Dict[YearMonth, Dict[str, float]]) -> PeriodTotals:
+        by_type = {type.value: 0.0 for type in Type}
+        for year_month in months:
+            for type, amount in totals.get(year_month, {}).items():
+                by_type[type] = by_type.get(type, 0) + amount
+        return PeriodTotals(**by_type)
+
+    def process_request(self, req_object: PercentageRequestObject):
+        current_months, previous_months = self.periods(req_object.today)
+        totals = self.rollup_repository.totals_by_month(
+            user=req_object.current_user.id, months=current_months + previous_months
+        )
+        current = self._sum(current_months, totals)
+        previous = self._sum(previous_months, totals)
+
+        (first_year, first_month), (last_year, last_month) = current_months[0], current_months[-1]
+        return PeriodPercentage(
+            date_from=date(first_year, first_month, 1),
+            date_to=date(last_year, last_month, last_day_of_month(last_year, last_month)),
+            current=current,
+            previous=previous,
+            spend_ratio=_percent(current.spend, current.income),
+            save_ratio=_percent(current.save, current.income),
+            spend_change=_percent(current.spend - previous.spend, previous.spend),
+            income_change=_percent(current.income - previous.income, previous.income),
+            save_change=_percent(current.save - previous.save, previous.save),
+        )
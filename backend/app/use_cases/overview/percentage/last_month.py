@@ -0,0 +1,12 @@
+from datetime import date
+from app.shared.utils.general import add_months
+from app.use_cases.overview.percentage.base import PercentageRequestObject, PercentageUseCase
+
+
+class LastMonthPercentageRequestObject(PercentageRequestObject):
+    pass
+
+
+class LastMonthPercentageUseCase(PercentageUseCase):
+    def periods(self, today: date):
+        return [add_months(today.year, today.month, -1)], [add_months(today.year, today.month, -2)]
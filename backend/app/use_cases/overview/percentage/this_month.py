@@ -0,0 +1,12 @@
+from datetime import date
+from app.shared.utils.general import add_months
+from app.use_cases.overview.percentage.base import PercentageRequestObject, PercentageUseCase
+
+
+class ThisMonthPercentageRequestObject(PercentageRequestObject):
+    pass
+
+
+class ThisMonthPercentageUseCase(PercentageUseCase):
+    def periods(self, today: date):
+        return [(today.year, today.month)], [add_months(today.year, today.month, -1)]
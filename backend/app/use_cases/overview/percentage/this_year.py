@@ -0,0 +1,14 @@
+from datetime import date
+from app.use_cases.overview.percentage.base import PercentageRequestObject, PercentageUseCase
+
+
+class ThisYearPercentageRequestObject(PercentageRequestObject):
+    pass
+
+
+class ThisYearPercentageUseCase(PercentageUseCase):
+    def periods(self, today: date):
+        return (
+            [(today.year, month) for month in range(1, 13)],
+            [(today.year - 1, month) for month in range(1, 13)],
+        )
@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+from typing import Optional, List, Dict
+from fastapi import Depends
+from app.shared import request_object, use_case
+from app.shared.utils.general import add_months
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type, Period
+from app.domain.overview.entity import SeriesPoint
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+
+MAX_POINTS = 1000
+
+# range used when date_from is not given, counted back from date_to
+DEFAULT_SPAN = {
+    Period.DAY: timedelta(days=29),
+    Period.WEEK: timedelta(weeks=11),
+    Period.MONTH: timedelta(days=365),
+    Period.YEAR: timedelta(days=365 * 4),
+}
+
+
+def bucket_start(value: date, period: Period) -> date:
+    if period == Period.WEEK:
+        return value - timedelta(days=value.weekday())
+    if period == Period.MONTH:
+        return value.replace(day=1)
+    if period == Period.YEAR:
+        return value.replace(month=1, day=1)
+    return value
+
+
+def next_bucket(value: date, period: Period) -> date:
+    if period == Period.DAY:
+        return value + timedelta(days=1)
+    if period == Period.WEEK:
+        return value + timedelta(weeks=1)
+    if period == Period.MONTH:
+        year, month = add_months(value.year, value.month, 1)
+        return date(year, month, 1)
+    return date(value.year + 1, 1, 1)
+
+
+def buckets(date_from: date, date_to: date, period: Period) -> List[date]:
+    result, current = [], bucket_start(date_from, period)
+    while current <= date_to:
+        result.append(current)
+        current = next_bucket(current, period)
+    return result
+
+
+def bucket_count(date_from: date, date_to: date, period: Period) -> int:
+    """len(buckets(...)) without building them"""
+    first, last = bucket_start(date_from, period), bucket_start(date_to, period)
+    if period == Period.DAY:
+        return (last - first).days + 1
+    if period == Period.WEEK:
+        return (last - first).days // 7 + 1
+    if period == Period.MONTH:
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+    return last.year - first.year + 1
+
+
+class SeriesRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_user: User, period: Period, type: Type, date_from: date, date_to: date):
+        self.current_user = current_user
+        self.period = period
+        self.type = type
+        self.date_from = date_from
+        self.date_to = date_to
+
+    @classmethod
+    def builder(
+        cls,
+        current_user: User,
+        period: Period = Period.MONTH,
+        type: Type = Type.SPEND,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        date_to = date_to or date.today()
+        date_from = date_from or date_to - DEFAULT_SPAN[period]
+        if date_from > date_to:
+            invalid_req.add_error("date_from", "date_from must be before date_to")
+        elif bucket_count(date_from, date_to, period) > MAX_POINTS:
+            invalid_req.add_error("period", f"At most {MAX_POINTS} points per series, use a larger period")
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return SeriesRequestObject(current_user=current_user, period=period, type=type, date_from=date_from,
+                                   date_to=date_to)
+
+
+class SeriesUseCase(use_case.UseCase):
+    """
+    Bucketed totals of one transaction type. Day and week buckets are grouped on the server over the
+    (user, date) index, month and year buckets are summed from monthly rollups and cover whole months.
+    """
+
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
+        self.transaction_repository = transaction_repository
+        self.rollup_repository = rollup_repository
+
+    def _from_transactions(self, req_object: SeriesRequestObject) -> Dict[date, float]:
+        groups = self.transaction_repository.sum_by_bucket(
+            period=req_object.period,
+            user=req_object.current_user.id,
+            type=req_object.type,
+            date_from=bucket_start(req_object.date_from, req_object.period).isoformat(),
+            date_to=req_object.date_to.isoformat(),
+        )
+        amounts = {}
+        for group in groups:
+            key = group["_id"]
+            if req_object.period == Period.WEEK:
+                start = date.fromisocalendar(key["year"], key["week"], 1)
+            else:
+                start = date(key["year"], key["month"], key["day"])
+            amounts[start] = group["amount"]
+        return amounts
+
+    def _from_rollups(self, req_object: SeriesRequestObject) -> Dict[date, float]:
+        months, current = [], bucket_start(req_object.date_from, Period.MONTH)
+        while current <= req_object.date_to:
+            months.append((current.year, current.month))
+            current = next_bucket(current, Period.MONTH)
+
+        totals = self.rollup_repository.totals_by_month(user=req_object.current_user.id, months=months)
+        amounts: Dict[date, float] = {}
+        for (year, month), by_type in totals.items():
+            start = bucket_start(date(year, month, 1), req_object.period)
+            amounts[start] = amounts.get(start, 0) + by_type.get(req_object.type.value, 0)
+        return amounts
+
+    def process_request(self, req_object: SeriesRequestObject):
+        if req_object.period in (Period.DAY, Period.WEEK):
+            amounts = self._from_transactions(req_object)
+        else:
+            amounts = self._from_rollups(req_object)
+
+        return [
+            SeriesPoint(date=start, amount=amounts.get(start, 0))
+            for start in buckets(req_object.date_from, req_object.date_to, req_object.period)
+        ]
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from bson import ObjectId
+from fastapi import Depends
+from mongoengine import ValidationError
+from pymongo import InsertOne, UpdateOne, DeleteOne
+from app.shared import request_object, use_case
+from app.shared.utils.general import date2datetime
+from app.domain.user.entity import User
+from app.domain.shared.enum import BatchOperation
+from app.domain.transaction.entity import TransactionBatchOperation, TransactionBatchResult, TransactionInBatch
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+
+MAX_BATCH_SIZE = 500
+
+
+class BatchTransactionsRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_user: User, operations: List[TransactionBatchOperation]) -> None:
+        self.current_user = current_user
+        self.operations = operations
+
+    @classmethod
+    def builder(cls, current_user: User, operations: Optional[List[TransactionBatchOperation]]) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        if not operations:
+            invalid_req.add_error("payload", "Invalid payload")
+        elif len(operations) > MAX_BATCH_SIZE:
+            invalid_req.add_error("payload", f"At most {MAX_BATCH_SIZE} operations per batch")
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return BatchTransactionsRequestObject(current_user=current_user, operations=operations)
+
+
+class BatchTransactionsUseCase(use_case.UseCase):
+    """
+    Apply create / update / delete operations of current user with one bulk_write.
+    Every operation gets its own result, a failing operation does not stop the others.
+    Only operations that changed a document report success and update the rollups.
+    """
+
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
+                 category_repository: CategoryRepository = Depends(CategoryRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
+        self.transaction_repository = transaction_repository
+        self.category_repository = category_repository
+        self.rollup_repository = rollup_repository
+
+    @staticmethod
+    def _fields(data: TransactionInBatch, categories: Dict[str, ObjectId]) -> Dict[str, Any]:
+        fields = data.model_dump(exclude_none=True, exclude={"category_id"})
+        if "date" in fields:
+            fields["date"] = date2datetime(fields["date"])
+        if "type" in fields:
+            fields["type"] = fields["type"].value
+        if data.category_id:
+            if data.category_id not in categories:
+                raise ValueError("Category does not exist")
+            fields["category"] = categories[data.category_id]
+        return fields
+
+    def process_request(self, req_object: BatchTransactionsRequestObject):
+        user = req_object.current_user.id
+        operations = req_object.operations
+        results: List[TransactionBatchResult] = [
+            TransactionBatchResult(index=index, op=operation.op, id=operation.id, success=False)
+            for index, operation in enumerate(operations)
+        ]
+
+        categories = {str(category.id): category.id for category in self.category_repository.list(user=user)}
+        target_ids = [ObjectId(op.id) for op in operations if op.op != BatchOperation.CREATE and ObjectId.is_valid(op.id)]
+        owned = self.transaction_repository.find_owned(user=user, ids=target_ids)
+
+        now = datetime.utcnow()
+        # rollup changes of each queued request, applied only if the request succeeds
+        requests, positions, rollup_changes = [], [], []
+        for index, operation in enumerate(operations):
+            result = results[index]
+            try:
+                if operation.op == BatchOperation.CREATE:
+                    fields = self._fields(operation.data or TransactionInBatch(), categories)
+                    doc = self.transaction_repository.to_document({**fields, "user": user}, now)
+                    result.id = str(doc["_id"])
+                    request = InsertOne(doc)
+                    changes = [(doc, 1)]
+                else:
+                    if not ObjectId.is_valid(operation.id) or ObjectId(operation.id) not in owned:
+                        raise ValueError("Transaction does not exist")
+                    before = owned[ObjectId(operation.id)]
+                    if operation.op == BatchOperation.DELETE:
+                        request = DeleteOne({"_id": ObjectId(operation.id), "user": user})
+                        # later operations on the same id see the transaction is gone
+                        owned.pop(ObjectId(operation.id))
+                        changes = [(before, -1)]
+                    else:
+                        fields = self._fields(operation.data or TransactionInBatch(), categories)
+                        if not fields:
+                            raise ValueError("Nothing to update")
+                        request = UpdateOne(
+                            {"_id": ObjectId(operation.id), "user": user}, {"$set": {**fields, "updated_at": now}}
+                        )
+                        after = {**before, **fields}
+                        # later operations on the same id see this update
+                        owned[ObjectId(operation.id)] = after
+                        changes = [(before, -1), (after, 1)]
+            except (ValueError, ValidationError) as exc:
+                result.message = str(exc)
+                continue
+            requests.append(request)
+            positions.append(index)
+            rollup_changes.append(changes)
+
+        counts, errors = self.transaction_repository.bulk_write(requests)
+        written = [(position, index) for position, index in enumerate(positions) if position not in errors]
+        for position, index in enumerate(positions):
+            if position in errors:
+                results[index].message = errors[position]
+            else:
+                results[index].success = True
+
+        updates = [index for _, index in written if operations[index].op == BatchOperation.UPDATE]
+        deletes = [index for _, index in written if operations[index].op == BatchOperation.DELETE]
+        if counts["matched"] == len(updates) and counts["deleted"] == len(deletes):
+            self.rollup_repository.apply(
+                change for position, _ in written for change in rollup_changes[position]
+            )
+            return results
+
+        # some update / delete matched nothing, the transaction was deleted by a concurrent request
+        remaining = self.transaction_repository.find_owned(
+            user=user, ids=[ObjectId(operations[index].id) for index in updates]
+        )
+        for index in updates:
+            if ObjectId(operations[index].id) not in remaining:
+                results[index].success = False
+                results[index].message = "Transaction does not exist"
+        if counts["deleted"] == 0:
+            for index in deletes:
+                results[index].success = False
+                results[index].message = "Transaction does not exist"
+        # which operation matched nothing is not known for every case, recompute instead of applying deltas
+        self.rollup_repository.rebuild(user=user)
+        return results
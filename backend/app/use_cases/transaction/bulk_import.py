@@ -0,0 +1,128 @@
+from typing import Optional, Dict, List, IO, Any
+from fastapi import Depends
+from app.shared import request_object, response_object, use_case
+from app.shared.utils.general import date2datetime
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type, StatementFormat
+from app.domain.transaction.entity import TransactionImportError, TransactionImportResult
+from app.infra.database.rows import CategoryRow
+from app.infra.transaction.statement_parser import parse_csv, parse_ofx
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+from app.config import settings
+
+PARSERS = {
+    StatementFormat.CSV: parse_csv,
+    StatementFormat.OFX: parse_ofx,
+}
+
+
+class ImportTransactionsRequestObject(request_object.ValidRequestObject):
+    def __init__(
+        self,
+        current_user: User,
+        stream: IO[str],
+        format: StatementFormat,
+        category_id: Optional[str] = None,
+    ):
+        self.current_user = current_user
+        self.stream = stream
+        self.format = format
+        self.category_id = category_id
+
+    @classmethod
+    def builder(
+        cls,
+        current_user: User,
+        stream: IO[str],
+        filename: Optional[str] = None,
+        format: Optional[StatementFormat] = None,
+        category_id: Optional[str] = None,
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        if format is None and filename:
+            extension = filename.rsplit(".", 1)[-1].lower()
+            format = StatementFormat(extension) if extension in StatementFormat.list() else None
+        if format is None:
+            invalid_req.add_error("format", "Unknown statement format, expected one of {}".format(StatementFormat.list()))
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return ImportTransactionsRequestObject(current_user=current_user, stream=stream, format=format,
+                                               category_id=category_id)
+
+
+class ImportTransactionsUseCase(use_case.UseCase):
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
+                 category_repository: CategoryRepository = Depends(CategoryRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
+        self.transaction_repository = transaction_repository
+        self.category_repository = category_repository
+        self.rollup_repository = rollup_repository
+
+    @staticmethod
+    def _to_item(record: Dict[str, str], categories: Dict[str, CategoryRow],
+                 default_category: Optional[CategoryRow], user: Any) -> Dict[str, Any]:
+        """
+        Convert a raw statement record into transaction fields, raise ValueError on invalid record
+        """
+        date = date2datetime(record["date"])
+        if not date:
+            raise ValueError("Missing date")
+        amount = float(record["amount"])
+        # without explicit type the sign of the amount decides
+        type = Type(record["type"].lower()) if record["type"] else (Type.SPEND if amount < 0 else Type.INCOME)
+
+        category = categories.get(record["category"].lower()) if record["category"] else default_category
+        if not category:
+            raise ValueError("Unknown category {}".format(record["category"] or "(empty)"))
+
+        return {
+            "date": date,
+            "amount": abs(amount),
+            "note": record["note"] or None,
+            "type": type.value,
+            "category": category.id,
+            "user": user,
+        }
+
+    def _flush(self, items: List[Dict[str, Any]], rows: List[int], result: TransactionImportResult) -> None:
+        inserted, errors = self.transaction_repository.insert_many(items)
+        self.rollup_repository.apply((item, 1) for index, item in enumerate(items) if index not in errors)
+        result.inserted += inserted
+        result.errors.extend(TransactionImportError(row=rows[index], message=message) for index, message in errors.items())
+
+    def process_request(self, req_object: ImportTransactionsRequestObject):
+        user = req_object.current_user.id
+        # every category of the user in one query, referenced by id or by name
+        categories: Dict[str, CategoryRow] = {}
+        for category in self.category_repository.list(user=user):
+            categories[str(category.id)] = category
+            categories[category.name.lower()] = category
+
+        default_category = None
+        if req_object.category_id:
+            default_category = categories.get(req_object.category_id)
+            if not default_category:
+                return response_object.ResponseFailure.build_parameters_error(message="Category does not exist")
+
+        result = TransactionImportResult()
+        items, rows = [], []
+        for row_number, record in PARSERS[req_object.format](req_object.stream):
+            try:
+                items.append(self._to_item(record, categories, default_category, user))
+                rows.append(row_number)
+            except ValueError as exc:
+                result.errors.append(TransactionImportError(row=row_number, message=str(exc)))
+                continue
+
+            if len(items) >= settings.TRANSACTION_IMPORT_CHUNK_SIZE:
+                self._flush(items, rows, result)
+                items, rows = [], []
+
+        if items:
+            self._flush(items, rows, result)
+        result.errors.sort(key=lambda error: error.row)
+        return result
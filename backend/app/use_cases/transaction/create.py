@@ -5,6 +5,7 @@ from app.shared import request_object, use_case
 from app.domain.transaction.entity import Transaction, TransactionInCreate, TransactionInDB
 from app.infra.transaction.transaction_repository import TransactionRepository
 from app.infra.category.category_repository import CategoryRepository
+from app.infra.rollup.rollup_repository import RollupRepository
 from app.infra.database.models.user import User as UserModel
 from app.infra.database.models.category import Category as CategoryModel
 
@@ -27,9 +28,11 @@ class CreateTransactionRequestObject(request_object.ValidRequestObject):
 
 class CreateTransactionUseCase(use_case.UseCase):
     def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
-                 category_repository: CategoryRepository = Depends(CategoryRepository)):
+                 category_repository: CategoryRepository = Depends(CategoryRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
         self.transaction_repository = transaction_repository
         self.category_repository = category_repository
+        self.rollup_repository = rollup_repository
 
     def process_request(self, req_object: CreateTransactionRequestObject):
         transaction_in: TransactionInCreate = req_object.transaction_in
@@ -38,4 +41,14 @@ class CreateTransactionUseCase(use_case.UseCase):
         obj_in: TransactionInDB = TransactionInDB(**transaction_in.model_dump(exclude={"category_id"}),
                                                   user=req_object.current_user, category=category)
         transaction_in_db: TransactionInDB = self.transaction_repository.create(transaction=obj_in)
+        self.rollup_repository.apply([(
+            {
+                "user": req_object.current_user.id,
+                "category": category.id,
+                "date": transaction_in_db.date,
+                "type": transaction_in_db.type.value,
+                "amount": transaction_in_db.amount,
+            },
+            1,
+        )])
         return Transaction(**transaction_in_db.model_dump())
@@ -3,6 +3,7 @@ from fastapi import Depends
 from app.shared import request_object, response_object, use_case
 from app.infra.database.models.transaction import Transaction as TransactionModel
 from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.rollup.rollup_repository import RollupRepository
 
 
 class DeleteTransactionRequestObject(request_object.ValidRequestObject):
@@ -22,12 +23,15 @@ class DeleteTransactionRequestObject(request_object.ValidRequestObject):
 
 
 class DeleteTransactionUseCase(use_case.UseCase):
-    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository)):
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
         self.transaction_repository = transaction_repository
+        self.rollup_repository = rollup_repository
 
     def process_request(self, req_object: DeleteTransactionRequestObject):
         transaction: Optional[TransactionModel] = self.transaction_repository.get_by_id(id=req_object.id)
         if not transaction:
             return response_object.ResponseFailure.build_not_found_error(message="Transaction does not exist.")
-        self.transaction_repository.delete(req_object.id)
+        if self.transaction_repository.delete(req_object.id):
+            self.rollup_repository.apply([(transaction.to_mongo(), -1)])
         return {"success": True}
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from typing import Optional, Iterator, List
+from bson import ObjectId
+from fastapi import Depends
+from app.shared import request_object, response_object, use_case
+from app.domain.user.entity import User
+from app.domain.shared.enum import Type, ExportFormat
+from app.infra.database.rows import TransactionRow
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.config import settings
+
+EXPORT_FIELDS = ["id", "date", "amount", "type", "category", "note"]
+
+
+def _export_row(row: TransactionRow) -> dict:
+    return {
+        "id": str(row.id),
+        "date": row.date.isoformat() if row.date else None,
+        "amount": row.amount,
+        "type": row.type,
+        "category": row.category.get("name") if row.category else None,
+        "note": row.note,
+    }
+
+
+def encode_ndjson(batches: Iterator[List[TransactionRow]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(json.dumps(_export_row(row), ensure_ascii=False) + "\n" for row in batch).encode()
+
+
+def encode_csv(batches: Iterator[List[TransactionRow]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for batch in batches:
+        writer.writerows(_export_row(row) for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class ExportTransactionsRequestObject(request_object.ValidRequestObject):
+    def __init__(
+        self,
+        current_user: User,
+        format: ExportFormat,
+        date_from: str,
+        date_to: str,
+        type: Type,
+        category_id: str,
+    ):
+        self.current_user = current_user
+        self.format = format
+        self.date_from = date_from
+        self.date_to = date_to
+        self.type = type
+        self.category_id = category_id
+
+    @classmethod
+    def builder(
+        cls,
+        current_user: User,
+        format: ExportFormat = ExportFormat.NDJSON,
+        type: Optional[Type] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        category_id: Optional[str] = None,
+    ) -> request_object.RequestObject:
+        return ExportTransactionsRequestObject(current_user=current_user, format=format, type=type,
+                                               category_id=category_id, date_from=date_from, date_to=date_to)
+
+
+class ExportTransactionsUseCase(use_case.UseCase):
+    """
+    Return a lazy iterator of encoded chunks, the repository cursor is consumed while the response streams
+    """
+
+    def __init__(self, transaction_repository: TransactionRepository = Depends(TransactionRepository),
+                 category_repository: CategoryRepository = Depends(CategoryRepository)):
+        self.transaction_repository = transaction_repository
+        self.category_repository = category_repository
+
+    def process_request(self, req_object: ExportTransactionsRequestObject):
+        category = None
+        if req_object.category_id:
+            if ObjectId.is_valid(req_object.category_id):
+                category = self.category_repository.get_by_id(req_object.category_id)
+            # an unknown category would otherwise drop the filter and export every transaction
+            if not category or category.to_mongo().get("user") != req_object.current_user.id:
+                return response_object.ResponseFailure.build_not_found_error(message="Category does not exist")
+
+        batches = self.transaction_repository.iter_batches(
+            user=req_object.current_user.id,
+            type=req_object.type,
+            category=category.id if category else None,
+            date_from=req_object.date_from,
+            date_to=req_object.date_to,
+            batch_size=settings.TRANSACTION_EXPORT_BATCH_SIZE,
+        )
+        if req_object.format == ExportFormat.CSV:
+            return encode_csv(batches)
+        return encode_ndjson(batches)
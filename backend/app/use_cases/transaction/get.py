@@ -1,8 +1,11 @@
 from fastapi import Depends
 from typing import Optional
 from app.shared import request_object, response_object, use_case
-from app.domain.transaction.entity import Transaction, TransactionInDB
+from app.shared.mapping import to_entity
+from app.domain.transaction.entity import Transaction
 from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.transaction.async_transaction_repository import AsyncTransactionRepository, get_async_transaction_repository
+from app.infra.database.rows import TransactionRow
 from app.infra.database.models.transaction import Transaction as TransactionModel
 
 
@@ -31,4 +34,24 @@ class GetTransactionUseCase(use_case.UseCase):
         if not transaction:
             return response_object.ResponseFailure.build_not_found_error(message="Transaction does not exist.")
 
-        return Transaction(**TransactionInDB.model_validate(transaction).model_dump())
+        return to_entity(Transaction, transaction, trusted=True)
+
+
+class AsyncGetTransactionUseCase(use_case.AsyncUseCase):
+    def __init__(self, transaction_repository: AsyncTransactionRepository = Depends(get_async_transaction_repository)):
+        self.transaction_repository = transaction_repository
+
+    async def process_request(self, req_object: GetTransactionRequestObject):
+        transaction: Optional[TransactionRow] = await self.transaction_repository.get_by_id(
+            id=req_object.transaction_id
+        )
+        if not transaction:
+            return response_object.ResponseFailure.build_not_found_error(message="Transaction does not exist.")
+
+        return to_entity(Transaction, transaction, trusted=True)
+
+
+async def get_async_get_transaction_use_case(
+    transaction_repository: AsyncTransactionRepository = Depends(get_async_transaction_repository),
+) -> AsyncGetTransactionUseCase:
+    return AsyncGetTransactionUseCase(transaction_repository=transaction_repository)
@@ -2,14 +2,21 @@ import math
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case
+from app.shared.mapping import to_entities
+from app.shared.utils.general import encode_cursor, decode_cursor
 from app.domain.user.entity import User
 from app.domain.category.entity import Category
-from app.domain.transaction.entity import Transaction, TransactionInDB
-from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.domain.shared.entity import CursorPagination
+from app.domain.transaction.entity import Transaction, ManyTransactionsInResponse
+from app.infra.database.rows import TransactionRow, CategoryRow
 from app.infra.transaction.transaction_repository import TransactionRepository
 from app.infra.category.category_repository import CategoryRepository
+from app.infra.transaction.async_transaction_repository import AsyncTransactionRepository, get_async_transaction_repository
+from app.infra.category.async_category_repository import AsyncCategoryRepository, get_async_category_repository
 from app.domain.shared.enum import Type
 
+MAX_PAGE_SIZE = 500
+
 
 class ListTransactionsRequestObject(request_object.ValidRequestObject):
     def __init__(
@@ -19,8 +26,9 @@ class ListTransactionsRequestObject(request_object.ValidRequestObject):
         date_to: str,
         type: Type,
         category_id: str,
-        note: str
-
+        note: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ):
         self.current_user = current_user
         self.date_from = date_from
@@ -28,6 +36,8 @@ class ListTransactionsRequestObject(request_object.ValidRequestObject):
         self.type = type
         self.category_id = category_id
         self.note = note
+        self.limit = limit
+        self.cursor = cursor
 
     @classmethod
     def builder(
@@ -38,9 +48,22 @@ class ListTransactionsRequestObject(request_object.ValidRequestObject):
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         category_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        if limit is not None and not 0 < limit <= MAX_PAGE_SIZE:
+            invalid_req.add_error("limit", f"Must be between 1 and {MAX_PAGE_SIZE}")
+
+        if cursor is not None and (limit is None or decode_cursor(cursor) is None):
+            invalid_req.add_error("cursor", "Invalid cursor")
+
+        if invalid_req.has_errors():
+            return invalid_req
+
         return ListTransactionsRequestObject(current_user=current_user, type=type, category_id=category_id,
-                                             date_from=date_from, date_to=date_to, note=note)
+                                             date_from=date_from, date_to=date_to, note=note,
+                                             limit=limit, cursor=cursor)
 
 
 class ListTransactionsUseCase(use_case.UseCase):
@@ -53,14 +76,64 @@ class ListTransactionsUseCase(use_case.UseCase):
         if req_object.category_id:
             category: Category = self.category_repository.get_by_id(req_object.category_id)
 
-        transactions: List[TransactionModel] = self.transaction_repository.list(
+        transactions: List[TransactionRow] = self.transaction_repository.list(
+            user=req_object.current_user.id,
+            type=req_object.type,
+            category=category.id if req_object.category_id else None,
+            date_from=req_object.date_from,
+            date_to=req_object.date_to,
+            note=req_object.note,
+            # fetch one extra row to know if there is a next page
+            limit=req_object.limit + 1 if req_object.limit else None,
+            after=decode_cursor(req_object.cursor) if req_object.cursor else None,
+        )
+
+        return _to_response(req_object, transactions)
+
+
+class AsyncListTransactionsUseCase(use_case.AsyncUseCase):
+    def __init__(self, transaction_repository: AsyncTransactionRepository = Depends(get_async_transaction_repository),
+                 category_repository: AsyncCategoryRepository = Depends(get_async_category_repository)):
+        self.transaction_repository = transaction_repository
+        self.category_repository = category_repository
+
+    async def process_request(self, req_object: ListTransactionsRequestObject):
+        if req_object.category_id:
+            category: CategoryRow = await self.category_repository.get_by_id(req_object.category_id)
+
+        transactions: List[TransactionRow] = await self.transaction_repository.list(
             user=req_object.current_user.id,
             type=req_object.type,
             category=category.id if req_object.category_id else None,
             date_from=req_object.date_from,
             date_to=req_object.date_to,
-            note=req_object.note
+            note=req_object.note,
+            limit=req_object.limit + 1 if req_object.limit else None,
+            after=decode_cursor(req_object.cursor) if req_object.cursor else None,
         )
+        return _to_response(req_object, transactions)
+
+
+async def get_async_list_transactions_use_case(
+    transaction_repository: AsyncTransactionRepository = Depends(get_async_transaction_repository),
+    category_repository: AsyncCategoryRepository = Depends(get_async_category_repository),
+) -> AsyncListTransactionsUseCase:
+    return AsyncListTransactionsUseCase(
+        transaction_repository=transaction_repository, category_repository=category_repository
+    )
 
-        data = [Transaction(**TransactionInDB.model_validate(model).model_dump()) for model in transactions]
+
+def _to_response(req_object: ListTransactionsRequestObject, transactions: List[TransactionRow]):
+    if not req_object.limit:
+        data = to_entities(Transaction, transactions, trusted=True)
         return data
+
+    page = transactions[: req_object.limit]
+    next_cursor = None
+    if len(transactions) > req_object.limit:
+        next_cursor = encode_cursor(page[-1].date, page[-1].id)
+
+    return ManyTransactionsInResponse(
+        pagination=CursorPagination(limit=req_object.limit, next_cursor=next_cursor),
+        data=to_entities(Transaction, page, trusted=True),
+    )
@@ -2,9 +2,11 @@ from typing import Optional
 from fastapi import Depends
 from app.infra.database.models.category import Category as CategoryModel
 from app.shared import request_object, use_case, response_object
+from app.shared.mapping import to_entity
 
-from app.domain.transaction.entity import TransactionInUpdate, TransactionInDB, Transaction
+from app.domain.transaction.entity import TransactionInUpdate, Transaction
 from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.rollup.rollup_repository import RollupRepository
 
 
 class UpdateTransactionRequestObject(request_object.ValidRequestObject):
@@ -28,14 +30,18 @@ class UpdateTransactionRequestObject(request_object.ValidRequestObject):
 
 
 class UpdateTransactionUseCase(use_case.UseCase):
-    def __init__(self, category_repository: TransactionRepository = Depends(TransactionRepository)):
+    def __init__(self, category_repository: TransactionRepository = Depends(TransactionRepository),
+                 rollup_repository: RollupRepository = Depends(RollupRepository)):
         self.category_repository = category_repository
+        self.rollup_repository = rollup_repository
 
     def process_request(self, req_object: UpdateTransactionRequestObject):
         transaction: Optional[CategoryModel] = self.category_repository.get_by_id(req_object.id)
         if not transaction:
             return response_object.ResponseFailure.build_not_found_error("Transaction does not exist")
 
+        before = transaction.to_mongo()
         self.category_repository.update(id=transaction.id, data=req_object.obj_in)
         transaction.reload()
-        return Transaction(**TransactionInDB.model_validate(transaction).model_dump())
+        self.rollup_repository.apply([(before, -1), (transaction.to_mongo(), 1)])
+        return to_entity(Transaction, transaction, trusted=True)
@@ -1,8 +1,11 @@
 from fastapi import Depends
 from typing import Optional
 from app.shared import request_object, response_object, use_case
-from app.domain.user.entity import User, UserInDB
+from app.shared.mapping import to_entity
+from app.domain.user.entity import User
 from app.infra.user.user_repository import UserRepository
+from app.infra.user.async_user_repository import AsyncUserRepository, get_async_user_repository
+from app.infra.database.rows import UserRow
 from app.infra.database.models.user import User as UserModel
 
 
@@ -31,4 +34,22 @@ class GetUserCase(use_case.UseCase):
         if not user:
             return response_object.ResponseFailure.build_not_found_error(message="User does not exist.")
 
-        return User(**UserInDB.model_validate(user).model_dump())
+        return to_entity(User, user, trusted=True)
+
+
+class AsyncGetUserCase(use_case.AsyncUseCase):
+    def __init__(self, user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+        self.user_repository = user_repository
+
+    async def process_request(self, req_object: GetUserRequestObject):
+        user: Optional[UserRow] = await self.user_repository.get_by_id(user_id=req_object.user_id)
+        if not user:
+            return response_object.ResponseFailure.build_not_found_error(message="User does not exist.")
+
+        return to_entity(User, user, trusted=True)
+
+
+async def get_async_get_user_use_case(
+    user_repository: AsyncUserRepository = Depends(get_async_user_repository),
+) -> AsyncGetUserCase:
+    return AsyncGetUserCase(user_repository=user_repository)
@@ -2,10 +2,12 @@ import math
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case
-from app.domain.user.entity import User, UserInDB, ManyUsersInResponse
+from app.shared.mapping import to_entities
+from app.domain.user.entity import User, ManyUsersInResponse
 from app.domain.shared.entity import Pagination
-from app.infra.database.models.user import User as UserModel
+from app.infra.database.rows import UserRow
 from app.infra.user.user_repository import UserRepository
+from app.infra.user.async_user_repository import AsyncUserRepository, get_async_user_repository
 from app.domain.shared.enum import UserRole
 
 
@@ -44,7 +46,7 @@ class ListUsersUseCase(use_case.UseCase):
 
     def process_request(self, req_object: ListUsersRequestObject):
 
-        users: List[UserModel] = self.user_repository.list(
+        users: List[UserRow] = self.user_repository.list(
             role=req_object.role,
             email=req_object.email,
             page_index=req_object.page_index,
@@ -55,5 +57,28 @@ class ListUsersUseCase(use_case.UseCase):
         if req_object.email:
             conditions = {**conditions, "email": {"$regex": ".*" + req_object.email + ".*"}}
         total = self.user_repository.count(conditions)
-        data = [User(**UserInDB.model_validate(model).model_dump()) for model in users]
+        data = to_entities(User, users, trusted=True)
         return data
+
+
+class AsyncListUsersUseCase(use_case.AsyncUseCase):
+    def __init__(self, user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+        self.user_repository = user_repository
+
+    async def process_request(self, req_object: ListUsersRequestObject):
+
+        users: List[UserRow] = await self.user_repository.list(
+            role=req_object.role,
+            email=req_object.email,
+            page_index=req_object.page_index,
+            page_size=req_object.page_size,
+        )
+
+        data = to_entities(User, users, trusted=True)
+        return data
+
+
+async def get_async_list_users_use_case(
+    user_repository: AsyncUserRepository = Depends(get_async_user_repository),
+) -> AsyncListUsersUseCase:
+    return AsyncListUsersUseCase(user_repository=user_repository)
@@ -2,8 +2,9 @@ from typing import Optional
 from fastapi import Depends
 from app.infra.database.models.user import User as UserModel
 from app.shared import request_object, use_case, response_object
+from app.shared.mapping import to_entity
 
-from app.domain.user.entity import UserInUpdate, UserInDB, User
+from app.domain.user.entity import UserInUpdate, User
 from app.infra.user.user_repository import UserRepository
 
 
@@ -38,4 +39,4 @@ class UpdateUserUseCase(use_case.UseCase):
 
         self.user_repository.update(id=user.id, data=req_object.obj_in)
         user.reload()
-        return User(**UserInDB.model_validate(user).model_dump())
+        return to_entity(User, user, trusted=True)
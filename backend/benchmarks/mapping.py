@@ -0,0 +1,74 @@
+"""
+Micro-benchmark of entity mapping, old validate -> dump -> re-validate chain against app.shared.mapping
+
+Run from backend/ with the usual environment: python -m benchmarks.mapping [--rows 1000] [--repeat 20]
+"""
+import argparse
+import timeit
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.domain.transaction.entity import Transaction, TransactionInDB
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.rows import TransactionRow
+from app.shared.mapping import to_entities
+
+
+def make_data(rows: int):
+    user = UserModel(id=ObjectId(), email="bench@example.com", role="user", status="active")
+    category = CategoryModel(id=ObjectId(), name="Food", type="spend", user=user, created_at=datetime.utcnow())
+    documents, raw = [], []
+    for i in range(rows):
+        document = TransactionModel(
+            id=ObjectId(),
+            date=datetime(2023, 1, 1 + i % 28),
+            amount=float(i),
+            type="spend",
+            note="note {}".format(i),
+            category=category,
+            user=user,
+            created_at=datetime.utcnow(),
+        )
+        documents.append(document)
+        raw.append(
+            dict(
+                document.to_mongo().to_dict(),
+                category={"_id": category.id, "id": category.id, "name": "Food", "type": "spend"},
+            )
+        )
+    return documents, [TransactionRow.from_mongo(item) for item in raw]
+
+
+def bench(name: str, fn, repeat: int, rows: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print("{:<40} {:>9.2f} ms  {:>7.2f} us/row".format(name, best * 1000, best * 1e6 / rows))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    documents, rows = make_data(args.rows)
+
+    old = bench(
+        "documents: validate/dump/validate",
+        lambda: [Transaction(**TransactionInDB.model_validate(doc).model_dump()) for doc in documents],
+        args.repeat,
+        args.rows,
+    )
+    new = bench("documents: to_entities(trusted)", lambda: to_entities(Transaction, documents, trusted=True), args.repeat, args.rows)
+    print("{:<40} {:>9.1f}x".format("speedup", old / new))
+
+    old = bench("rows: Transaction(**row.to_dict())", lambda: [Transaction(**row.to_dict()) for row in rows], args.repeat, args.rows)
+    new = bench("rows: to_entities(trusted)", lambda: to_entities(Transaction, rows, trusted=True), args.repeat, args.rows)
+    print("{:<40} {:>9.1f}x".format("speedup", old / new))
+
+
+if __name__ == "__main__":
+    main()
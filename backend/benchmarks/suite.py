@@ -0,0 +1,290 @@
+"""
+Benchmark suite: repository, use case and HTTP paths against a seeded database
+
+Seeds an in-memory mongomock database (or a real one with --mongo-uri, which is dropped and reseeded),
+runs every case, prints p50/p95/p99 and writes them as json. With --baseline, results are compared
+to a stored run and the exit code is 1 when a case got slower than the tolerance.
+
+Run from backend/ with the usual environment:
+    python -m benchmarks.suite [--transactions 10000] [--users 10] [--categories 20] [--repeat 50]
+        [--output results.json] [--baseline benchmarks/baseline.json] [--save-baseline] [--tolerance 0.1]
+"""
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import mongomock
+from bson import ObjectId
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+
+from app.config import settings
+from app.infra.category.category_repository import CategoryRepository
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.user import User as UserModel
+from app.infra.security.security_service import create_access_token, get_password_hash
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.user.user_repository import user_cache
+from app.domain.shared.enum import AuthGrantType
+from app.use_cases.category.list import ListCategoriesRequestObject, ListCategoriesUseCase
+from app.use_cases.transaction.list import ListTransactionsRequestObject, ListTransactionsUseCase
+from app.main import app
+
+PASSWORD = "benchmark-password"
+SEED_BATCH = 10000
+# metrics compared against the baseline
+COMPARED = ("p50", "p95")
+
+
+def _cls(model) -> Dict[str, str]:
+    # models allowing inheritance only match documents carrying their class name
+    return {"_cls": model._class_name} if model._meta.get("allow_inheritance") else {}
+
+
+def seed(transactions: int, users: int, categories: int) -> List[UserModel]:
+    """
+    Insert users, their categories and transactions spread over them, raw inserts in batches
+    :param transactions: total number of transactions
+    :param users:
+    :param categories: per user
+    :return: the users
+    """
+    now = datetime.utcnow()
+    hashed_password = get_password_hash(PASSWORD)
+    user_docs = [
+        {
+            "_id": ObjectId(),
+            **_cls(UserModel),
+            "email": "bench{}@example.com".format(i),
+            "role": "user",
+            "status": "active",
+            "hashed_password": hashed_password,
+            "created_at": now,
+        }
+        for i in range(users)
+    ]
+    UserModel._get_collection().insert_many(user_docs)
+
+    category_ids = {}
+    for user in user_docs:
+        docs = [
+            {
+                "_id": ObjectId(),
+                **_cls(CategoryModel),
+                "name": "{} {}".format(user["email"], i),
+                "type": "spend" if i % 4 else "income",
+                "user": user["_id"],
+                "created_at": now,
+            }
+            for i in range(categories)
+        ]
+        CategoryModel._get_collection().insert_many(docs)
+        category_ids[user["_id"]] = [doc["_id"] for doc in docs]
+
+    rng = random.Random(42)
+    start = now - timedelta(days=365)
+    collection = TransactionModel._get_collection()
+    for offset in range(0, transactions, SEED_BATCH):
+        batch = []
+        for i in range(offset, min(offset + SEED_BATCH, transactions)):
+            user = user_docs[i % users]["_id"]
+            batch.append(
+                {
+                    "_id": ObjectId(),
+                    **_cls(TransactionModel),
+                    "date": start + timedelta(minutes=rng.randrange(365 * 24 * 60)),
+                    "amount": round(rng.uniform(1, 500), 2),
+                    "type": "spend",
+                    "note": "transaction {}".format(i),
+                    "category": rng.choice(category_ids[user]),
+                    "user": user,
+                    "created_at": now,
+                }
+            )
+        collection.insert_many(batch)
+
+    return [UserModel._from_son(doc) for doc in user_docs]
+
+
+def percentile_stats(samples: List[float]) -> Dict[str, float]:
+    """Milliseconds summary of one case"""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {
+        "n": len(samples),
+        "mean": round(statistics.fmean(samples), 3),
+        "min": round(min(samples), 3),
+        "p50": round(cuts[49], 3),
+        "p95": round(cuts[94], 3),
+        "p99": round(cuts[98], 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentile_stats(samples)
+
+
+def _http(client: TestClient, method: str, url: str, **kwargs) -> Callable[[], Any]:
+    def call():
+        resp = client.request(method, url, **kwargs)
+        if resp.status_code != 200:
+            raise RuntimeError("{} {} returned {}: {}".format(method, url, resp.status_code, resp.text[:200]))
+        return resp
+
+    return call
+
+
+def cases(user: UserModel, page_size: int) -> Dict[str, Callable[[], Any]]:
+    """Benchmarked calls, all for the same user"""
+    transaction_repository = TransactionRepository()
+    list_transactions = ListTransactionsUseCase(
+        transaction_repository=transaction_repository, category_repository=CategoryRepository()
+    )
+    list_categories = ListCategoriesUseCase(category_repository=CategoryRepository())
+    token = create_access_token(
+        data={"sub": user.email, "id": str(user.id), "grant_type": AuthGrantType.ACCESS_TOKEN.value}
+    )
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer {}".format(token)}
+
+    return {
+        "repository.transactions.list_page": lambda: transaction_repository.list(
+            type=None, user=user.id, category=None, limit=page_size + 1
+        ),
+        "repository.transactions.list_all": lambda: transaction_repository.list(type=None, user=user.id, category=None),
+        "use_case.list_transactions_page": lambda: list_transactions.execute(
+            ListTransactionsRequestObject.builder(current_user=user, limit=page_size)
+        ),
+        "use_case.list_categories": lambda: list_categories.execute(
+            ListCategoriesRequestObject.builder(current_user=user)
+        ),
+        "http.get_transactions_page": _http(
+            client, "GET", "/transactions", params={"limit": page_size}, headers=headers
+        ),
+        "http.get_transactions_all": _http(client, "GET", "/transactions", headers=headers),
+        "http.get_categories": _http(client, "GET", "/categories", headers=headers),
+        "http.login": _http(client, "POST", "/auth/login", data={"username": user.email, "password": PASSWORD}),
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float):
+    """
+    Ratio of each compared metric to the baseline
+    :return: (rows, regressions), a regression is a ratio above 1 + tolerance
+    """
+    rows, regressions = [], []
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        for metric in COMPARED:
+            if not old.get(metric):
+                continue
+            ratio = stats[metric] / old[metric]
+            row = {"case": name, "metric": metric, "baseline": old[metric], "current": stats[metric], "ratio": ratio}
+            rows.append(row)
+            if ratio > 1 + tolerance:
+                regressions.append(row)
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=10000, help="total, spread over the users")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--categories", type=int, default=20, help="per user")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--login-repeat", type=int, default=10, help="bcrypt makes login slow on purpose")
+    parser.add_argument("--cases", help="comma separated case name prefixes, e.g. repository,http.login")
+    parser.add_argument("--mongo-uri", help="real mongodb instead of mongomock, the database is dropped")
+    parser.add_argument("--output", help="write results json to this file")
+    parser.add_argument("--baseline", help="results json of a previous run to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown ratio, 0.1 = 10%%")
+    args = parser.parse_args()
+
+    # access logs of the test client would be part of every http measurement
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    disconnect()
+    if args.mongo_uri:
+        client = connect(host=args.mongo_uri)
+        client.drop_database(client.get_default_database().name)
+    else:
+        connect("benchmark", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient)
+
+    start = time.perf_counter()
+    users = seed(args.transactions, args.users, args.categories)
+    print("seeded {} transactions, {} users in {:.1f} s".format(args.transactions, args.users, time.perf_counter() - start))
+
+    prefixes = tuple(args.cases.split(",")) if args.cases else ("",)
+    results = {}
+    for name, fn in cases(users[0], args.page_size).items():
+        if not name.startswith(prefixes):
+            continue
+        # every run starts from a cold user cache, like the first request of a worker
+        user_cache.clear()
+        repeat = args.login_repeat if name == "http.login" else args.repeat
+        results[name] = measure(fn, repeat, args.warmup)
+        stats = results[name]
+        print("{:<36} p50 {:>9.2f} ms  p95 {:>9.2f} ms  p99 {:>9.2f} ms".format(name, stats["p50"], stats["p95"], stats["p99"]))
+
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "database": "mongodb" if args.mongo_uri else "mongomock",
+            "transactions": args.transactions,
+            "users": args.users,
+            "categories": args.categories,
+            "page_size": args.page_size,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print("baseline saved to {}".format(args.baseline))
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("transactions") != args.transactions or baseline["meta"].get("database") != report["meta"]["database"]:
+        print("warning: baseline was run with {}".format(baseline["meta"]))
+    rows, regressions = compare(results, baseline["results"], args.tolerance)
+    for row in rows:
+        print(
+            "{case:<36} {metric} {baseline:>9.2f} -> {current:>9.2f} ms  {change:>+7.1%}{flag}".format(
+                change=row["ratio"] - 1, flag="  REGRESSION" if row in regressions else "", **row
+            )
+        )
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
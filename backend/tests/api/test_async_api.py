@@ -0,0 +1,86 @@
+import importlib
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mongoengine import connect, disconnect
+from mongoengine.connection import get_connection
+from mongomock_motor import AsyncMongoMockClient
+from starlette.concurrency import run_in_threadpool
+import mongomock
+from app.config import settings
+from app.infra.database import async_client
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.security.security_service import create_access_token
+from app.domain.shared.enum import AuthGrantType
+from app.interfaces.rest.api_v1 import api
+from app.interfaces.rest.api_v1.endpoints import category, transaction, user
+
+ASYNC_ENDPOINTS = (category, transaction, user)
+
+
+class TestAsyncApi(unittest.TestCase):
+    """Routes registered with MONGODB_ASYNC=true, served without going through the threadpool"""
+
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(settings.MONGODB_DATABASE, host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        async_client.connect(AsyncMongoMockClient(mock_mongo_client=get_connection()))
+        with patch.object(settings, "MONGODB_ASYNC", True):
+            for module in ASYNC_ENDPOINTS:
+                importlib.reload(module)
+            importlib.reload(api)
+        app = FastAPI()
+        app.include_router(api.api_router)
+        cls.client = TestClient(app)
+
+        cls.user = UserModel(email="async-api@local.com", status="active", role="admin").save()
+        cls.category = CategoryModel(name="Async api", type="spend", user=cls.user).save()
+        cls.transaction = TransactionModel(
+            date=datetime(2023, 1, 1), amount=10, type="spend", category=cls.category, user=cls.user
+        ).save()
+        token = create_access_token(
+            data={"sub": cls.user.email, "id": str(cls.user.id), "grant_type": AuthGrantType.ACCESS_TOKEN.value}
+        )
+        cls.headers = {"Authorization": "Bearer {}".format(token)}
+
+    @classmethod
+    def tearDownClass(cls):
+        # back to the sync routes for the other tests
+        for module in ASYNC_ENDPOINTS:
+            importlib.reload(module)
+        importlib.reload(api)
+        async_client.disconnect()
+        disconnect()
+
+    def get(self, url: str, **kwargs):
+        hops = []
+
+        async def counting(func, *args, **kw):
+            hops.append(getattr(func, "__name__", func))
+            return await run_in_threadpool(func, *args, **kw)
+
+        with patch("fastapi.dependencies.utils.run_in_threadpool", counting), patch(
+            "fastapi.routing.run_in_threadpool", counting
+        ):
+            r = self.client.get(url, headers=self.headers, **kwargs)
+        assert r.status_code == 200, r.text
+        assert hops == [], hops
+        return r.json()
+
+    def test_categories(self):
+        assert self.get("/categories/{}".format(self.category.id))["name"] == "Async api"
+        assert [c["name"] for c in self.get("/categories")] == ["Async api"]
+
+    def test_transactions(self):
+        assert self.get("/transactions/{}".format(self.transaction.id))["amount"] == 10
+        data = self.get("/transactions", params={"limit": 10})["data"]
+        assert [t["id"] for t in data] == [str(self.transaction.id)]
+
+    def test_users(self):
+        assert self.get("/users/{}".format(self.user.id))["email"] == "async-api@local.com"
+        assert self.get("/users/admin/{}".format(self.user.id))["email"] == "async-api@local.com"
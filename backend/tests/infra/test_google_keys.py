@@ -0,0 +1,96 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from jose.exceptions import JWTError
+
+from app.infra.security.google_keys import GoogleKeySet, _max_age
+
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+
+
+class TestGoogleKeySet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        cls.private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+        public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": "k1", "use": "sig"}
+        fd, cls.cert_file = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"keys": [public_jwk]}, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.cert_file)
+
+    def setUp(self):
+        self.key_set = GoogleKeySet(url="", cert_file=self.cert_file)
+        self.key_set.start()
+
+    def sign(self, kid="k1", **claims):
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "exp": int(time.time()) + 600,
+            "email": "google@example.com",
+            "email_verified": True,
+            **claims,
+        }
+        return jwt.encode(payload, self.private_pem, algorithm="RS256", headers={"kid": kid})
+
+    def test_verify(self):
+        claims = self.key_set.verify(self.sign(), audience=CLIENT_ID)
+        assert claims["email"] == "google@example.com"
+
+    def test_rejects_invalid_tokens(self):
+        for token in (
+            self.sign(aud="another-client"),
+            self.sign(iss="https://evil.example.com"),
+            self.sign(exp=int(time.time()) - 10),
+            self.sign(email_verified=False),
+            self.sign(kid="unknown"),
+        ):
+            with self.assertRaises(JWTError):
+                self.key_set.verify(token, audience=CLIENT_ID)
+
+    def test_max_age(self):
+        assert _max_age(httpx.Headers({"cache-control": "public, max-age=20000, must-revalidate", "age": "100"})) == 19900
+        assert _max_age(httpx.Headers({})) is None
+
+    def test_concurrent_refreshes_share_one_fetch(self):
+        with open(self.cert_file) as f:
+            jwks = json.load(f)
+        fetches = []
+
+        async def fetch():
+            fetches.append(1)
+            await asyncio.sleep(0.2)
+            return jwks, None
+
+        key_set = GoogleKeySet(url="https://example.com/certs")
+        key_set._fetch = fetch
+        key_set._loop = asyncio.new_event_loop()
+        threading.Thread(target=key_set._loop.run_forever, daemon=True).start()
+        self.addCleanup(key_set._loop.call_soon_threadsafe, key_set._loop.stop)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(key_set.get("k1"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(fetches) == 1
+        assert len(results) == 8 and all(key is not None for key in results)
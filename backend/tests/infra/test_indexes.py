@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+import mongomock
+from app.infra.database.indexes import reconcile_model
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.user import User as UserModel
+
+
+class TestIndexReconciliation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_reconcile_builds_missing_and_reports_undeclared(self):
+        collection = TransactionModel._get_collection()
+        collection.drop()
+        # accessing the collection only builds unique indexes, the reconciler builds the others
+        TransactionModel._collection = None
+        collection = TransactionModel._get_collection()
+        assert set(collection.index_information()) <= {"_id_"}
+        collection.create_index([("note", 1)], name="note_1")
+
+        report = reconcile_model(TransactionModel)
+
+        assert "user_1_date_-1__id_-1" in report.created
+        assert "user_1_category_1_date_-1" in report.created
+        assert "user_1_type_1_date_-1" in report.created
+        assert report.undeclared == ["note_1"]
+
+        # second run is a no-op
+        report = reconcile_model(TransactionModel)
+        assert report.created == []
+
+    def test_unique_indexes_built_on_access(self):
+        UserModel._get_collection().drop()
+        UserModel._collection = None
+        info = UserModel._get_collection().index_information()
+        assert info["email_1"].get("unique")
+        assert set(info) == {"_id_", "email_1"}
+
+    def test_reports_mismatched_options_and_skips_new_from_unused(self):
+        collection = UserModel._get_collection()
+        collection.drop()
+        # an email index built before it was declared unique
+        collection.create_index([("email", 1)], name="email_1")
+
+        with patch("app.infra.database.indexes._index_usage", lambda c: {"email_1": 0, "role_1__id_-1": 0}):
+            report = reconcile_model(UserModel)
+
+        assert report.created == ["role_1__id_-1"]
+        assert report.mismatched == ["email_1"]
+        assert report.unused == ["email_1"]
+        UserModel._get_collection().drop()
+        UserModel._collection = None
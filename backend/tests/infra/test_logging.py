@@ -0,0 +1,70 @@
+import logging
+import threading
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.infra.logging.pipeline import AccessLogSampler, BoundedQueueSink, json_line, payload_text
+
+
+def _access_record(status: int) -> logging.LogRecord:
+    return logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, '%s - "%s %s HTTP/%s" %d', ("ip", "GET", "/", "1.1", status), None
+    )
+
+
+class TestLoggingPipeline(unittest.TestCase):
+    def test_queue_sink_drops_when_full(self):
+        release = threading.Event()
+        written = []
+
+        def slow_target(message):
+            release.wait()
+            written.append(message)
+
+        sink = BoundedQueueSink(slow_target, maxsize=2)
+        for i in range(10):
+            sink(str(i))
+        # one message held by the writer, two queued, the rest dropped
+        assert sink.dropped >= 7
+        release.set()
+        sink.flush()
+        assert len(written) + sink.dropped == 10
+        assert sink.stats()["written"] == len(written)
+        sink.close()
+
+    def test_access_log_sampling(self):
+        sampler = AccessLogSampler(rate=0.0, above_rps=5)
+        kept = sum(sampler.filter(_access_record(200)) for _ in range(50))
+        assert 5 <= kept <= 10  # can straddle a second boundary
+        assert sampler.sampled_out == 50 - kept
+        assert sampler.filter(_access_record(500))
+        assert AccessLogSampler(rate=1.0).filter(_access_record(200))
+
+    def test_payload_is_lazy_and_formatted_once(self):
+        calls = []
+
+        def payload():
+            calls.append(1)
+            return {"a": 1}
+
+        record = {"extra": {"payload": payload}}
+        assert payload_text(record, repr) == "{'a': 1}"
+        assert payload_text(record, repr) == "{'a': 1}"
+        assert len(calls) == 1
+
+    def test_json_line(self):
+        record = {
+            "time": datetime(2024, 1, 1),
+            "level": SimpleNamespace(name="INFO"),
+            "message": "hello",
+            "name": "app.main",
+            "function": "startup",
+            "line": 3,
+            "extra": {"request_id": "abc", "method": None, "payload": {"x": 1}, "_line": "skipped"},
+            "exception": None,
+        }
+        assert json_line(record) == (
+            '{"time": "2024-01-01T00:00:00", "level": "INFO", "message": "hello", "logger": "app.main", '
+            '"function": "startup", "line": 3, "request_id": "abc", "payload": {"x": 1}}'
+        )
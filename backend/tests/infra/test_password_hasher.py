@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import unittest
+import mongomock
+from fastapi import HTTPException
+from mongoengine import connect, disconnect
+from passlib.context import CryptContext
+
+from app.config import settings
+from app.infra.database.models.user import User as UserModel
+from app.infra.security.password_hasher import PasswordHasher
+from app.infra.security.security_service import SecurityService
+from app.infra.user.user_repository import UserRepository
+
+fast_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+
+
+class TestPasswordHasher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_hash_and_verify(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=1, timeout=1)
+        hashed = hasher.hash("secret")
+        assert hasher.verify("secret", hashed)
+        assert not hasher.verify("wrong", hashed)
+        stats = hasher.stats()
+        assert stats["completed"] == 3
+        assert stats["pending"] == 0
+
+    def test_rejects_when_full(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=0, timeout=0.05)
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        worker = threading.Thread(target=hasher._run, args=(block,))
+        worker.start()
+        started.wait()
+        with self.assertRaises(HTTPException) as ctx:
+            hasher.hash("secret")
+        release.set()
+        worker.join()
+        assert ctx.exception.status_code == 503
+        assert hasher.stats()["rejected"] == 1
+
+    def test_hash_and_verify_async(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=1, timeout=1)
+
+        async def run():
+            hashed = await hasher.hash_async("secret")
+            valid, new_hash = await hasher.verify_and_update_async("secret", hashed)
+            return valid, new_hash
+
+        assert asyncio.run(run()) == (True, None)
+        assert hasher.stats()["completed"] == 2
+        assert hasher.stats()["pending"] == 0
+
+    def test_rejects_when_full_async(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=0, timeout=0.05)
+        release = threading.Event()
+
+        async def run():
+            blocked = asyncio.ensure_future(hasher._run_async(release.wait))
+            await asyncio.sleep(0.01)
+            try:
+                with self.assertRaises(HTTPException) as ctx:
+                    await hasher.hash_async("secret")
+            finally:
+                release.set()
+                await blocked
+            return ctx.exception
+
+        assert asyncio.run(run()).status_code == 503
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.stats()["pending"] == 0
+
+    def test_sync_and_async_share_the_bound(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=0, timeout=0.05)
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        worker = threading.Thread(target=hasher._run, args=(block,))
+        worker.start()
+        started.wait()
+        try:
+            with self.assertRaises(HTTPException):
+                asyncio.run(hasher.hash_async("secret"))
+        finally:
+            release.set()
+            worker.join()
+        assert hasher.stats()["rejected"] == 1
+
+    def test_cancelled_caller_keeps_its_slot_until_the_job_ends(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=0, timeout=0.05)
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        async def run():
+            caller = asyncio.ensure_future(hasher._run_async(block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            caller.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await caller
+            # the job still runs on the pool, so its slot is still taken
+            assert hasher.stats()["pending"] == 1
+            with self.assertRaises(HTTPException):
+                await hasher.hash_async("secret")
+            release.set()
+            return await hasher.hash_async("secret")
+
+        assert asyncio.run(run())
+        assert hasher.stats()["pending"] == 0
+
+    def test_waiting_caller_gets_the_freed_slot(self):
+        hasher = PasswordHasher(fast_context, workers=1, queue_size=0, timeout=5)
+        release = threading.Event()
+
+        async def run():
+            blocked = asyncio.ensure_future(hasher._run_async(release.wait))
+            await asyncio.sleep(0.01)
+            waiting = asyncio.ensure_future(hasher.hash_async("secret"))
+            await asyncio.sleep(0.01)
+            assert not waiting.done()
+            release.set()
+            await blocked
+            return await waiting
+
+        assert asyncio.run(run())
+        assert hasher.stats()["rejected"] == 0
+
+    def test_lazy_rehash(self):
+        user = UserModel(email="rehash@example.com", role="user", hashed_password=fast_context.hash("secret")).save()
+        service = SecurityService(user_repository=UserRepository())
+        assert asyncio.run(service.authenticate_user("rehash@example.com", "secret"))
+        user.reload()
+        assert user.hashed_password.startswith("$2b${:02d}$".format(settings.BCRYPT_ROUNDS))
+        assert not asyncio.run(service.authenticate_user("rehash@example.com", "wrong"))
+        user.delete()
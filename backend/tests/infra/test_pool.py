@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+
+from app.infra.database import async_client, connect, pool_stats, command_timer, slow_query_recorder
+from app.infra.database.pool import PoolStats, pool_options, warm_up
+
+
+class TestPool(unittest.TestCase):
+    def test_pool_options(self):
+        with patch("app.infra.database.pool.settings") as settings:
+            settings.MONGODB_MAX_POOL_SIZE = 50
+            settings.MONGODB_MIN_POOL_SIZE = 5
+            settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS = 2000
+            settings.MONGODB_READ_PREFERENCE = "secondaryPreferred"
+            settings.MONGODB_MAX_IDLE_TIME_MS = None
+            settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS = 1000
+            settings.MONGODB_COMPRESSORS = "zstd,zlib"
+            options = pool_options()
+        assert options == {
+            "maxPoolSize": 50,
+            "minPoolSize": 5,
+            "serverSelectionTimeoutMS": 2000,
+            "readPreference": "secondaryPreferred",
+            "waitQueueTimeoutMS": 1000,
+            "compressors": "zstd,zlib",
+        }
+
+    def test_pool_stats(self):
+        stats = PoolStats()
+        for _ in range(3):
+            stats.connection_created(None)
+            stats.connection_check_out_started(None)
+            stats.connection_checked_out(None)
+        stats.connection_checked_in(None)
+        stats.connection_check_out_started(None)
+        stats.connection_check_out_started(None)
+        stats.connection_check_out_failed(None)
+        snapshot = stats.snapshot()
+        assert snapshot["open"] == 3
+        assert snapshot["checked_out"] == 2
+        assert snapshot["idle"] == 1
+        assert snapshot["waiting"] == 1
+        assert snapshot["checkout_failed"] == 1
+
+    def test_warm_up(self):
+        warm_up(mongomock.MongoClient(), connections=4)
+
+    def test_async_client_has_listeners(self):
+        with patch("app.infra.database.settings.MONGODB_ASYNC", True), patch(
+            "app.infra.database.mongo_engine_connect"
+        ), patch("app.infra.database.ensure_unique_indexes"), patch("app.infra.database.reconcile_indexes_in_background"):
+            connect()
+        try:
+            listeners = async_client._client.delegate.options.event_listeners
+            assert pool_stats in listeners and command_timer in listeners
+            assert slow_query_recorder in listeners or not slow_query_recorder.threshold_ms
+        finally:
+            async_client.disconnect()
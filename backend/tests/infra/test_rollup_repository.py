@@ -0,0 +1,117 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+import mongomock
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.monthly_rollup import MonthlyRollup as MonthlyRollupModel
+from app.infra.rollup.rollup_repository import RollupRepository, closed_month_cache
+
+
+def _snapshot(user):
+    return sorted(
+        (r.year, r.month, r.category.id, r.type, r.amount, r.count)
+        for r in MonthlyRollupModel.objects(user=user)
+        if r.count
+    )
+
+
+class TestRollupRepository(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="rollup@local.com", status="active", role="user").save()
+        cls.food = CategoryModel(name="Groceries", type="spend", user=cls.user).save()
+        cls.rent = CategoryModel(name="Rent", type="spend", user=cls.user).save()
+        cls.repository = RollupRepository()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_incremental_matches_rebuild(self):
+        transactions = [
+            TransactionModel(date=datetime(2023, 1, d), amount=d, type="spend", category=c, user=self.user).save()
+            for d, c in [(1, self.food), (2, self.food), (3, self.rent), (28, self.food)]
+        ]
+        self.repository.apply((t.to_mongo(), 1) for t in transactions)
+
+        # move one transaction to another month, delete another
+        before = transactions[0].to_mongo()
+        transactions[0].date = datetime(2023, 2, 1)
+        transactions[0].save()
+        self.repository.apply([(before, -1), (transactions[0].to_mongo(), 1)])
+        self.repository.apply([(transactions[1].to_mongo(), -1)])
+        transactions[1].delete()
+
+        incremental = _snapshot(self.user)
+        assert (2023, 1, self.food.id, "spend", 28.0, 1) in incremental
+        assert (2023, 2, self.food.id, "spend", 1.0, 1) in incremental
+
+        self.repository.rebuild(user=self.user.id)
+        assert _snapshot(self.user) == incremental
+
+        rows = self.repository.list(user=self.user.id, year_month_from=(2023, 2), year_month_to=(2023, 12))
+        assert [(row["year"], row["month"]) for row in rows] == [(2023, 2)]
+
+    def test_apply_invalidates_after_write(self):
+        month = [(2022, 5)]
+        user = UserModel(email="rollup-cache@local.com", status="active", role="user").save()
+        category = CategoryModel(name="Cache", type="spend", user=user).save()
+        transaction = TransactionModel(date=datetime(2022, 5, 3), amount=10, type="spend", category=category, user=user)
+        self.repository.apply([(transaction.to_mongo(), 1)])
+        assert self.repository.totals_by_month(user.id, month)[(2022, 5)] == {"spend": 10.0}
+
+        collection = MonthlyRollupModel._get_collection()
+        bulk_write = collection.bulk_write
+
+        def bulk_write_with_concurrent_read(*args, **kwargs):
+            # a reader between invalidation and write caches the old totals
+            self.repository.totals_by_month(user.id, month)
+            return bulk_write(*args, **kwargs)
+
+        with patch.object(collection, "bulk_write", bulk_write_with_concurrent_read):
+            self.repository.apply([(transaction.to_mongo(), 1)])
+
+        assert closed_month_cache.get((user.id, 2022, 5)) is None
+        assert self.repository.totals_by_month(user.id, month)[(2022, 5)] == {"spend": 20.0}
+
+    def test_read_racing_write_not_cached(self):
+        month = [(2022, 6)]
+        user = UserModel(email="rollup-race@local.com", status="active", role="user").save()
+        category = CategoryModel(name="Race", type="spend", user=user).save()
+        transaction = TransactionModel(date=datetime(2022, 6, 3), amount=10, type="spend", category=category, user=user)
+        self.repository.apply([(transaction.to_mongo(), 1)])
+
+        collection = MonthlyRollupModel._get_collection()
+        find = collection.find
+
+        def find_then_write(*args, **kwargs):
+            # the reader got the old totals, a write and its invalidation finish before they are cached
+            docs = list(find(*args, **kwargs))
+            with patch.object(collection, "find", find):
+                self.repository.apply([(transaction.to_mongo(), 1)])
+            return docs
+
+        with patch.object(collection, "find", find_then_write):
+            assert self.repository.totals_by_month(user.id, month)[(2022, 6)] == {"spend": 10.0}
+        assert self.repository.totals_by_month(user.id, month)[(2022, 6)] == {"spend": 20.0}
+
+    def test_removal_never_goes_negative(self):
+        user = UserModel(email="rollup-negative@local.com", status="active", role="user").save()
+        category = CategoryModel(name="Negative", type="spend", user=user).save()
+        transaction = TransactionModel(date=datetime(2022, 7, 1), amount=5, type="spend", category=category, user=user)
+        assert self.repository.apply([(transaction.to_mongo(), 1)])
+
+        assert self.repository.apply([(transaction.to_mongo(), -1)])
+        # the same removal again would leave count -1
+        assert not self.repository.apply([(transaction.to_mongo(), -1)])
+        # no rollup row to remove from
+        other = TransactionModel(date=datetime(2022, 8, 1), amount=3, type="spend", category=category, user=user)
+        assert not self.repository.apply([(other.to_mongo(), -1)])
+
+        rollups = list(MonthlyRollupModel._get_collection().find({"user": user.id}))
+        assert [(r["month"], r["amount"], r["count"]) for r in rollups] == [(7, 0, 0)]
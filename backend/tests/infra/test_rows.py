@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime
+from bson import ObjectId
+from app.infra.database.rows import TransactionRow, UserRow
+
+
+class TestRows(unittest.TestCase):
+    def test_from_mongo(self):
+        doc = {
+            "_id": ObjectId(),
+            "_cls": "Transaction",
+            "date": datetime(2023, 1, 1),
+            "amount": 10.5,
+            "type": "spend",
+            "category": ObjectId(),
+            "user": ObjectId(),
+        }
+        row = TransactionRow.from_mongo(doc)
+        assert row.id == doc["_id"]
+        assert row.amount == 10.5
+        assert row.note is None
+        data = row.to_dict()
+        assert data["id"] == str(doc["_id"])
+        assert "_cls" not in data
+
+    def test_read_only(self):
+        row = UserRow.from_mongo({"_id": ObjectId(), "email": "a@b.com", "hashed_password": "secret"})
+        with self.assertRaises(AttributeError):
+            row.email = "c@d.com"
+        assert "hashed_password" not in row.to_dict()
@@ -0,0 +1,123 @@
+import unittest
+from types import SimpleNamespace
+
+import mongomock
+
+from app.infra.database.slow_queries import SlowQueryRecorder, query_shape, summarize_explain
+
+EXPLAIN = {
+    "queryPlanner": {
+        "winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "user_1_date_-1"}}
+    },
+    "executionStats": {"nReturned": 10, "totalDocsExamined": 5000, "totalKeysExamined": 5000},
+}
+
+
+class _Database:
+    def __init__(self, db):
+        self.db = db
+        self.commands = []
+
+    def command(self, command):
+        self.commands.append(command)
+        return EXPLAIN
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+    def __getitem__(self, name):
+        return self.db[name]
+
+
+class _Client:
+    def __init__(self):
+        self.mongo = mongomock.MongoClient()
+        self.databases = {}
+
+    def __getitem__(self, name):
+        return self.databases.setdefault(name, _Database(self.mongo[name]))
+
+
+def _start(recorder, command, request_id):
+    recorder.started(
+        SimpleNamespace(
+            command_name=next(iter(command)),
+            command=command,
+            database_name="app",
+            connection_id=("db", 27017),
+            request_id=request_id,
+        )
+    )
+
+
+def _run(recorder, command, duration_micros, request_id=1):
+    name = next(iter(command))
+    _start(recorder, command, request_id)
+    recorder.succeeded(
+        SimpleNamespace(
+            command_name=name, duration_micros=duration_micros, connection_id=("db", 27017), request_id=request_id
+        )
+    )
+
+
+class TestSlowQueries(unittest.TestCase):
+    def test_query_shape_ignores_values(self):
+        first = {"find": "transaction", "filter": {"user": 1234, "note": {"$regex": "abc"}}, "sort": {"date": -1}}
+        second = {"find": "transaction", "filter": {"user": 99, "note": {"$regex": "xyz"}}, "sort": {"date": -1}}
+        assert query_shape("find", first) == query_shape("find", second)
+        assert '"note": {"$regex": "?"}' in query_shape("find", first)
+        assert '"$in": ["?"]' in query_shape("find", {"find": "t", "filter": {"_id": {"$in": [1, 2, 3]}}})
+
+    def test_summarize_explain(self):
+        summary = summarize_explain({"stages": [{"$cursor": EXPLAIN}, {"$sort": {}}]})
+        assert summary == {
+            "docs_examined": 5000,
+            "keys_examined": 5000,
+            "returned": 10,
+            "plan": ["FETCH", "IXSCAN:user_1_date_-1"],
+        }
+
+    def test_records_slow_commands_once_per_shape(self):
+        client = _Client()
+        recorder = SlowQueryRecorder(threshold_ms=50, sample_interval=60, client=lambda: client)
+        command = {"aggregate": "transaction", "pipeline": [{"$match": {"user": 1}}], "cursor": {}, "lsid": {"id": 1}}
+
+        _run(recorder, {"find": "category", "filter": {"user": 1}}, 1000)
+        _run(recorder, command, 120000, request_id=2)
+        _run(recorder, dict(command, pipeline=[{"$match": {"user": 2}}]), 150000, request_id=3)
+        recorder.flush()
+
+        entries = recorder.list("app")
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["ns"] == "app.transaction"
+        assert entry["duration_ms"] == 120.0
+        assert entry["docs_examined"] == 5000
+        assert entry["returned"] == 10
+        assert entry["plan"] == ["FETCH", "IXSCAN:user_1_date_-1"]
+        # explain gets the command without session fields
+        explain = client["app"].commands[0]
+        assert explain["verbosity"] == "executionStats"
+        assert "lsid" not in explain["explain"]
+        assert recorder.list("app", collection="category") == []
+
+    def test_log_sink(self):
+        client = _Client()
+        recorder = SlowQueryRecorder(threshold_ms=50, sink="log", client=lambda: client)
+        _run(recorder, {"count": "transaction", "query": {"note": {"$regex": "x"}}}, 80000)
+        recorder.flush()
+        assert [entry["op"] for entry in recorder.list("app")] == ["count"]
+        assert "slow_queries" not in client.mongo["app"].list_collection_names()
+
+    def test_unfinished_commands_are_bounded(self):
+        client = _Client()
+        recorder = SlowQueryRecorder(threshold_ms=50, sink="log", client=lambda: client, max_in_flight=3)
+        for request_id in range(10):
+            # no succeeded / failed event, e.g. the connection dropped
+            _start(recorder, {"find": "transaction", "filter": {"user": request_id}}, request_id)
+        assert [key[1] for key in recorder._started] == [7, 8, 9]
+
+        _run(recorder, {"find": "transaction", "filter": {"user": 1}}, 80000, request_id=9)
+        recorder.flush()
+        assert len(recorder.list("app")) == 1
+        assert [key[1] for key in recorder._started] == [7, 8]
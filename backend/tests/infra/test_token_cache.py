@@ -0,0 +1,38 @@
+import time
+import unittest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.config import settings
+from app.domain.shared.enum import AuthGrantType
+from app.infra.security.security_service import create_access_token, token_cache, verify_token
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        token_cache.clear()
+
+    def test_verified_token_is_cached(self):
+        token = create_access_token(data={"sub": "a@b.com", "id": "1", "grant_type": AuthGrantType.ACCESS_TOKEN.value})
+        hits = token_cache.hits
+        first = verify_token(token)
+        second = verify_token(token, grant_type=AuthGrantType.ACCESS_TOKEN)
+        assert first.email == second.email == "a@b.com"
+        assert token_cache.hits == hits + 1
+        assert len(token_cache) == 1
+
+    def test_grant_type_checked_on_hit(self):
+        token = create_access_token(data={"sub": "a@b.com", "id": "1", "grant_type": AuthGrantType.ACCESS_TOKEN.value})
+        verify_token(token)
+        with self.assertRaises(HTTPException):
+            verify_token(token, grant_type=AuthGrantType.RESET_PASSWORD)
+
+    def test_invalid_and_expired_tokens_not_cached(self):
+        with self.assertRaises(HTTPException):
+            verify_token("not-a-token")
+        expired = jwt.encode(
+            {"sub": "a@b.com", "exp": int(time.time()) - 10}, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        )
+        with self.assertRaises(HTTPException):
+            verify_token(expired)
+        assert len(token_cache) == 0
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.domain.shared.enum import UserStatus
+from app.infra.database.models.user import User as UserModel
+from app.infra.user.user_repository import UserRepository, user_cache
+
+
+class TestUserCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserModel(email="cache@example.com", role="user", status=UserStatus.ACTIVE.value).save()
+        self.repository = UserRepository()
+
+    def tearDown(self):
+        UserModel.objects.delete()
+
+    def test_served_from_cache(self):
+        hits = user_cache.hits
+        first = self.repository.get_by_id_cached(str(self.user.id))
+        second = self.repository.get_by_id_cached(str(self.user.id))
+        assert first is not second
+        assert second.email == "cache@example.com"
+        assert user_cache.hits == hits + 1
+
+    def test_update_invalidates(self):
+        self.repository.get_by_id_cached(str(self.user.id))
+        self.repository.update(id=self.user.id, data={"status": UserStatus.INACTIVE.value})
+        user = self.repository.get_by_id_cached(str(self.user.id))
+        assert user.status == UserStatus.INACTIVE.value
+
+    def test_unknown_id(self):
+        assert self.repository.get_by_id_cached("not-an-id") is None
+
+    def test_read_racing_update_not_cached(self):
+        collection = UserModel._get_collection()
+        find_one = collection.find_one
+
+        def find_one_then_update(*args, **kwargs):
+            # the read sees the old document, the update and its invalidation finish before it is cached
+            son = find_one(*args, **kwargs)
+            self.repository.update(id=self.user.id, data={"role": "admin"})
+            return son
+
+        with patch.object(collection, "find_one", find_one_then_update):
+            stale = self.repository.get_by_id_cached(str(self.user.id))
+        assert stale.role == "user"
+        assert self.repository.get_by_id_cached(str(self.user.id)).role == "admin"
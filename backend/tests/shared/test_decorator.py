@@ -0,0 +1,48 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import StreamingResponse
+
+from app.domain.transaction.entity import Transaction
+from app.shared.decorator import json_response, response_decorator
+from app.shared.response_object import ResponseSuccess
+
+
+def make_transactions(n):
+    return [
+        Transaction(id=str(ObjectId()), date=datetime(2023, 1, 1, 8, 30), amount=i + 0.5, type="spend", note="ghi chú")
+        for i in range(n)
+    ]
+
+
+async def read_stream(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestJsonResponse(unittest.TestCase):
+    def test_same_output_as_jsonable_encoder(self):
+        items = make_transactions(3)
+        response = response_decorator()(lambda: ResponseSuccess(items))()
+        assert json.loads(response.body) == jsonable_encoder(items, by_alias=True)
+        assert response.media_type == "application/json"
+
+    def test_fallback_for_unknown_types(self):
+        class Plain:
+            def __init__(self):
+                self.name = "plain"
+
+        response = json_response({"item": Plain()})
+        assert json.loads(response.body) == {"item": {"name": "plain"}}
+
+    def test_stream_long_lists(self):
+        items = make_transactions(1201)
+        with patch("app.shared.decorator.settings.RESPONSE_STREAM_THRESHOLD", 1000):
+            response = json_response(items)
+        assert isinstance(response, StreamingResponse)
+        body = asyncio.run(read_stream(response))
+        assert json.loads(body) == jsonable_encoder(items, by_alias=True)
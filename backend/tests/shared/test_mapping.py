@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+
+from bson import ObjectId
+from pydantic import ValidationError
+
+from app.domain.category.entity import Category
+from app.domain.shared.enum import Type, UserRole, UserStatus
+from app.domain.transaction.entity import Transaction, TransactionCategory
+from app.domain.user.entity import User
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.rows import CategoryRow, TransactionRow, UserRow
+from app.shared.mapping import to_entities, to_entity
+
+
+class TestMapping(unittest.TestCase):
+    def setUp(self):
+        self.user = UserModel(id=ObjectId(), email="map@example.com", role="user", status="active")
+        self.category = CategoryModel(
+            id=ObjectId(), name="Food", type="spend", user=self.user, created_at=datetime(2023, 1, 1)
+        )
+        self.transaction = TransactionModel(
+            id=ObjectId(),
+            date=datetime(2023, 1, 2),
+            amount=12.5,
+            type="spend",
+            category=self.category,
+            user=self.user,
+            created_at=datetime(2023, 1, 2),
+        )
+
+    def test_document(self):
+        for trusted in (True, False):
+            transaction = to_entity(Transaction, self.transaction, trusted=trusted)
+            assert transaction.id == str(self.transaction.id)
+            assert transaction.amount == 12.5
+            assert transaction.note is None
+            assert isinstance(transaction.category, TransactionCategory)
+            assert transaction.category.id == self.category.id
+            assert transaction.category.name == "Food"
+
+    def test_trusted_matches_validated(self):
+        trusted = to_entity(Transaction, self.transaction, trusted=True)
+        validated = to_entity(Transaction, self.transaction)
+        assert trusted.model_dump(mode="json") == validated.model_dump(mode="json")
+
+        user = to_entity(User, self.user, trusted=True)
+        assert user.model_dump(mode="json") == to_entity(User, self.user).model_dump(mode="json")
+        assert user.first_name is None
+
+    def test_rows_and_raw_dicts(self):
+        raw = dict(self.category.to_mongo().to_dict())
+        for source in (raw, CategoryRow.from_mongo(raw)):
+            category = to_entity(Category, source, trusted=True)
+            assert category.id == str(self.category.id)
+            assert category.created_at == datetime(2023, 1, 1)
+
+        raw = dict(self.transaction.to_mongo().to_dict(), category={"id": self.category.id, "name": "Food"})
+        transactions = to_entities(Transaction, [TransactionRow.from_mongo(raw)], trusted=True)
+        assert transactions[0].category.id == self.category.id
+        assert transactions[0].category.type is None
+
+    def test_trusted_coerces_enums_and_defaults(self):
+        category = to_entity(Category, self.category, trusted=True)
+        assert category.type is Type.SPEND
+
+        raw = {"_id": self.user.id, "email": "map@example.com", "role": "admin"}
+        user = to_entity(User, UserRow.from_mongo(raw), trusted=True)
+        assert user.role is UserRole.ADMIN
+        assert user.status is UserStatus.INACTIVE
+        assert user.model_dump(mode="json") == to_entity(User, raw).model_dump(mode="json")
+
+    def test_trusted_missing_required_field_is_validated(self):
+        raw = dict(self.category.to_mongo().to_dict())
+        del raw["created_at"]
+        with self.assertRaises(ValidationError):
+            to_entity(Category, CategoryRow.from_mongo(raw), trusted=True)
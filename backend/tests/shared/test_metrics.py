@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+
+import anyio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infra.metrics import use_case_duration
+from app.infra.metrics.collectors import threadpool_metrics
+from app.infra.metrics.registry import Registry
+from app.interfaces.rest.middleware import MetricsMiddleware
+from app.shared import response_object as res
+from app.shared.request_object import ValidRequestObject
+from app.shared.use_case import UseCase
+
+
+class _Ok(UseCase):
+    def process_request(self, request_object):
+        return {"ok": True}
+
+
+class _Broken(UseCase):
+    def process_request(self, request_object):
+        raise ValueError("broken")
+
+
+class TestMetrics(unittest.TestCase):
+    def test_render_counter_gauge_histogram(self):
+        registry = Registry()
+        counter = registry.counter("requests_total", "Requests", ("route",))
+        gauge = registry.gauge("in_flight", "In flight")
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        counter.inc('/a"b')
+        counter.inc('/a"b', amount=2)
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, "/a")
+        registry.register_collector(lambda: [("extra", "gauge", "Extra", [({"kind": "x"}, 7)])])
+
+        lines = registry.render().splitlines()
+        assert "# TYPE requests_total counter" in lines
+        assert 'requests_total{route="/a\\"b"} 3' in lines
+        assert "in_flight 1" in lines
+        assert "# TYPE latency_seconds histogram" in lines
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 3' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+        assert 'latency_seconds_count{route="/a"} 4' in lines
+        assert 'latency_seconds_sum{route="/a"} 3.65' in lines
+        assert 'extra{kind="x"} 7' in lines
+
+    def test_failing_collector_skipped(self):
+        registry = Registry()
+        registry.counter("requests_total", "Requests").inc()
+
+        def broken():
+            raise RuntimeError("broken")
+
+        registry.register_collector(broken)
+        registry.register_collector(threadpool_metrics)
+        lines = registry.render().splitlines()
+        assert "requests_total 1" in lines
+        assert not any(line.startswith("threadpool_") for line in lines)
+
+    def test_wrong_labels(self):
+        counter = Registry().counter("c", "C", ("a", "b"))
+        with self.assertRaises(ValueError):
+            counter.inc("x")
+
+    def test_middleware(self):
+        # fresh instruments, the global ones also count requests of other test modules
+        registry = Registry()
+        instruments = {
+            "http_requests": registry.counter("http_requests_total", "", ("method", "route", "status")),
+            "http_request_duration": registry.histogram("http_request_duration_seconds", "", ("method", "route")),
+            "http_requests_in_flight": registry.gauge("http_requests_in_flight", "", ("method",)),
+        }
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            return {"id": item_id}
+
+        app.add_middleware(MetricsMiddleware)
+        client = TestClient(app)
+        with patch.multiple("app.interfaces.rest.middleware", **instruments):
+            client.get("/items/a")
+            client.get("/items/b")
+            client.get("/missing")
+
+        text = registry.render()
+        assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2' in text
+        assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+        assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2' in text
+        assert 'http_requests_in_flight{method="GET"} 0' in text
+
+    def test_use_case_hook(self):
+        _Ok().execute(ValidRequestObject())
+        response = _Broken().execute(ValidRequestObject())
+        assert isinstance(response, res.ResponseFailure)
+
+        text = "\n".join(
+            "{} {}".format(labels, value) for _, _, _, samples in use_case_duration.collect() for labels, value in samples
+        )
+        assert "{'use_case': '_Ok', 'outcome': 'success'} 1" in text
+        assert "{'use_case': '_Broken', 'outcome': 'error'} 1" in text
+
+    def test_threadpool_metrics(self):
+        async def collect():
+            return threadpool_metrics()
+
+        families = {name: samples[0][1] for name, _, _, samples in anyio.run(collect)}
+        assert families["threadpool_threads_max"] == 40
+        assert families["threadpool_queue_depth"] == 0
@@ -0,0 +1,66 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infra.profiling import profile_store
+from app.infra.profiling.sampler import ProfileStore, StackSampler
+from app.interfaces.rest.middleware import ProfilerMiddleware
+
+
+def busy_work(seconds: float) -> int:
+    total, end = 0, time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+def _app(sample_rate: float) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/work/{item_id}")
+    def work(item_id: str):
+        busy_work(0.05)
+        return {"id": item_id}
+
+    app.add_middleware(ProfilerMiddleware, sample_rate=sample_rate, interval=0.001)
+    return TestClient(app)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_sampler_folds_busy_stacks(self):
+        sampler = StackSampler(interval=0.001).start()
+        busy_work(0.05)
+        sampler.stop()
+        folded = sampler.folded()
+        assert "{0}:test_sampler_folds_busy_stacks;{0}:busy_work".format(__name__) in folded
+        stack, count = folded.splitlines()[0].rsplit(" ", 1)
+        assert int(count) > 0
+        # idle threads (e.g. the event loop waiting in select) are skipped
+        assert "selectors:select " not in folded
+
+    def test_store_evicts_oldest(self):
+        store = ProfileStore(maxsize=2)
+        for profile_id in ("a", "b", "c"):
+            store.add(profile_id, "GET /x", StackSampler(), 200)
+        assert store.get("a") is None
+        assert [profile["id"] for profile in store.list()] == ["c", "b"]
+        assert store.list(route="GET /y") == []
+
+    def test_sampled_request_is_profiled(self):
+        resp = _app(sample_rate=1.0).get("/work/1")
+        profile = profile_store.get(resp.headers["x-profile-id"])
+        assert profile["route"] == "GET /work/{item_id}"
+        assert profile["status"] == 200
+        assert "busy_work" in profile["folded"]
+
+    def test_profile_flag_requires_administrator(self):
+        client = _app(sample_rate=0.0)
+        headers = {"X-Profile": "1", "Authorization": "Bearer token"}
+        with patch("app.interfaces.rest.middleware.get_administrator_from_token", return_value=None):
+            assert "x-profile-id" not in client.get("/work/1", headers=headers).headers
+        with patch("app.interfaces.rest.middleware.get_administrator_from_token", return_value=object()):
+            assert "x-profile-id" not in client.get("/work/1", headers={"X-Profile": "1"}).headers
+            assert "x-profile-id" in client.get("/work/1", headers=headers).headers
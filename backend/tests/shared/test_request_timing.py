@@ -0,0 +1,62 @@
+import unittest
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infra.database.commands import CommandTimer
+from app.interfaces.rest.middleware import ServerTimingMiddleware
+from app.shared.timing import RequestTiming, request_timing, timed
+
+
+class TestRequestTiming(unittest.TestCase):
+    def test_command_timer_attributes_to_current_request(self):
+        timer = CommandTimer()
+        timing = RequestTiming()
+        token = request_timing.set(timing)
+        try:
+            timer.succeeded(SimpleNamespace(duration_micros=1500))
+            timer.failed(SimpleNamespace(duration_micros=500))
+        finally:
+            request_timing.reset(token)
+        # outside a request nothing is recorded
+        timer.succeeded(SimpleNamespace(duration_micros=1000))
+
+        self.assertEqual(timing.db_commands, 2)
+        self.assertAlmostEqual(timing.db, 2.0)
+
+    def test_timed_outside_request_is_noop(self):
+        with timed("auth"):
+            pass
+        self.assertIsNone(request_timing.get())
+
+    def test_middleware_header_and_route_aggregates(self):
+        app = FastAPI()
+        timer = CommandTimer()
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            with timed("auth"):
+                timer.succeeded(SimpleNamespace(duration_micros=2000))
+            timer.succeeded(SimpleNamespace(duration_micros=1000))
+            return {"id": item_id}
+
+        app.add_middleware(ServerTimingMiddleware, log_interval=3600)
+        client = TestClient(app)
+
+        for item_id in ("a", "b"):
+            resp = client.get("/items/{}".format(item_id))
+            self.assertEqual(resp.status_code, 200)
+            header = resp.headers["server-timing"]
+            self.assertIn('db;dur=3.0;desc="2 commands"', header)
+            self.assertIn("auth;dur=", header)
+            self.assertIn("total;dur=", header)
+        client.get("/missing")
+
+        middleware = app.middleware_stack
+        while not isinstance(middleware, ServerTimingMiddleware):
+            middleware = middleware.app
+        routes = middleware.routes._routes
+        self.assertEqual(routes["GET /items/{item_id}"][0], 2)
+        self.assertEqual(routes["GET /items/{item_id}"][3], 4)
+        self.assertEqual(routes["GET unmatched"][0], 1)
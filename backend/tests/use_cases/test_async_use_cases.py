@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+from mongoengine.connection import get_connection
+from mongomock_motor import AsyncMongoMockClient
+import mongomock
+from app.config import settings
+from app.infra.database import async_client
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.async_transaction_repository import AsyncTransactionRepository
+from app.infra.category.async_category_repository import AsyncCategoryRepository
+from app.infra.user.async_user_repository import AsyncUserRepository
+from app.infra.security.security_service import _get_current_user_async, create_access_token
+from app.use_cases.transaction.get import GetTransactionRequestObject, AsyncGetTransactionUseCase
+from app.use_cases.transaction.list import ListTransactionsRequestObject, AsyncListTransactionsUseCase
+from app.use_cases.category.list import ListCategoriesRequestObject, AsyncListCategoriesUseCase
+from app.use_cases.user.get import GetUserRequestObject, AsyncGetUserCase
+
+
+class TestAsyncUseCases(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(settings.MONGODB_DATABASE, host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="async@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Async food", type="spend", user=cls.user).save()
+        start = datetime(2023, 1, 1)
+        cls.transactions = [
+            TransactionModel(
+                date=start + timedelta(days=i // 2),
+                amount=i,
+                type="spend",
+                category=cls.category,
+                user=cls.user,
+            ).save()
+            for i in range(15)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        # the async client reads the same in-memory store as mongoengine
+        async_client.connect(AsyncMongoMockClient(mock_mongo_client=get_connection()))
+
+    def tearDown(self):
+        async_client.disconnect()
+
+    async def test_list_transactions_pages(self):
+        use_case = AsyncListTransactionsUseCase(
+            transaction_repository=AsyncTransactionRepository(), category_repository=AsyncCategoryRepository()
+        )
+        seen, cursor = [], None
+        while True:
+            req_object = ListTransactionsRequestObject.builder(current_user=self.user, limit=4, cursor=cursor)
+            response = await use_case.execute(request_object=req_object)
+            assert response
+            seen.extend(response.value.data)
+            cursor = response.value.pagination.next_cursor
+            if cursor is None:
+                break
+
+        assert len({t.id for t in seen}) == 15
+        assert all(t.category.name == "Async food" for t in seen)
+
+    async def test_get_and_not_found(self):
+        use_case = AsyncGetTransactionUseCase(transaction_repository=AsyncTransactionRepository())
+        transaction = self.transactions[0]
+        response = await use_case.execute(GetTransactionRequestObject.builder(transaction_id=str(transaction.id)))
+        assert response.value.id == str(transaction.id)
+        assert response.value.category.id == self.category.id
+
+        response = await use_case.execute(GetTransactionRequestObject.builder(transaction_id="000000000000000000000000"))
+        assert not response
+
+    async def test_categories_and_users(self):
+        use_case = AsyncListCategoriesUseCase(category_repository=AsyncCategoryRepository())
+        response = await use_case.execute(ListCategoriesRequestObject.builder(current_user=self.user))
+        assert [c.name for c in response.value] == ["Async food"]
+
+        use_case = AsyncGetUserCase(user_repository=AsyncUserRepository())
+        response = await use_case.execute(GetUserRequestObject.builder(user_id=str(self.user.id)))
+        assert response.value.email == "async@local.com"
+
+    async def test_current_user(self):
+        token = create_access_token(data={"sub": self.user.email, "id": str(self.user.id)})
+        user = await _get_current_user_async(token=token, user_repository=AsyncUserRepository())
+        assert user.id == self.user.id
+
+    async def test_many_requests_in_flight(self):
+        use_case = AsyncGetTransactionUseCase(transaction_repository=AsyncTransactionRepository())
+        ids = [str(t.id) for t in self.transactions]
+        responses = await asyncio.gather(
+            *[
+                use_case.execute(GetTransactionRequestObject.builder(transaction_id=ids[i % len(ids)]))
+                for i in range(2000)
+            ]
+        )
+        assert all(responses)
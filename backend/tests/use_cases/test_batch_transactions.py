@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from bson import ObjectId
+from mongoengine import connect, disconnect
+import mongomock
+from app.domain.transaction.entity import TransactionBatchOperation
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.database.models.monthly_rollup import MonthlyRollup as MonthlyRollupModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+from app.use_cases.transaction.batch import BatchTransactionsRequestObject, BatchTransactionsUseCase
+
+
+class TestBatchTransactions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="batch@local.com", status="active", role="user").save()
+        cls.other = UserModel(email="other@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Transport", type="spend", user=cls.user).save()
+        cls.use_case = BatchTransactionsUseCase(
+            transaction_repository=TransactionRepository(),
+            category_repository=CategoryRepository(),
+            rollup_repository=RollupRepository(),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def _transaction(self, user, amount):
+        return TransactionModel(
+            date=datetime(2023, 2, 1), amount=amount, type="spend", category=self.category, user=user
+        ).save()
+
+    def test_mixed_operations(self):
+        to_update = self._transaction(self.user, 1)
+        to_delete = self._transaction(self.user, 2)
+        not_owned = self._transaction(self.other, 3)
+        operations = [
+            TransactionBatchOperation(
+                op="create",
+                data={"date": "2023-02-02", "amount": 5, "type": "spend", "category_id": str(self.category.id)},
+            ),
+            TransactionBatchOperation(op="update", id=str(to_update.id), data={"amount": 10}),
+            TransactionBatchOperation(op="delete", id=str(to_delete.id)),
+            TransactionBatchOperation(op="delete", id=str(not_owned.id)),
+            TransactionBatchOperation(op="create", data={"amount": 5, "category_id": str(ObjectId())}),
+        ]
+        req_object = BatchTransactionsRequestObject.builder(current_user=self.user, operations=operations)
+        results = self.use_case.execute(request_object=req_object).value
+
+        assert [result.success for result in results] == [True, True, True, False, False]
+        created = TransactionModel.objects(id=results[0].id).get()
+        assert created.amount == 5 and created.user.id == self.user.id
+        to_update.reload()
+        assert to_update.amount == 10
+        assert TransactionModel.objects(id=to_delete.id).count() == 0
+        assert TransactionModel.objects(id=not_owned.id).count() == 1
+
+    def test_repeated_id_after_delete(self):
+        transaction = self._transaction(self.user, 5)
+        self.use_case.rollup_repository.apply([(transaction.to_mongo(), 1)])
+        rollups = MonthlyRollupModel._get_collection()
+        key = {"user": self.user.id, "year": 2023, "month": 2, "category": self.category.id, "type": "spend"}
+        before = rollups.find_one(key)
+        operations = [
+            TransactionBatchOperation(op="delete", id=str(transaction.id)),
+            TransactionBatchOperation(op="delete", id=str(transaction.id)),
+            TransactionBatchOperation(op="update", id=str(transaction.id), data={"amount": 2}),
+        ]
+        req_object = BatchTransactionsRequestObject.builder(current_user=self.user, operations=operations)
+        results = self.use_case.execute(request_object=req_object).value
+
+        assert [result.success for result in results] == [True, False, False]
+        assert results[1].message == results[2].message == "Transaction does not exist"
+        assert TransactionModel.objects(id=transaction.id).count() == 0
+        after = rollups.find_one(key)
+        assert after["amount"] == before["amount"] - 5
+        assert after["count"] == before["count"] - 1
+
+    def test_concurrent_delete_not_counted(self):
+        transaction = self._transaction(self.user, 7)
+        self.use_case.rollup_repository.rebuild(user=self.user.id)
+        operations = [TransactionBatchOperation(op="update", id=str(transaction.id), data={"amount": 8})]
+        # deleted by another request between the ownership check and the write
+        find_owned = self.use_case.transaction_repository.find_owned
+
+        def find_then_delete(user, ids):
+            owned = find_owned(user=user, ids=ids)
+            TransactionModel._get_collection().delete_one({"_id": transaction.id})
+            return owned
+
+        req_object = BatchTransactionsRequestObject.builder(current_user=self.user, operations=operations)
+        with patch.object(self.use_case.transaction_repository, "find_owned", side_effect=find_then_delete):
+            results = self.use_case.execute(request_object=req_object).value
+
+        assert not results[0].success
+        amounts = [doc["amount"] for doc in MonthlyRollupModel._get_collection().find({"user": self.user.id})]
+        assert sum(amounts) == sum(t.amount for t in TransactionModel.objects(user=self.user.id))
+
+    def test_empty_batch(self):
+        assert not BatchTransactionsRequestObject.builder(current_user=self.user, operations=[])
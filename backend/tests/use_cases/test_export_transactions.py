@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+import unittest
+from bson import ObjectId
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+import mongomock
+from app.domain.shared.enum import ExportFormat
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.use_cases.transaction.export import ExportTransactionsRequestObject, ExportTransactionsUseCase
+
+
+class TestExportTransactions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="export@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Salary", type="income", user=cls.user).save()
+        for i in range(10):
+            TransactionModel(
+                date=datetime(2023, 1, 1) + timedelta(days=i),
+                amount=i,
+                note=f"note, {i}",
+                type="income",
+                category=cls.category,
+                user=cls.user,
+            ).save()
+        cls.use_case = ExportTransactionsUseCase(
+            transaction_repository=TransactionRepository(), category_repository=CategoryRepository()
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_iter_batches_is_bounded(self):
+        batches = list(TransactionRepository().iter_batches(user=self.user.id, batch_size=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        dates = [row.date for batch in batches for row in batch]
+        assert dates == sorted(dates)
+
+    def test_ndjson(self):
+        req_object = ExportTransactionsRequestObject.builder(current_user=self.user, format=ExportFormat.NDJSON)
+        body = b"".join(self.use_case.execute(request_object=req_object).value)
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        assert len(rows) == 10
+        assert rows[0]["category"] == "Salary"
+
+    def test_csv(self):
+        req_object = ExportTransactionsRequestObject.builder(current_user=self.user, format=ExportFormat.CSV)
+        body = b"".join(self.use_case.execute(request_object=req_object).value)
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert len(rows) == 10
+        assert rows[3]["note"] == "note, 3"
+
+    def test_category_filter(self):
+        req_object = ExportTransactionsRequestObject.builder(current_user=self.user, category_id=str(self.category.id))
+        body = b"".join(self.use_case.execute(request_object=req_object).value)
+        assert len(body.decode().splitlines()) == 10
+
+    def test_unknown_or_foreign_category(self):
+        other = UserModel(email="export-other@local.com", status="active", role="user").save()
+        foreign = CategoryModel(name="Export foreign", type="income", user=other).save()
+        for category_id in (str(ObjectId()), "not-an-id", str(foreign.id)):
+            req_object = ExportTransactionsRequestObject.builder(current_user=self.user, category_id=category_id)
+            response = self.use_case.execute(request_object=req_object)
+            assert not response
+            assert response.message == "Category does not exist"
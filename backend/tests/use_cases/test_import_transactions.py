@@ -0,0 +1,91 @@
+import io
+import unittest
+from unittest.mock import patch
+from mongoengine import connect, disconnect
+import mongomock
+from app.config import settings
+from app.domain.shared.enum import StatementFormat
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+from app.use_cases.transaction.bulk_import import ImportTransactionsRequestObject, ImportTransactionsUseCase
+
+CSV_STATEMENT = """date,amount,type,category,note
+2023-01-01,12.5,spend,Food,lunch
+2023-01-02,-3,,food,coffee
+2023-01-03,abc,spend,Food,broken amount
+2023-01-04,1000,income,Salary,unknown category
+2023-01-05,7,spend,Food,dinner
+"""
+
+OFX_STATEMENT = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20230110120000[+7:ICT]
+<TRNAMT>-50.00
+<NAME>Grocery store
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20230111
+<TRNAMT>20.00
+<MEMO>Refund
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+class TestImportTransactions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="import@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Food", type="spend", user=cls.user).save()
+        cls.use_case = ImportTransactionsUseCase(
+            transaction_repository=TransactionRepository(),
+            category_repository=CategoryRepository(),
+            rollup_repository=RollupRepository(),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        TransactionModel.objects(user=self.user).delete()
+
+    def test_csv_import_with_row_errors(self):
+        req_object = ImportTransactionsRequestObject.builder(
+            current_user=self.user, stream=io.StringIO(CSV_STATEMENT), filename="statement.csv"
+        )
+        with patch.object(settings, "TRANSACTION_IMPORT_CHUNK_SIZE", 2):
+            result = self.use_case.execute(request_object=req_object).value
+
+        assert result.inserted == 3
+        assert [error.row for error in result.errors] == [3, 4]
+        coffee = TransactionModel.objects(note="coffee").get()
+        assert coffee.amount == 3 and coffee.type == "spend"
+
+    def test_ofx_import_uses_default_category(self):
+        req_object = ImportTransactionsRequestObject.builder(
+            current_user=self.user,
+            stream=io.StringIO(OFX_STATEMENT),
+            format=StatementFormat.OFX,
+            category_id=str(self.category.id),
+        )
+        result = self.use_case.execute(request_object=req_object).value
+
+        assert result.inserted == 2
+        assert result.errors == []
+        assert {t.type for t in TransactionModel.objects(user=self.user)} == {"spend", "income"}
+
+    def test_unknown_format(self):
+        req_object = ImportTransactionsRequestObject.builder(
+            current_user=self.user, stream=io.StringIO(""), filename="statement.pdf"
+        )
+        assert not req_object
@@ -0,0 +1,70 @@
+import unittest
+from datetime import datetime, timedelta
+from mongoengine import connect, disconnect
+import mongomock
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.category.category_repository import CategoryRepository
+from app.use_cases.transaction.list import ListTransactionsRequestObject, ListTransactionsUseCase
+
+
+class TestListTransactions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="list@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Food", type="spend", user=cls.user).save()
+        start = datetime(2023, 1, 1)
+        for i in range(25):
+            # two rows per day to exercise the _id tie breaker
+            TransactionModel(
+                date=start + timedelta(days=i // 2),
+                amount=i,
+                type="spend",
+                category=cls.category,
+                user=cls.user,
+            ).save()
+        cls.use_case = ListTransactionsUseCase(
+            transaction_repository=TransactionRepository(), category_repository=CategoryRepository()
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_cursor_pagination(self):
+        seen, cursor = [], None
+        while True:
+            req_object = ListTransactionsRequestObject.builder(current_user=self.user, limit=10, cursor=cursor)
+            response = self.use_case.execute(request_object=req_object)
+            assert response
+            page = response.value
+            seen.extend(page.data)
+            cursor = page.pagination.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 25
+        assert len({t.id for t in seen}) == 25
+        keys = [(t.date, t.id) for t in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_invalid_cursor(self):
+        req_object = ListTransactionsRequestObject.builder(current_user=self.user, limit=10, cursor="not-a-cursor")
+        assert not req_object
+
+    def test_without_limit_returns_all(self):
+        req_object = ListTransactionsRequestObject.builder(current_user=self.user)
+        response = self.use_case.execute(request_object=req_object)
+        assert len(response.value) == 25
+
+    def test_category_is_embedded(self):
+        req_object = ListTransactionsRequestObject.builder(current_user=self.user, limit=5)
+        response = self.use_case.execute(request_object=req_object)
+        for transaction in response.value.data:
+            assert transaction.category.id == self.category.id
+            assert transaction.category.name == "Food"
+            assert transaction.category.type == "spend"
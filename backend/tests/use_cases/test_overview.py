@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from mongoengine import connect, disconnect
+import mongomock
+from app.shared import response_object as res
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.use_cases.overview.amount_by_category import AmountByCategoryRequestObject, AmountByCategoryUseCase
+from app.use_cases.overview.amount_by_type import AmountByTypeRequestObject, AmountByTypeUseCase
+
+
+class TestOverview(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="overview@local.com", status="active", role="user").save()
+        cls.food = CategoryModel(name="Eating out", type="spend", user=cls.user).save()
+        cls.salary = CategoryModel(name="Wage", type="income", user=cls.user).save()
+        for date, amount, type, category in [
+            (datetime(2023, 1, 1), 10, "spend", cls.food),
+            (datetime(2023, 1, 2), 15, "spend", cls.food),
+            (datetime(2023, 1, 3), 1000, "income", cls.salary),
+            # outside of the requested range
+            (datetime(2023, 2, 9), 99, "spend", cls.food),
+        ]:
+            TransactionModel(date=date, amount=amount, type=type, category=category, user=cls.user).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def test_amount_by_category(self):
+        req_object = AmountByCategoryRequestObject.builder(
+            current_user=self.user, date_from="2023-01-01", date_to="2023-01-31"
+        )
+        result = AmountByCategoryUseCase(transaction_repository=TransactionRepository()).execute(req_object).value
+        assert [(r.category.name, r.amount, r.count) for r in result] == [("Wage", 1000, 1), ("Eating out", 25, 2)]
+
+    def test_amount_by_type(self):
+        req_object = AmountByTypeRequestObject.builder(
+            current_user=self.user, date_from="2023-01-01", date_to="2023-01-31"
+        )
+        result = AmountByTypeUseCase(transaction_repository=TransactionRepository()).execute(req_object).value
+        assert {r.type.value: r.amount for r in result} == {"spend": 25, "income": 1000, "save": 0}
+
+    def test_half_open_range_is_invalid(self):
+        assert not AmountByTypeRequestObject.builder(current_user=self.user, date_from="2023-01-01")
+
+    def test_invalid_dates_are_rejected(self):
+        for date_from, date_to in [("2023-13-01", "2023-12-31"), ("yesterday", "2023-01-31"), ("2023-02-01", "2023-01-01")]:
+            for request_cls in (AmountByTypeRequestObject, AmountByCategoryRequestObject):
+                req_object = request_cls.builder(current_user=self.user, date_from=date_from, date_to=date_to)
+                assert not req_object
+                assert req_object.errors[0]["parameter"] == "date_from"
+
+    def test_database_error_is_a_system_error(self):
+        req_object = AmountByTypeRequestObject.builder(current_user=self.user)
+        with patch.object(TransactionModel, "_get_collection", side_effect=RuntimeError("connection reset")):
+            response = AmountByTypeUseCase(transaction_repository=TransactionRepository()).execute(req_object)
+        assert not response
+        assert response.type == res.ResponseFailure.SYSTEM_ERROR
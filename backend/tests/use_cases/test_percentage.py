@@ -0,0 +1,66 @@
+import unittest
+from datetime import date, datetime
+from mongoengine import connect, disconnect
+import mongomock
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.rollup.rollup_repository import RollupRepository, closed_month_cache
+from app.use_cases.overview.percentage.last_month import LastMonthPercentageRequestObject, LastMonthPercentageUseCase
+from app.use_cases.overview.percentage.this_year import ThisYearPercentageRequestObject, ThisYearPercentageUseCase
+
+
+class TestPercentage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="percentage@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Misc", type="spend", user=cls.user).save()
+        cls.repository = RollupRepository()
+        cls.repository.apply(
+            ({"user": cls.user.id, "category": cls.category.id, "date": d, "type": t, "amount": a}, 1)
+            for d, t, a in [
+                (datetime(2023, 1, 5), "income", 1000),
+                (datetime(2023, 1, 6), "spend", 400),
+                (datetime(2023, 2, 5), "income", 1000),
+                (datetime(2023, 2, 6), "spend", 500),
+                (datetime(2023, 2, 7), "save", 200),
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def _last_month(self):
+        req_object = LastMonthPercentageRequestObject.builder(current_user=self.user, today=date(2023, 3, 15))
+        return LastMonthPercentageUseCase(rollup_repository=self.repository).execute(req_object).value
+
+    def test_last_month(self):
+        result = self._last_month()
+        assert (result.date_from, result.date_to) == (date(2023, 2, 1), date(2023, 2, 28))
+        assert result.current.spend == 500 and result.previous.spend == 400
+        assert result.spend_ratio == 50
+        assert result.save_ratio == 20
+        assert result.spend_change == 25
+        assert result.income_change == 0
+        assert result.save_change is None
+
+    def test_closed_months_are_cached_and_invalidated(self):
+        self._last_month()
+        assert closed_month_cache.get((self.user.id, 2023, 2)) == {"income": 1000, "spend": 500, "save": 200}
+
+        # a backdated transaction drops the cached month
+        backdated = {"user": self.user.id, "category": self.category.id, "date": datetime(2023, 2, 1),
+                     "type": "spend", "amount": 100}
+        self.repository.apply([(backdated, 1)])
+        assert closed_month_cache.get((self.user.id, 2023, 2)) is None
+        assert self._last_month().current.spend == 600
+        self.repository.apply([(backdated, -1)])
+
+    def test_this_year(self):
+        req_object = ThisYearPercentageRequestObject.builder(current_user=self.user, today=date(2023, 6, 1))
+        result = ThisYearPercentageUseCase(rollup_repository=self.repository).execute(req_object).value
+        assert result.current.income == 2000
+        assert result.previous.income == 0
+        assert result.income_change is None
@@ -0,0 +1,81 @@
+import unittest
+from datetime import date, datetime
+from mongoengine import connect, disconnect
+import mongomock
+from app.domain.shared.enum import Period
+from app.infra.database.models.user import User as UserModel
+from app.infra.database.models.category import Category as CategoryModel
+from app.infra.database.models.transaction import Transaction as TransactionModel
+from app.infra.transaction.transaction_repository import TransactionRepository
+from app.infra.rollup.rollup_repository import RollupRepository
+from app.use_cases.overview.series import SeriesRequestObject, SeriesUseCase, bucket_count, buckets
+
+
+class TestSeries(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect("mongoenginetest", host="mongodb://localhost:1234", mongo_client_class=mongomock.MongoClient)
+        cls.user = UserModel(email="series@local.com", status="active", role="user").save()
+        cls.category = CategoryModel(name="Bills", type="spend", user=cls.user).save()
+        transactions = [
+            TransactionModel(date=d, amount=a, type="spend", category=cls.category, user=cls.user).save()
+            for d, a in [
+                (datetime(2023, 1, 2, 9), 10),
+                (datetime(2023, 1, 2, 18), 5),
+                (datetime(2023, 1, 10), 20),
+                (datetime(2023, 3, 1), 7),
+            ]
+        ]
+        cls.rollup_repository = RollupRepository()
+        cls.rollup_repository.apply((t.to_mongo(), 1) for t in transactions)
+        cls.use_case = SeriesUseCase(
+            transaction_repository=TransactionRepository(), rollup_repository=cls.rollup_repository
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def _series(self, period, date_from, date_to):
+        req_object = SeriesRequestObject.builder(
+            current_user=self.user, period=period, date_from=date_from, date_to=date_to
+        )
+        return [(point.date, point.amount) for point in self.use_case.execute(req_object).value]
+
+    def test_day(self):
+        series = self._series(Period.DAY, date(2023, 1, 1), date(2023, 1, 3))
+        assert series == [(date(2023, 1, 1), 0), (date(2023, 1, 2), 15), (date(2023, 1, 3), 0)]
+
+    def test_week_buckets_start_on_monday(self):
+        # iso week grouping runs on the server, mongomock does not implement $isoWeek
+        assert buckets(date(2023, 1, 1), date(2023, 1, 15), Period.WEEK) == [
+            date(2022, 12, 26),
+            date(2023, 1, 2),
+            date(2023, 1, 9),
+        ]
+
+    def test_bucket_count_matches_buckets(self):
+        for period in Period:
+            for date_from, date_to in [
+                (date(2023, 1, 1), date(2023, 1, 1)),
+                (date(2023, 1, 1), date(2023, 1, 15)),
+                (date(2022, 11, 30), date(2024, 2, 29)),
+            ]:
+                assert bucket_count(date_from, date_to, period) == len(buckets(date_from, date_to, period))
+
+    def test_too_many_points_rejected_without_building_buckets(self):
+        req_object = SeriesRequestObject.builder(
+            current_user=self.user, period=Period.DAY, date_from=date(1, 1, 1), date_to=date(9999, 12, 31)
+        )
+        assert not req_object
+        assert req_object.errors[0]["parameter"] == "period"
+
+    def test_month_from_rollups(self):
+        series = self._series(Period.MONTH, date(2023, 1, 1), date(2023, 3, 31))
+        assert series == [(date(2023, 1, 1), 35), (date(2023, 2, 1), 0), (date(2023, 3, 1), 7)]
+
+    def test_too_many_points(self):
+        assert not SeriesRequestObject.builder(
+            current_user=self.user, period=Period.DAY, date_from=date(2000, 1, 1), date_to=date(2023, 1, 1)
+        )